@@ -1,7 +1,15 @@
-from app.builder import get_app
-from app.core.config import get_app_settings
-from app.utils.logging_.config import configure_base_logging
-from app.utils.runners.main import run
+from app.utils.prometheus_ import prepare_multiprocess_dir
+
+
+if __name__ == '__main__':
+    # Before the metrics are imported with the app, and not in the workers,
+    # which import this module again.
+    prepare_multiprocess_dir()
+
+from app.builder import get_app  # noqa: E402
+from app.core.config import get_app_settings  # noqa: E402
+from app.utils.logging_.config import configure_base_logging  # noqa: E402
+from app.utils.runners.main import run  # noqa: E402
 
 
 configure_base_logging()
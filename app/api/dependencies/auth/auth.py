@@ -14,15 +14,21 @@ from starlette.status import (
 )
 
 from .security import PatchedHTTPBearer
+from ..markers import (
+    JWTBlacklistServiceMarker,
+    JWTClaimsCacheMarker,
+    JWTServiceMarker
+)
 from ....dtos.jwt_ import JWTUserClaims
 from ....resources.strings.auth import (
     ACCESS_TOKEN_EXPIRED,
-    ACCESS_TOKEN_IS_IN_BLACKLIST,
     ACCESS_TOKEN_IS_INVALID,
+    ACCESS_TOKEN_IS_REVOKED,
     CURRENT_USER_IS_NOT_SUPERUSER
 )
 from ....services.jwt_ import (
     JWTBlacklistService,
+    JWTClaimsCache,
     JWTService
 )
 
@@ -43,29 +49,33 @@ def _get_access_token(
 
 
 async def get_current_user(
-    jwt_service: JWTService = Depends(),
-    blacklist_service: JWTBlacklistService = Depends(),
+    jwt_service: JWTService = Depends(JWTServiceMarker),
+    claims_cache: JWTClaimsCache = Depends(JWTClaimsCacheMarker),
+    blacklist_service: JWTBlacklistService = Depends(
+        JWTBlacklistServiceMarker
+    ),
     access_token: str = Depends(_get_access_token)
 ) -> JWTUserClaims:
-    try:
-        claims = jwt_service.verify(access_token)
-    except ExpiredSignatureError:
-        raise HTTPException(
-            HTTP_401_UNAUTHORIZED,
-            ACCESS_TOKEN_EXPIRED
-        )
-    except PyJWTError:
-        raise HTTPException(
-            HTTP_401_UNAUTHORIZED,
-            ACCESS_TOKEN_IS_INVALID
-        )
-    else:
-        if await blacklist_service.check_is_blacklisted(claims.meta.jti):
+    if (claims := claims_cache.get(access_token)) is None:
+        try:
+            claims = jwt_service.verify(access_token)
+        except ExpiredSignatureError:
             raise HTTPException(
                 HTTP_401_UNAUTHORIZED,
-                ACCESS_TOKEN_IS_IN_BLACKLIST
+                ACCESS_TOKEN_EXPIRED
             )
-        return claims.user
+        except PyJWTError:
+            raise HTTPException(
+                HTTP_401_UNAUTHORIZED,
+                ACCESS_TOKEN_IS_INVALID
+            )
+        claims_cache.set(access_token, claims)
+    if await blacklist_service.check_is_revoked(claims):
+        raise HTTPException(
+            HTTP_401_UNAUTHORIZED,
+            ACCESS_TOKEN_IS_REVOKED
+        )
+    return claims.user
 
 
 def get_current_superuser(
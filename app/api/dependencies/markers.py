@@ -1,22 +1,73 @@
-class AppSettingsMarker:
+__all__ = [
+    'BaseMarker',
+    'AppSettingsMarker',
+    'DBSessionInTransactionMarker',
+    'RedisMarker',
+    'RedisClientCacheMarker',
+    'MailSenderMarker',
+    'OAuthMarker',
+    'PasswordCryptContextMarker',
+    'JWTClaimsCacheMarker',
+    'LocalJWTBlacklistMarker',
+    'JWTServiceMarker',
+    'JWTBlacklistServiceMarker'
+]
+
+
+class BaseMarker:
+    """
+    Markers are replaced through `dependency_overrides`
+    and never instantiated.
+
+    FastAPI inspects them whenever it rebuilds a dependant
+    (on every request with overrides set),
+    and the explicit constructor spares parsing
+    the text signature of `object.__init__` each time.
+    """
+
+    def __init__(self) -> None:
+        pass
+
+
+class AppSettingsMarker(BaseMarker):
     """ Dependency marker to get the app settings. """
 
 
-class DBSessionInTransactionMarker:
+class DBSessionInTransactionMarker(BaseMarker):
     """ Dependency marker to get the DB session in transaction. """
 
 
-class RedisMarker:
+class RedisMarker(BaseMarker):
     """ Dependency marker to get the Redis client. """
 
 
-class MailSenderMarker:
+class RedisClientCacheMarker(BaseMarker):
+    """ Dependency marker to get the Redis client-side cache. """
+
+
+class MailSenderMarker(BaseMarker):
     """ Dependency marker to get the mail sender. """
 
 
-class OAuthMarker:
-    """ Dependency marker to get the OAuth client. """
+class OAuthMarker(BaseMarker):
+    """ Dependency marker to get the OAuth clients by backend. """
 
 
-class PasswordCryptContextMarker:
+class PasswordCryptContextMarker(BaseMarker):
     """ Dependency marker to get the password crypt context. """
+
+
+class JWTClaimsCacheMarker(BaseMarker):
+    """ Dependency marker to get the verified JWT claims cache. """
+
+
+class LocalJWTBlacklistMarker(BaseMarker):
+    """ Dependency marker to get the worker-local JWT blacklist. """
+
+
+class JWTServiceMarker(BaseMarker):
+    """ Dependency marker to get the JWT service. """
+
+
+class JWTBlacklistServiceMarker(BaseMarker):
+    """ Dependency marker to get the JWT blacklist service. """
@@ -1,4 +1,12 @@
+from .pagination import (
+    LimitQuery,
+    OffsetQuery
+)
 from .verification import VerificationCodeQuery
 
 
-__all__ = ['VerificationCodeQuery']
+__all__ = [
+    'LimitQuery',
+    'OffsetQuery',
+    'VerificationCodeQuery'
+]
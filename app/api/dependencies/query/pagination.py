@@ -0,0 +1,18 @@
+from fastapi import Query
+
+
+__all__ = [
+    'LimitQuery',
+    'OffsetQuery'
+]
+
+
+LimitQuery = Query(
+    20,
+    gt=0,
+    le=100
+)
+OffsetQuery = Query(
+    0,
+    ge=0
+)
@@ -0,0 +1,27 @@
+from dataclasses import dataclass
+from typing import (
+    Generic,
+    TypeVar
+)
+
+
+__all__ = ['Singleton']
+
+
+T = TypeVar('T')
+
+
+@dataclass(frozen=True)
+class Singleton(Generic[T]):
+    """
+    Resolves a dependency marker to an app-scoped instance.
+
+    Being a coroutine with no parameters,
+    it is awaited in place instead of being sent to the threadpool
+    and adds no sub-dependencies to solve on every request.
+    """
+
+    instance: T
+
+    async def __call__(self) -> T:
+        return self.instance
@@ -0,0 +1,10 @@
+from .compression import CompressionMiddleware
+from .metrics import MetricsMiddleware
+from .session import RedisSessionMiddleware
+
+
+__all__ = [
+    'CompressionMiddleware',
+    'MetricsMiddleware',
+    'RedisSessionMiddleware'
+]
@@ -0,0 +1,209 @@
+import zlib
+from collections.abc import Iterable
+from typing import (
+    Protocol,
+    cast
+)
+
+import brotli
+from starlette.datastructures import (
+    Headers,
+    MutableHeaders
+)
+from starlette.types import (
+    ASGIApp,
+    Message,
+    Receive,
+    Scope,
+    Send
+)
+
+
+__all__ = ['CompressionMiddleware']
+
+ENCODINGS = ('br', 'gzip')
+""" Supported encodings, the preferred first. """
+
+
+class Compressor(Protocol):
+    def compress(self, data: bytes) -> bytes:
+        """ Compress a chunk, flushing the output so far. """
+
+    def finish(self) -> bytes:
+        """ Return the rest of the output. """
+
+
+class GZipCompressor:
+    def __init__(self, level: int) -> None:
+        self._compressor = zlib.compressobj(
+            level,
+            zlib.DEFLATED,
+            16 + zlib.MAX_WBITS
+        )
+
+    def compress(self, data: bytes) -> bytes:
+        return (
+            self._compressor.compress(data)
+            + self._compressor.flush(zlib.Z_SYNC_FLUSH)
+        )
+
+    def finish(self) -> bytes:
+        return self._compressor.flush()
+
+
+class BrotliCompressor:
+    def __init__(self, quality: int) -> None:
+        self._compressor = brotli.Compressor(quality=quality)
+
+    def compress(self, data: bytes) -> bytes:
+        return cast(
+            bytes,
+            self._compressor.process(data) + self._compressor.flush()
+        )
+
+    def finish(self) -> bytes:
+        return cast(bytes, self._compressor.finish())
+
+
+class CompressionMiddleware:
+    """
+    Compresses the responses with brotli or gzip, as the client accepts.
+
+    Only the bodies of the listed media types, at least `minimum_size` long,
+    are compressed. Smaller ones, as auth results, would gain
+    less than the time spent on compression.
+    Streamed bodies are compressed chunk by chunk.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        minimum_size: int,
+        media_types: Iterable[str],
+        gzip_level: int,
+        brotli_quality: int
+    ) -> None:
+        self.app = app
+        self.minimum_size = minimum_size
+        self.media_types = frozenset(media_types)
+        self.gzip_level = gzip_level
+        self.brotli_quality = brotli_quality
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope['type'] != 'http':
+            await self.app(scope, receive, send)
+            return
+        encoding = self.choose_encoding(
+            Headers(scope=scope).get('accept-encoding', '')
+        )
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+        responder = CompressionResponder(self, encoding, send)
+        await self.app(scope, receive, responder.send)
+
+    @staticmethod
+    def choose_encoding(accept_encoding: str) -> str | None:
+        """
+        Choose the supported encoding of the highest quality.
+
+        `*` stands for the encodings not listed, and ties go
+        to the preferred one. Items of malformed quality are ignored.
+        """
+
+        qualities: dict[str, float] = {}
+        for item in accept_encoding.split(','):
+            coding, *params = item.split(';')
+            quality = 1.0
+            try:
+                for param in params:
+                    name, _, value = param.partition('=')
+                    if name.strip().lower() == 'q':
+                        quality = float(value)
+            except ValueError:
+                continue
+            qualities[coding.strip().lower()] = quality
+        default = qualities.get('*', 0.0)
+        encoding = max(
+            ENCODINGS,
+            key=lambda coding: qualities.get(coding, default)
+        )
+        if qualities.get(encoding, default) > 0:
+            return encoding
+        return None
+
+    def create_compressor(self, encoding: str) -> Compressor:
+        if encoding == 'br':
+            return BrotliCompressor(self.brotli_quality)
+        return GZipCompressor(self.gzip_level)
+
+
+class CompressionResponder:
+    def __init__(
+        self,
+        middleware: CompressionMiddleware,
+        encoding: str,
+        send: Send
+    ) -> None:
+        self.middleware = middleware
+        self.encoding = encoding
+        self._send = send
+        self._start_message: Message | None = None
+        self._compressor: Compressor | None = None
+
+    async def send(self, message: Message) -> None:
+        if message['type'] == 'http.response.start':
+            # Held until the first body chunk tells whether to compress.
+            self._start_message = message
+            return
+        if message['type'] != 'http.response.body':
+            await self._send(message)
+            return
+        if (start_message := self._start_message) is not None:
+            self._start_message = None
+            if self._should_compress(start_message, message):
+                self._compressor = self.middleware.create_compressor(
+                    self.encoding
+                )
+                message['body'] = self._compress(message)
+                self._set_headers(start_message, message)
+            await self._send(start_message)
+        elif self._compressor is not None:
+            message['body'] = self._compress(message)
+        await self._send(message)
+
+    def _should_compress(
+        self,
+        start_message: Message,
+        message: Message
+    ) -> bool:
+        headers = Headers(raw=start_message['headers'])
+        if 'content-encoding' in headers:
+            return False
+        media_type = headers.get('content-type', '').partition(';')[0]
+        if media_type.strip() not in self.middleware.media_types:
+            return False
+        return (
+            message.get('more_body', False)
+            or len(message.get('body', b'')) >= self.middleware.minimum_size
+        )
+
+    def _set_headers(self, start_message: Message, message: Message) -> None:
+        headers = MutableHeaders(raw=start_message['headers'])
+        headers['Content-Encoding'] = self.encoding
+        headers.add_vary_header('Accept-Encoding')
+        # A strong ETag stands for one coding only,
+        # while the weak one matches `If-None-Match` whatever the coding.
+        if (etag := headers.get('ETag')) is not None and not etag.startswith('W/'):
+            headers['ETag'] = f'W/{etag}'
+        if message.get('more_body', False):
+            del headers['Content-Length']
+        else:
+            headers['Content-Length'] = str(len(message['body']))
+
+    def _compress(self, message: Message) -> bytes:
+        assert self._compressor is not None
+        body = self._compressor.compress(message.get('body', b''))
+        if not message.get('more_body', False):
+            body += self._compressor.finish()
+        return body
@@ -0,0 +1,82 @@
+import time
+from collections.abc import Iterable
+from typing import Any
+
+from starlette.routing import (
+    BaseRoute,
+    Route,
+    WebSocketRoute
+)
+from starlette.types import (
+    ASGIApp,
+    Message,
+    Receive,
+    Scope,
+    Send
+)
+
+from ...services.metrics.metrics import (
+    HTTP_REQUEST_DURATION,
+    HTTP_REQUESTS_IN_FLIGHT
+)
+
+
+__all__ = ['MetricsMiddleware']
+
+UNMATCHED_ROUTE = '<unmatched>'
+
+
+class MetricsMiddleware:
+    """
+    Times the requests by the route template, not the path,
+    to keep the label values bounded.
+
+    The template is looked up by the endpoint the router has matched,
+    so the routes are not matched once more.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+        self._route_paths: dict[Any, str] = {}
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope['type'] != 'http':
+            await self.app(scope, receive, send)
+            return
+
+        status_code = 500
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code
+            if message['type'] == 'http.response.start':
+                status_code = message['status']
+            await send(message)
+
+        start = time.perf_counter()
+        try:
+            with HTTP_REQUESTS_IN_FLIGHT.track_inprogress():
+                await self.app(scope, receive, send_wrapper)
+        finally:
+            HTTP_REQUEST_DURATION.labels(
+                scope['method'],
+                self.get_route(scope),
+                str(status_code)
+            ).observe(time.perf_counter() - start)
+
+    def get_route(self, scope: Scope) -> str:
+        if (endpoint := scope.get('endpoint')) is None:
+            return UNMATCHED_ROUTE
+        if endpoint not in self._route_paths:
+            # Built on the first request, once all the routes are added.
+            self._route_paths = self._map_route_paths(scope['app'].router.routes)
+            # Unmapped ones, as mounted apps, are not looked up again.
+            self._route_paths.setdefault(endpoint, UNMATCHED_ROUTE)
+        return self._route_paths[endpoint]
+
+    @staticmethod
+    def _map_route_paths(routes: Iterable[BaseRoute]) -> dict[Any, str]:
+        route_paths: dict[Any, str] = {}
+        for route in routes:
+            if isinstance(route, (Route, WebSocketRoute)):
+                route_paths.setdefault(route.endpoint, route.path)
+        return route_paths
@@ -0,0 +1,131 @@
+import json
+import logging
+import secrets
+from collections.abc import Callable
+from typing import Any
+
+from starlette.datastructures import MutableHeaders
+from starlette.requests import HTTPConnection
+from starlette.types import (
+    ASGIApp,
+    Message,
+    Receive,
+    Scope,
+    Send
+)
+
+from ...services.redis_ import RedisClient
+
+
+__all__ = ['RedisSessionMiddleware']
+
+logger = logging.getLogger(__name__)
+
+SESSION_ID_BYTES = 32
+
+
+class RedisSessionMiddleware:
+    """
+    Server-side session kept in Redis for the routes under the path.
+
+    Unlike Starlette's `SessionMiddleware` the cookie holds
+    only a random session id, and the session is neither loaded
+    nor saved for the routes out of the path.
+    The Redis client is taken from the given provider on every request,
+    as it is created on startup, after the middleware.
+    """
+
+    key_pattern = 'session:{session_id}'
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        redis: Callable[[], RedisClient],
+        path: str,
+        max_age_in_seconds: int,
+        session_cookie: str = 'session',
+        same_site: str = 'lax',
+        https_only: bool = False
+    ) -> None:
+        self.app = app
+        self.redis = redis
+        self.path = path
+        self.max_age_in_seconds = max_age_in_seconds
+        self.session_cookie = session_cookie
+        self.security_flags = f'httponly; samesite={same_site}'
+        if https_only:
+            self.security_flags += '; secure'
+
+    @classmethod
+    def format_key(cls, session_id: str) -> str:
+        return cls.key_pattern.format(session_id=session_id)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if (
+            scope['type'] not in ('http', 'websocket')
+            or not self._is_in_path(scope['path'])
+        ):
+            await self.app(scope, receive, send)
+            return
+
+        redis = self.redis()
+        session_id = HTTPConnection(scope).cookies.get(self.session_cookie)
+        initial_data = None
+        if session_id is not None:
+            initial_data = await redis.get(self.format_key(session_id))
+        if initial_data is None:
+            scope['session'] = {}
+        else:
+            scope['session'] = json.loads(initial_data)
+
+        async def send_wrapper(message: Message) -> None:
+            if message['type'] == 'http.response.start':
+                await self._save(
+                    redis,
+                    session_id if initial_data is not None else None,
+                    scope['session'],
+                    initial_data,
+                    MutableHeaders(scope=message)
+                )
+            await send(message)
+
+        await self.app(scope, receive, send_wrapper)
+
+    def _is_in_path(self, path: str) -> bool:
+        return path == self.path or path.startswith(f'{self.path}/')
+
+    async def _save(
+        self,
+        redis: RedisClient,
+        session_id: str | None,
+        session: dict[str, Any],
+        initial_data: bytes | None,
+        headers: MutableHeaders
+    ) -> None:
+        if session:
+            data = json.dumps(session)
+            if initial_data is not None and data.encode() == initial_data:
+                return
+            # A new id for every new session prevents session fixation.
+            session_id = session_id or secrets.token_urlsafe(SESSION_ID_BYTES)
+            await redis.set(
+                self.format_key(session_id),
+                data,
+                ex=self.max_age_in_seconds
+            )
+            headers.append('Set-Cookie', self._format_cookie(
+                session_id,
+                f'Max-Age={self.max_age_in_seconds}'
+            ))
+        elif session_id is not None:
+            await redis.delete(self.format_key(session_id))
+            headers.append('Set-Cookie', self._format_cookie(
+                'null',
+                'expires=Thu, 01 Jan 1970 00:00:00 GMT'
+            ))
+
+    def _format_cookie(self, value: str, lifetime: str) -> str:
+        return (
+            f'{self.session_cookie}={value}; path={self.path}; '
+            f'{lifetime}; {self.security_flags}'
+        )
@@ -0,0 +1,37 @@
+from typing import Any
+
+import orjson
+from fastapi.responses import ORJSONResponse as BaseORJSONResponse
+from pydantic.json import pydantic_encoder
+from starlette.responses import Response
+from starlette.status import HTTP_304_NOT_MODIFIED
+
+
+__all__ = [
+    'SerializedJSON',
+    'ORJSONResponse',
+    'NotModifiedResponse'
+]
+
+
+class SerializedJSON(bytes):
+    """ JSON serialized in advance, rendered as is. """
+
+
+class ORJSONResponse(BaseORJSONResponse):
+    """ Encodes with orjson the types pydantic encodes, as models do. """
+
+    def render(self, content: Any) -> bytes:
+        if isinstance(content, SerializedJSON):
+            return content
+        return orjson.dumps(content, default=pydantic_encoder)
+
+
+class NotModifiedResponse(Response):
+    """ Answers a conditional GET whose `If-None-Match` holds the current ETag. """
+
+    def __init__(self, etag: str) -> None:
+        super().__init__(
+            status_code=HTTP_304_NOT_MODIFIED,
+            headers={'ETag': etag}
+        )
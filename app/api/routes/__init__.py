@@ -1,6 +1,7 @@
 from fastapi import APIRouter
 
 from .auth import router as auth_router
+from .metrics import router as metrics_router
 from .oauth import router as oauth_router
 from .verification import router as verification_router
 
@@ -25,3 +26,6 @@ router.include_router(
     tags=['OAuth'],
     prefix='/oauth'
 )
+router.include_router(
+    router=metrics_router
+)
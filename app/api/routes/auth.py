@@ -10,12 +10,24 @@ from fastapi import (
 from starlette.status import (
     HTTP_200_OK,
     HTTP_400_BAD_REQUEST,
-    HTTP_401_UNAUTHORIZED
+    HTTP_401_UNAUTHORIZED,
+    HTTP_429_TOO_MANY_REQUESTS
 )
 
-from ..dependencies.query.verification import VerificationCodeQuery
+from ..dependencies.auth import CurrentUserMarker
+from ..dependencies.query import (
+    LimitQuery,
+    OffsetQuery,
+    VerificationCodeQuery
+)
+from ..routing import ORJSONRoute
+from ...db.models import RefreshSession
+from ...dtos.jwt_ import JWTUserClaims
 from ...resources.strings.verification import ACTION_REQUIRES_VERIFICATION
-from ...schemas.auth import AuthResult
+from ...schemas.auth import (
+    AuthResult,
+    RefreshSessionInResponse
+)
 from ...schemas.fastapi_ import HTTPExceptionSchema
 from ...schemas.user import (
     UserInCreate,
@@ -28,6 +40,7 @@ from ...services.auth import (
 from ...services.auth.cookie import REFRESH_TOKEN_COOKIE_KEY
 from ...services.auth.errors import (
     LoginError,
+    LoginIsThrottledError,
     LogoutError,
     RefreshError,
     RefreshSessionDoesNotExistError,
@@ -46,7 +59,7 @@ __all__ = ['router']
 
 logger = logging.getLogger(__name__)
 
-router = APIRouter()
+router = APIRouter(route_class=ORJSONRoute)
 
 
 @router.post(
@@ -98,8 +111,7 @@ async def register(
             error.detail
         )
     else:
-        await verification_service.delete(payload.email)
-        mail_service.send_thank_for_registering(auth_result.user)
+        await mail_service.send_thank_for_registering(auth_result.user)
         return auth_result
 
 
@@ -119,6 +131,10 @@ async def register(
         HTTP_401_UNAUTHORIZED: {
             'model': HTTPExceptionSchema,
             'description': LoginError.detail
+        },
+        HTTP_429_TOO_MANY_REQUESTS: {
+            'model': HTTPExceptionSchema,
+            'description': LoginIsThrottledError.detail
         }
     }
 )
@@ -128,6 +144,11 @@ async def login(
 ) -> AuthResult:
     try:
         result = await auth_service.login(user_in_login)
+    except LoginIsThrottledError as error:
+        raise HTTPException(
+            HTTP_429_TOO_MANY_REQUESTS,
+            error.detail
+        )
     except LoginError as error:
         raise HTTPException(
             HTTP_401_UNAUTHORIZED,
@@ -174,6 +195,30 @@ async def logout(
         )
 
 
+@router.get(
+    path='/logout/all',
+    name='auth:logout_all',
+    summary='Logout the user from every session.',
+    responses={
+        HTTP_200_OK: {
+            'model': None,
+            'description': (
+                'Every access token of the user has been revoked '
+                'and every refresh session has been deleted.'
+            ),
+            'headers': {
+                'Set-Cookie': UnsetRefreshTokenCookieAsOpenAPIHeader
+            }
+        }
+    }
+)
+async def logout_all(
+    user: JWTUserClaims = Depends(CurrentUserMarker),
+    authenticator: Authenticator = Depends()
+) -> None:
+    await authenticator.deauthenticate_everywhere(user.id)
+
+
 @router.get(
     path='/refresh',
     name='auth:refresh',
@@ -212,3 +257,28 @@ async def refresh(
         )
     else:
         return result
+
+
+@router.get(
+    path='/sessions',
+    name='auth:sessions',
+    summary='Get the user`s active sessions.',
+    response_model=list[RefreshSessionInResponse],
+    responses={
+        HTTP_200_OK: {
+            'model': list[RefreshSessionInResponse],
+            'description': 'Active sessions, the most recent first.'
+        }
+    }
+)
+async def get_sessions(
+    limit: int = LimitQuery,
+    offset: int = OffsetQuery,
+    user: JWTUserClaims = Depends(CurrentUserMarker),
+    auth_service: AuthService = Depends()
+) -> list[RefreshSession]:
+    return await auth_service.get_sessions(
+        user.id,
+        limit=limit,
+        offset=offset
+    )
@@ -0,0 +1,27 @@
+from fastapi import (
+    APIRouter,
+    Response
+)
+from prometheus_client import CONTENT_TYPE_LATEST
+
+from ...services.metrics import render_metrics
+
+
+__all__ = ['router']
+
+
+router = APIRouter()
+
+
+@router.get(
+    '/metrics',
+    name='metrics:get',
+    include_in_schema=False
+)
+def get_metrics() -> Response:
+    # Sync: the multi-process values are read from files.
+    # The header is set as is, since Starlette would add one more charset.
+    return Response(
+        render_metrics(),
+        headers={'Content-Type': CONTENT_TYPE_LATEST}
+    )
@@ -1,9 +1,6 @@
 import logging
 
-from authlib.integrations.starlette_client import (
-    OAuth,
-    OAuthError
-)
+from authlib.integrations.starlette_client import OAuthError
 from fastapi import (
     APIRouter,
     Depends,
@@ -20,12 +17,13 @@ from starlette.status import (
     HTTP_300_MULTIPLE_CHOICES,
     HTTP_302_FOUND,
     HTTP_400_BAD_REQUEST,
-    HTTP_401_UNAUTHORIZED
+    HTTP_401_UNAUTHORIZED,
+    HTTP_429_TOO_MANY_REQUESTS
 )
 
 from ..dependencies.markers import OAuthMarker
+from ..routing import ORJSONRoute
 from ...db.enums import OAuthBackend
-from ...db.repos import UsersRepo
 from ...schemas.auth import AuthResult
 from ...schemas.fastapi_ import HTTPExceptionSchema
 from ...schemas.user import (
@@ -35,11 +33,13 @@ from ...schemas.user import (
 from ...services.auth import AuthService
 from ...services.auth.errors import (
     LoginError,
+    LoginIsThrottledError,
     RegistrationError
 )
 from ...services.mail import MailService
 from ...services.oauth import (
     OAuthAuthorizer,
+    OAuthClients,
     OAuthRequestSession,
     OAuthService
 )
@@ -55,7 +55,7 @@ __all__ = ['router']
 
 logger = logging.getLogger(__name__)
 
-router = APIRouter()
+router = APIRouter(route_class=ORJSONRoute)
 
 
 @router.get(
@@ -69,9 +69,9 @@ router = APIRouter()
 async def redirect(
     request: Request,
     backend: OAuthBackend = Path(...),
-    oauth: OAuth = Depends(OAuthMarker)
+    oauth_clients: OAuthClients = Depends(OAuthMarker)
 ) -> RedirectResponse:
-    client = oauth.create_client(backend)
+    client = oauth_clients[backend]
     return await client.authorize_redirect(  # type: ignore[no-any-return]
         request=request,
         redirect_uri=request.url_for('oauth:callback', backend=backend.value)
@@ -118,7 +118,6 @@ async def redirect(
 )
 async def callback(
     backend: OAuthBackend = Path(...),
-    users_repo: UsersRepo = Depends(),
     authorizer: OAuthAuthorizer = Depends(),
     oauth_service: OAuthService = Depends(),
     oauth_request_session: OAuthRequestSession = Depends()
@@ -135,11 +134,8 @@ async def callback(
         try:
             auth_result = await oauth_service.login(oauth_user)
         except OAuthConnectionDoesNotExistError:
-            oauth_user.is_email_taken = is_email_taken = (
-                await users_repo.check_email_is_taken(oauth_user.email)
-            )
             oauth_request_session.record(oauth_user)
-            if is_email_taken:
+            if oauth_user.is_email_taken:
                 return JSONResponse(
                     oauth_user.email,
                     HTTP_401_UNAUTHORIZED
@@ -175,6 +171,10 @@ async def callback(
         HTTP_401_UNAUTHORIZED: {
             'model': HTTPExceptionSchema,
             'description': LoginError.detail
+        },
+        HTTP_429_TOO_MANY_REQUESTS: {
+            'model': HTTPExceptionSchema,
+            'description': LoginIsThrottledError.detail
         }
     }
 )
@@ -201,6 +201,11 @@ async def link(
         )
     try:
         auth_result = await auth_service.login(user_in_login)
+    except LoginIsThrottledError as error:
+        raise HTTPException(
+            HTTP_429_TOO_MANY_REQUESTS,
+            error.detail
+        )
     except LoginError as error:
         raise HTTPException(
             HTTP_401_UNAUTHORIZED,
@@ -259,5 +264,5 @@ async def register(
         )
     else:
         oauth_request_session.delete()
-        mail_service.send_thank_for_registering(auth_result.user)
+        await mail_service.send_thank_for_registering(auth_result.user)
         return auth_result
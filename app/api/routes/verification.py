@@ -6,6 +6,7 @@ from fastapi import (
 )
 from starlette.status import HTTP_200_OK
 
+from ..routing import ORJSONRoute
 from ...schemas.verification import VerificationInCreate
 from ...services.mail import MailService
 from ...services.verification import VerificationService
@@ -15,7 +16,7 @@ __all__ = ['router']
 
 logger = logging.getLogger(__name__)
 
-router = APIRouter()
+router = APIRouter(route_class=ORJSONRoute)
 
 
 @router.post(
@@ -30,6 +31,12 @@ async def send(
     verification_service: VerificationService = Depends(),
     mail_service: MailService = Depends()
 ) -> None:
-    """ `Mail: verification.` """
-    code = await verification_service.get(payload.email)
-    mail_service.send_verification(payload, code)
+    """
+    `Mail: verification.`
+
+    Repeated requests for the same email within the cooldown
+    do not send the mail again.
+    """
+    code = await verification_service.get_to_send(payload.email)
+    if code is not None:
+        await mail_service.send_verification(payload, code)
@@ -0,0 +1,126 @@
+import asyncio
+from collections.abc import (
+    Callable,
+    Coroutine
+)
+from copy import copy
+from functools import wraps
+from typing import (
+    Any,
+    cast
+)
+
+import orjson
+from fastapi.datastructures import DefaultPlaceholder
+from fastapi.routing import (
+    APIRoute,
+    get_request_handler
+)
+from pydantic import BaseModel
+from pydantic.json import pydantic_encoder
+from starlette.requests import Request
+from starlette.responses import Response
+from starlette.status import HTTP_200_OK
+
+from .responses import (
+    ORJSONResponse,
+    SerializedJSON
+)
+
+
+__all__ = ['ORJSONRoute']
+
+Endpoint = Callable[..., Coroutine[Any, Any, Any]]
+
+SUB_RESPONSE_PARAM_NAME = '_orjson_route_sub_response'
+""" Takes the response, with the cookies and status set by the dependencies. """
+
+
+class ORJSONRoute(APIRoute):
+    """
+    Serializes the model returned by the endpoint straight with orjson.
+
+    FastAPI validates the returned model once more against `response_model`,
+    though the service has already built it, and then walks it
+    with `jsonable_encoder` before encoding it with the stdlib.
+    Here only an instance of exactly the model is taken as is,
+    anything else is validated into it, as an ORM object,
+    and the response is encoded once and returned by the endpoint,
+    with the status and headers set through the `Response` parameter.
+
+    Applies to the coroutine endpoints with a model as `response_model`,
+    no options to shape it and an `ORJSONResponse` as the response class.
+    The OpenAPI schema is left as is.
+    """
+
+    def get_route_handler(self) -> Callable[[Request], Coroutine[Any, Any, Response]]:
+        if not self._is_serialized_in_endpoint():
+            return super().get_route_handler()
+        dependant = copy(self.dependant)
+        dependant.response_param_name = (
+            self.dependant.response_param_name or SUB_RESPONSE_PARAM_NAME
+        )
+        dependant.call = self._serialize_in_endpoint(
+            cast(Endpoint, self.dependant.call)
+        )
+        return get_request_handler(
+            dependant=dependant,
+            body_field=self.body_field,
+            status_code=self.status_code,
+            response_class=self.response_class,
+            response_field=None,
+            dependency_overrides_provider=self.dependency_overrides_provider
+        )
+
+    def _is_serialized_in_endpoint(self) -> bool:
+        return (
+            isinstance(self.response_model, type)
+            and issubclass(self.response_model, BaseModel)
+            and issubclass(self._get_response_class(), ORJSONResponse)
+            and self.dependant.call is not None
+            and asyncio.iscoroutinefunction(self.dependant.call)
+            and self.response_model_include is None
+            and self.response_model_exclude is None
+            and self.response_model_by_alias
+            and not self.response_model_exclude_unset
+            and not self.response_model_exclude_defaults
+            and not self.response_model_exclude_none
+        )
+
+    def _get_response_class(self) -> type[Response]:
+        if isinstance(self.response_class, DefaultPlaceholder):
+            return cast(type[Response], self.response_class.value)
+        return self.response_class
+
+    def _serialize_in_endpoint(self, call: Endpoint) -> Endpoint:
+        model = cast(type[BaseModel], self.response_model)
+        response_class = self._get_response_class()
+        status_code = self.status_code or HTTP_200_OK
+        # The endpoint may take the response itself.
+        response_param_name = self.dependant.response_param_name
+
+        @wraps(call)
+        async def serialize(**values: Any) -> Any:
+            if response_param_name is None:
+                sub_response: Response = values.pop(SUB_RESPONSE_PARAM_NAME)
+            else:
+                sub_response = values[response_param_name]
+            content = await call(**values)
+            if isinstance(content, Response):
+                return content
+            if not isinstance(content, BaseModel):
+                content = model.validate(content)
+            elif type(content) is not model:
+                # Fields of a subclass are left out, as FastAPI does.
+                content = model.parse_obj(content.dict(by_alias=True))
+            response = response_class(
+                SerializedJSON(orjson.dumps(
+                    content.dict(by_alias=True),
+                    default=pydantic_encoder
+                )),
+                status_code=sub_response.status_code or status_code
+            )
+            response.headers.raw.extend(sub_response.headers.raw)
+            return response
+
+        return serialize
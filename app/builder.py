@@ -2,10 +2,11 @@ import logging
 from collections.abc import AsyncGenerator
 from contextlib import asynccontextmanager
 from dataclasses import dataclass
+from typing import cast
 
 from fastapi import FastAPI
+from sqlalchemy.pool import QueuePool
 from starlette.middleware.cors import CORSMiddleware
-from starlette.middleware.sessions import SessionMiddleware
 
 from .api.dependencies.auth import (
     get_current_superuser,
@@ -18,20 +19,44 @@ from .api.dependencies.auth.markers import (
 from .api.dependencies.markers import (
     AppSettingsMarker,
     DBSessionInTransactionMarker,
+    JWTBlacklistServiceMarker,
+    JWTClaimsCacheMarker,
+    JWTServiceMarker,
+    LocalJWTBlacklistMarker,
     MailSenderMarker,
     OAuthMarker,
     PasswordCryptContextMarker,
+    RedisClientCacheMarker,
     RedisMarker
 )
+from .api.dependencies.singleton import Singleton
 from .api.errors import add_server_error_handler
+from .api.middlewares import (
+    CompressionMiddleware,
+    MetricsMiddleware,
+    RedisSessionMiddleware
+)
+from .api.responses import ORJSONResponse
 from .api.routes import router as api_router
 from .core.settings import AppSettings
 from .core.settings.environment import AppEnvType
 from .db import DBState
+from .services.auth.throttler import LoginThrottler
+from .services.jwt_ import (
+    JWTBlacklistService,
+    JWTBlacklistState,
+    JWTClaimsCacheState,
+    JWTService
+)
 from .services.mail import MailState
+from .services.metrics import MetricsState
 from .services.oauth import OAuthState
+from .services.oauth.metadata import OAuthMetadataCache
 from .services.password import PasswordState
-from .services.redis_ import RedisState
+from .services.redis_ import (
+    RedisClient,
+    RedisState
+)
 
 
 __all__ = [
@@ -53,7 +78,9 @@ class AppBuilder:
             docs_url=self.settings.fastapi_docs_url,
             redoc_url=self.settings.fastapi_redoc_url,
             swagger_ui_parameters={'docExpansion': 'none'},
+            default_response_class=ORJSONResponse
         )
+        self._redis: RedisState | None = None
 
     def build(self) -> FastAPI:
         self._add_middlewares()
@@ -65,12 +92,30 @@ class AppBuilder:
 
     def _add_middlewares(self) -> None:
         self._add_session_middleware()
+        self._add_compression_middleware()
         self._add_cors_middleware()
+        self._add_metrics_middleware()
 
     def _add_session_middleware(self) -> None:
+        # Only the OAuth flow, with authlib's state, uses the session.
+        self.app.add_middleware(
+            RedisSessionMiddleware,
+            redis=self._get_redis,
+            path='/oauth',
+            max_age_in_seconds=self.settings.oauth_session_expire_in_seconds
+        )
+
+    def _get_redis(self) -> RedisClient:
+        assert self._redis is not None, 'Redis is set up on startup.'
+        return self._redis()
+
+    def _add_compression_middleware(self) -> None:
         self.app.add_middleware(
-            SessionMiddleware,
-            secret_key=self.settings.session_secret
+            CompressionMiddleware,
+            minimum_size=self.settings.compression_minimum_size,
+            media_types=self.settings.compression_media_types,
+            gzip_level=self.settings.compression_gzip_level,
+            brotli_quality=self.settings.compression_brotli_quality
         )
 
     def _add_cors_middleware(self) -> None:
@@ -82,6 +127,10 @@ class AppBuilder:
             allow_credentials=True,
         )
 
+    def _add_metrics_middleware(self) -> None:
+        # The outermost one, to time the others too.
+        self.app.add_middleware(MetricsMiddleware)
+
     def _add_exception_handlers(self) -> None:
         if self.settings.env_type is AppEnvType.DEV:
             add_server_error_handler(self.app)
@@ -99,28 +148,74 @@ class AppBuilder:
     async def _lifespan(self, app: FastAPI) -> AsyncGenerator[None, None]:
         """https://www.starlette.io/events/#registering-events"""
         db = DBState(self.settings.sqlalchemy_url)
-        redis = RedisState(self.settings.redis_url)
+        redis = RedisState(
+            self.settings.redis,
+            cache_prefixes=[LoginThrottler.format_lockout_key('')]
+        )
+        self._redis = redis
         mail = MailState(self.settings.mail)
-        oauth = OAuthState(self.settings.oauth)
-        password = PasswordState()
+        oauth = OAuthState(
+            self.settings.oauth,
+            self._get_oauth_metadata_cache(),
+            self.settings.oauth_jwks_cache_ttl_in_seconds,
+            self.settings.oauth_http
+        )
+        if self.settings.oauth_prefetch_metadata:
+            await oauth.load_metadata()
+        password = PasswordState(self.settings.password)
+        metrics = MetricsState(
+            # The async engine pools its connections in a queue.
+            cast(QueuePool, db.engine.sync_engine.pool),
+            redis.pool,
+            self.settings.metrics_sample_interval_in_seconds
+        )
+        metrics.start()
+        jwt_claims_cache = JWTClaimsCacheState(
+            self.settings.jwt_claims_cache_size
+        )
+        jwt_blacklist = JWTBlacklistState(
+            redis(),
+            self.settings.access_token_expire_in_seconds
+        )
+
+        # Stateless services are shared by every request.
+        jwt_service = JWTService(self.settings)
+        jwt_blacklist_service = JWTBlacklistService(
+            redis=redis(),
+            settings=self.settings,
+            local=jwt_blacklist()
+        )
 
         deps = app.dependency_overrides
-        deps[AppSettingsMarker] = self._depend_on_settings
+        deps[AppSettingsMarker] = Singleton(self.settings)
         deps[CurrentUserMarker] = get_current_user
         deps[CurrentSuperuserMarker] = get_current_superuser
         deps[DBSessionInTransactionMarker] = db
-        deps[RedisMarker] = redis
-        deps[MailSenderMarker] = mail
-        deps[OAuthMarker] = oauth
-        deps[PasswordCryptContextMarker] = password
+        deps[RedisMarker] = Singleton(redis())
+        deps[RedisClientCacheMarker] = Singleton(redis.cache)
+        deps[MailSenderMarker] = Singleton(mail())
+        deps[OAuthMarker] = Singleton(oauth())
+        deps[PasswordCryptContextMarker] = Singleton(password())
+        deps[JWTClaimsCacheMarker] = Singleton(jwt_claims_cache())
+        deps[LocalJWTBlacklistMarker] = Singleton(jwt_blacklist())
+        deps[JWTServiceMarker] = Singleton(jwt_service)
+        deps[JWTBlacklistServiceMarker] = Singleton(jwt_blacklist_service)
 
         yield
 
+        await metrics.shutdown()
+        await jwt_blacklist.shutdown()
         await db.shutdown()
         await redis.shutdown()
-
-    def _depend_on_settings(self) -> AppSettings:
-        return self.settings
+        self._redis = None
+        await oauth.shutdown()
+        jwt_claims_cache.shutdown()
+
+    def _get_oauth_metadata_cache(self) -> OAuthMetadataCache | None:
+        settings = self.settings.oauth_metadata_cache
+        if settings.ttl_in_seconds == 0:
+            return None
+        return OAuthMetadataCache(settings.path, settings.ttl_in_seconds)
 
 
 def get_app(settings: AppSettings) -> FastAPI:
@@ -1,4 +1,5 @@
 from os import environ
+from pathlib import Path
 from typing import ClassVar
 
 from fastapi_mail.config import ConnectionConfig as MailSettings
@@ -9,8 +10,18 @@ from pydantic import (
     RedisDsn
 )
 
+from ..dataclasses_ import (
+    MailQueueSettings,
+    OAuthHTTPSettings,
+    OAuthMetadataCacheSettings,
+    PasswordSettings,
+    RedisSettings
+)
 from ..environment import AppEnvType
-from ..paths import EMAIL_TEMPLATES_DIR
+from ..paths import (
+    EMAIL_TEMPLATES_DIR,
+    OAUTH_METADATA_CACHE_PATH
+)
 from ....db.enums import OAuthBackend
 
 
@@ -33,16 +44,77 @@ class AppSettings(BaseSettings):
     cors_methods: list[str] = Field(..., env='CORS_METHODS')
     cors_headers: list[str] = Field(..., env='CORS_HEADERS')
 
-    session_secret: str = Field(..., env='SESSION_SECRET')
+    metrics_sample_interval_in_seconds: float = Field(
+        5,
+        env='METRICS_SAMPLE_INTERVAL_IN_SECONDS',
+        gt=0
+    )
+
+    compression_minimum_size: int = Field(
+        1024,
+        env='COMPRESSION_MINIMUM_SIZE',
+        ge=0
+    )
+    compression_media_types: list[str] = Field(
+        ['application/json'],
+        env='COMPRESSION_MEDIA_TYPES'
+    )
+    compression_gzip_level: int = Field(
+        6,
+        env='COMPRESSION_GZIP_LEVEL',
+        ge=1,
+        le=9
+    )
+    compression_brotli_quality: int = Field(
+        4,
+        env='COMPRESSION_BROTLI_QUALITY',
+        ge=0,
+        le=11
+    )
 
     db_dialect: ClassVar[str] = 'postgresql'
     db_driver: ClassVar[str] = 'asyncpg'
     db_url: PostgresDsn = Field(..., env='DB_URL')
 
     redis_url: RedisDsn = Field(..., env='REDIS_URL')
+    redis_max_connections: int = Field(64, env='REDIS_MAX_CONNECTIONS')
+    redis_pool_timeout_in_seconds: float = Field(
+        5,
+        env='REDIS_POOL_TIMEOUT_IN_SECONDS'
+    )
+    redis_socket_timeout_in_seconds: float = Field(
+        5,
+        env='REDIS_SOCKET_TIMEOUT_IN_SECONDS'
+    )
+    redis_socket_connect_timeout_in_seconds: float = Field(
+        2,
+        env='REDIS_SOCKET_CONNECT_TIMEOUT_IN_SECONDS'
+    )
+    redis_socket_keepalive: bool = Field(True, env='REDIS_SOCKET_KEEPALIVE')
+    redis_health_check_interval_in_seconds: int = Field(
+        30,
+        env='REDIS_HEALTH_CHECK_INTERVAL_IN_SECONDS'
+    )
+    redis_retry_attempts: int = Field(3, env='REDIS_RETRY_ATTEMPTS')
+    redis_client_cache: bool = Field(False, env='REDIS_CLIENT_CACHE')
+    redis_client_cache_max_size: int = Field(
+        10_000,
+        env='REDIS_CLIENT_CACHE_MAX_SIZE'
+    )
+    redis_client_cache_ttl_in_seconds: int = Field(
+        60,
+        env='REDIS_CLIENT_CACHE_TTL_IN_SECONDS'
+    )
 
     jwt_algorithm: ClassVar[str] = 'HS256'
     jwt_secret: str = Field(..., env='JWT_SECRET')
+    jwt_claims_cache_size: int = Field(4096, env='JWT_CLAIMS_CACHE_SIZE')
+
+    password_hash_rounds: int | None = Field(None, env='PASSWORD_HASH_ROUNDS')
+    password_hash_target_time_in_ms: int = Field(
+        250,
+        env='PASSWORD_HASH_TARGET_TIME_IN_MS'
+    )
 
     mail_username: str = Field(..., env='MAIL_USERNAME')
     mail_password: str = Field(..., env='MAIL_PASSWORD')
@@ -53,6 +125,66 @@ class AppSettings(BaseSettings):
     mail_from: str = Field(..., env='MAIL_FROM')
     mail_from_name: str = Field(..., env='MAIL_FROM_NAME')
     mail_suppress_send: bool = Field(False, env='MAIL_SUPPRESS_SEND')
+    mail_use_queue: bool = Field(False, env='MAIL_USE_QUEUE')
+    mail_queue_batch_size: int = Field(
+        50,
+        env='MAIL_QUEUE_BATCH_SIZE',
+        gt=0
+    )
+    mail_queue_max_attempts: int = Field(
+        5,
+        env='MAIL_QUEUE_MAX_ATTEMPTS',
+        gt=0
+    )
+    mail_queue_retry_delay_in_seconds: int = Field(
+        30,
+        env='MAIL_QUEUE_RETRY_DELAY_IN_SECONDS',
+        gt=0
+    )
+    mail_queue_claim_idle_in_seconds: int = Field(
+        300,
+        env='MAIL_QUEUE_CLAIM_IDLE_IN_SECONDS',
+        gt=0
+    )
+
+    oauth_session_expire_in_seconds: int = Field(
+        3600,
+        env='OAUTH_SESSION_EXPIRE_IN_SECONDS',
+        gt=0
+    )
+    oauth_prefetch_metadata: bool = Field(True, env='OAUTH_PREFETCH_METADATA')
+    oauth_metadata_cache_path: Path = Field(
+        OAUTH_METADATA_CACHE_PATH,
+        env='OAUTH_METADATA_CACHE_PATH'
+    )
+    oauth_metadata_cache_ttl_in_seconds: int = Field(
+        86_400,
+        env='OAUTH_METADATA_CACHE_TTL_IN_SECONDS',
+        ge=0
+    )
+    oauth_jwks_cache_ttl_in_seconds: int = Field(
+        3600,
+        env='OAUTH_JWKS_CACHE_TTL_IN_SECONDS',
+        gt=0
+    )
+    oauth_http2: bool = Field(True, env='OAUTH_HTTP2')
+    oauth_http_timeout_in_seconds: float = Field(
+        10,
+        env='OAUTH_HTTP_TIMEOUT_IN_SECONDS'
+    )
+    oauth_http_connect_timeout_in_seconds: float = Field(
+        3,
+        env='OAUTH_HTTP_CONNECT_TIMEOUT_IN_SECONDS'
+    )
+    oauth_http_max_connections: int = Field(
+        20,
+        env='OAUTH_HTTP_MAX_CONNECTIONS',
+        gt=0
+    )
+    oauth_http_keepalive_expiry_in_seconds: float = Field(
+        60,
+        env='OAUTH_HTTP_KEEPALIVE_EXPIRY_IN_SECONDS'
+    )
 
     access_token_expire_in_seconds: int = Field(
         ...,
@@ -62,10 +194,46 @@ class AppSettings(BaseSettings):
         ...,
         env='REFRESH_TOKEN_EXPIRE_IN_SECONDS'
     )
+    refresh_sessions_per_user_limit: int = Field(
+        10,
+        env='REFRESH_SESSIONS_PER_USER_LIMIT',
+        gt=0
+    )
     verification_code_expire_in_seconds: int = Field(
         ...,
         env='VERIFICATION_CODE_EXPIRE_IN_SECONDS'
     )
+    verification_code_max_attempts: int = Field(
+        5,
+        env='VERIFICATION_CODE_MAX_ATTEMPTS',
+        gt=0
+    )
+    verification_send_cooldown_in_seconds: int = Field(
+        60,
+        env='VERIFICATION_SEND_COOLDOWN_IN_SECONDS',
+        ge=0
+    )
+
+    login_failures_window_in_seconds: int = Field(
+        900,
+        env='LOGIN_FAILURES_WINDOW_IN_SECONDS'
+    )
+    login_failures_limit_per_email: int = Field(
+        5,
+        env='LOGIN_FAILURES_LIMIT_PER_EMAIL'
+    )
+    login_failures_limit_per_ip: int = Field(
+        50,
+        env='LOGIN_FAILURES_LIMIT_PER_IP'
+    )
+    login_lockout_base_in_seconds: int = Field(
+        30,
+        env='LOGIN_LOCKOUT_BASE_IN_SECONDS'
+    )
+    login_lockout_max_in_seconds: int = Field(
+        3600,
+        env='LOGIN_LOCKOUT_MAX_IN_SECONDS'
+    )
 
     @property
     def app_info(self) -> str:
@@ -104,6 +272,42 @@ class AppSettings(BaseSettings):
             TEMPLATE_FOLDER=EMAIL_TEMPLATES_DIR
         )
 
+    @property
+    def mail_queue(self) -> MailQueueSettings:
+        return MailQueueSettings(
+            batch_size=self.mail_queue_batch_size,
+            max_attempts=self.mail_queue_max_attempts,
+            retry_delay_in_seconds=self.mail_queue_retry_delay_in_seconds,
+            claim_idle_in_seconds=self.mail_queue_claim_idle_in_seconds
+        )
+
+    @property
+    def password(self) -> PasswordSettings:
+        return PasswordSettings(
+            hash_rounds=self.password_hash_rounds,
+            hash_target_time_in_ms=self.password_hash_target_time_in_ms
+        )
+
+    @property
+    def redis(self) -> RedisSettings:
+        return RedisSettings(
+            url=self.redis_url,
+            max_connections=self.redis_max_connections,
+            pool_timeout_in_seconds=self.redis_pool_timeout_in_seconds,
+            socket_timeout_in_seconds=self.redis_socket_timeout_in_seconds,
+            socket_connect_timeout_in_seconds=(
+                self.redis_socket_connect_timeout_in_seconds
+            ),
+            socket_keepalive=self.redis_socket_keepalive,
+            health_check_interval_in_seconds=(
+                self.redis_health_check_interval_in_seconds
+            ),
+            retry_attempts=self.redis_retry_attempts,
+            client_cache=self.redis_client_cache,
+            client_cache_max_size=self.redis_client_cache_max_size,
+            client_cache_ttl_in_seconds=self.redis_client_cache_ttl_in_seconds
+        )
+
     @property
     def oauth(self) -> dict[str, str]:
         backends = {backend.upper() for backend in OAuthBackend}
@@ -114,3 +318,24 @@ class AppSettings(BaseSettings):
                 key = f'{backend}_{param}'
                 config[key] = environ.get(key, '')
         return config
+
+    @property
+    def oauth_metadata_cache(self) -> OAuthMetadataCacheSettings:
+        return OAuthMetadataCacheSettings(
+            path=self.oauth_metadata_cache_path,
+            ttl_in_seconds=self.oauth_metadata_cache_ttl_in_seconds
+        )
+
+    @property
+    def oauth_http(self) -> OAuthHTTPSettings:
+        return OAuthHTTPSettings(
+            http2=self.oauth_http2,
+            timeout_in_seconds=self.oauth_http_timeout_in_seconds,
+            connect_timeout_in_seconds=(
+                self.oauth_http_connect_timeout_in_seconds
+            ),
+            max_connections=self.oauth_http_max_connections,
+            keepalive_expiry_in_seconds=(
+                self.oauth_http_keepalive_expiry_in_seconds
+            )
+        )
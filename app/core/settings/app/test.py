@@ -14,12 +14,13 @@ class AppTestSettings(AppSettings):
     cors_methods: list[str] = Field(['*'], env='CORS_METHODS')
     cors_headers: list[str] = Field(['*'], env='CORS_HEADERS')
 
-    session_secret: str = Field('fakeSessionSecret', env='SESSION_SECRET')
-
     redis_url: RedisDsn = Field('redis://localhost', env='REDIS_URL')
+    redis_client_cache: bool = Field(True, env='REDIS_CLIENT_CACHE')
 
     jwt_secret: str = Field('fakeJWTSecret', env='JWT_SECRET')
 
+    password_hash_rounds: int | None = Field(4, env='PASSWORD_HASH_ROUNDS')
+
     mail_username: str = Field('test@myvocab.com', env='MAIL_USERNAME')
     mail_password: str = Field('fakeMailPassword', env='MAIL_PASSWORD')
     mail_server: str = Field('smtp.myvocab.com', env='MAIL_SERVER')
@@ -30,6 +31,8 @@ class AppTestSettings(AppSettings):
     mail_from_name: str = Field('My Vocab App In Test', env='MAIL_FROM_NAME')
     mail_suppress_send: bool = Field(True, env='MAIL_SUPPRESS_SEND')
 
+    oauth_prefetch_metadata: bool = Field(False, env='OAUTH_PREFETCH_METADATA')
+
     access_token_expire_in_seconds: int = Field(
         6_000,
         env='ACCESS_TOKEN_EXPIRE_IN_SECONDS'
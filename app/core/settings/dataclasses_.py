@@ -1,9 +1,15 @@
 from dataclasses import dataclass
+from pathlib import Path
 
 
 __all__ = [
     'TGLoggingSettings',
-    'LoggingSettings'
+    'LoggingSettings',
+    'MailQueueSettings',
+    'OAuthHTTPSettings',
+    'OAuthMetadataCacheSettings',
+    'PasswordSettings',
+    'RedisSettings'
 ]
 
 
@@ -18,3 +24,50 @@ class TGLoggingSettings:
 class LoggingSettings:
     level: str
     tg: TGLoggingSettings
+
+
+@dataclass
+class MailQueueSettings:
+    batch_size: int
+    max_attempts: int
+    retry_delay_in_seconds: int
+    """ Delay before the first retry, doubled for every next one. """
+    claim_idle_in_seconds: int
+    """ Idle time after which mails pending on other workers are claimed. """
+
+
+@dataclass
+class OAuthHTTPSettings:
+    http2: bool
+    timeout_in_seconds: float
+    connect_timeout_in_seconds: float
+    max_connections: int
+    """ Connections per provider. """
+    keepalive_expiry_in_seconds: float
+
+
+@dataclass
+class OAuthMetadataCacheSettings:
+    path: Path
+    ttl_in_seconds: int
+
+
+@dataclass
+class PasswordSettings:
+    hash_rounds: int | None
+    hash_target_time_in_ms: int
+
+
+@dataclass
+class RedisSettings:
+    url: str
+    max_connections: int
+    pool_timeout_in_seconds: float
+    socket_timeout_in_seconds: float
+    socket_connect_timeout_in_seconds: float
+    socket_keepalive: bool
+    health_check_interval_in_seconds: int
+    retry_attempts: int
+    client_cache: bool
+    client_cache_max_size: int
+    client_cache_ttl_in_seconds: int
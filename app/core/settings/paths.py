@@ -5,6 +5,7 @@ __alL__ = [
     'APP_DIR',
     'BASE_DIR',
     'EMAIL_TEMPLATES_DIR',
+    'OAUTH_METADATA_CACHE_PATH',
     'ALEMBIC_CONFIG_PATH'
 ]
 
@@ -12,5 +13,6 @@ __alL__ = [
 APP_DIR = Path(__file__).parent.parent.parent
 BASE_DIR = APP_DIR.parent
 EMAIL_TEMPLATES_DIR = APP_DIR / 'email_templates'
+OAUTH_METADATA_CACHE_PATH = BASE_DIR / '.cache' / 'oauth_metadata.json'
 
 ALEMBIC_CONFIG_PATH = BASE_DIR / 'alembic.ini'
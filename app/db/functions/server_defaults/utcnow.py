@@ -13,6 +13,7 @@ class UTCNow(FunctionElement):  # type: ignore[misc]
     """
 
     type = DateTime()
+    inherit_cache = True
 
 
 @compiles(UTCNow, 'postgresql')  # type: ignore[misc]
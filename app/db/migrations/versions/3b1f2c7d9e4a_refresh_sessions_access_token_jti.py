@@ -0,0 +1,62 @@
+"""refresh sessions access token jti
+
+Revision ID: 3b1f2c7d9e4a
+Revises: 6ec9498748cf
+Create Date: 2026-10-19 17:02:11.418203
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision = '3b1f2c7d9e4a'
+down_revision = '6ec9498748cf'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.add_column('refresh_sessions', sa.Column('access_token_jti', postgresql.UUID(as_uuid=True), nullable=True))
+    op.add_column('refresh_sessions', sa.Column('access_token_expires_at', sa.DateTime(), nullable=True))
+
+    # ### Backfill from the (base64url encoded) JWT payload
+    op.execute("""
+        WITH payloads AS (
+            SELECT
+                id,
+                convert_from(
+                    decode(
+                        rpad(
+                            translate(split_part(access_token, '.', 2), '-_', '+/'),
+                            (length(split_part(access_token, '.', 2)) + 3) / 4 * 4,
+                            '='
+                        ),
+                        'base64'
+                    ),
+                    'UTF8'
+                )::json AS payload
+            FROM refresh_sessions
+        )
+        UPDATE refresh_sessions
+        SET
+            access_token_jti = (payloads.payload ->> 'jti')::uuid,
+            access_token_expires_at = TIMEZONE('utc', to_timestamp((payloads.payload ->> 'exp')::bigint))
+        FROM payloads
+        WHERE payloads.id = refresh_sessions.id
+    """)
+    # ### End backfill
+
+    op.alter_column('refresh_sessions', 'access_token_jti', nullable=False)
+    op.alter_column('refresh_sessions', 'access_token_expires_at', nullable=False)
+    op.drop_column('refresh_sessions', 'access_token')
+
+
+def downgrade():
+    # ### Signed tokens can not be restored, so the sessions are dropped
+    op.execute('DELETE FROM refresh_sessions')
+    # ### End sessions drop
+
+    op.add_column('refresh_sessions', sa.Column('access_token', sa.String(), nullable=False))
+    op.drop_column('refresh_sessions', 'access_token_expires_at')
+    op.drop_column('refresh_sessions', 'access_token_jti')
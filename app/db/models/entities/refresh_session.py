@@ -1,5 +1,10 @@
+from datetime import datetime
+from uuid import UUID as PyUUID
+
 from sqlalchemy import (
     Column,
+    DateTime,
+    Index,
     String
 )
 from sqlalchemy.dialects.postgresql import (
@@ -29,19 +34,28 @@ class RefreshSession(
     Base
 ):
     __tablename__ = 'refresh_sessions'
+    __table_args__ = (
+        Index(
+            'ix_refresh_sessions_user_id_expires_at',
+            'user_id', 'expires_at'
+        ),
+    )
 
     refresh_token: Mapped[str] = Column(
         UUID,
         unique=True, index=True, server_default=gen_random_uuid()
     )
-    access_token: Mapped[str] = Column(
-        String,
+    access_token_jti: Mapped[PyUUID] = Column(
+        UUID(as_uuid=True),
         nullable=False
     )
-    ip_address: Mapped[str] = Column(
-        INET,
+    access_token_expires_at: Mapped[datetime] = Column(
+        DateTime,
         nullable=False
     )
+    ip_address: Mapped[str | None] = Column(
+        INET
+    )
     user_agent: Mapped[str] = Column(
         String(256),
         nullable=False
@@ -51,7 +65,7 @@ class RefreshSession(
         return (
             f'{self.__class__.__name__}('
             f'refresh_token={self.refresh_token!r}, '
-            f'access_token={self.access_token!r}, '
+            f'access_token_jti={self.access_token_jti!r}, '
             f'expires_at={self.expires_at!r}, '
             f'user_id={self.user_id!r}'
             ')'
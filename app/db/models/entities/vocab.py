@@ -1,11 +1,14 @@
 from typing import TYPE_CHECKING
 
 from sqlalchemy import (
+    BigInteger,
     Boolean,
     Column,
+    FetchedValue,
     String,
     UniqueConstraint,
-    false
+    false,
+    text
 )
 from sqlalchemy.orm import (
     Mapped,
@@ -35,6 +38,9 @@ class Vocab(
 ):
     """
     `Vocab` - short form of the `vocabulary`.
+
+    `version` is bumped by the database triggers on every change
+    of the vocab, its words and its tags.
     """
 
     __tablename__ = 'vocabs'
@@ -58,6 +64,10 @@ class Vocab(
         Boolean,
         server_default=false(), nullable=False
     )
+    version: Mapped[int] = Column(
+        BigInteger,
+        server_default=text('1'), server_onupdate=FetchedValue(), nullable=False
+    )
 
     tags: Mapped[list['Tag']] = relationship(
         'VocabTagAssociation',
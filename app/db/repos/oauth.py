@@ -1,8 +1,14 @@
 from typing import ClassVar
 
+from sqlalchemy import or_
+from sqlalchemy.future import select as sa_select
+
 from .base import BaseRepo
 from ..enums import OAuthBackend
-from ..models import OAuthConnection
+from ..models import (
+    OAuthConnection,
+    User
+)
 from ...dtos.oauth import OAuthUser
 
 
@@ -25,3 +31,35 @@ class OAuthConnectionsRepo(BaseRepo[OAuthConnection]):
             detail=oauth_user.detail,
             user_id=internal_user_id
         )
+
+    async def get_connected_user(
+        self,
+        oauth_user: OAuthUser,
+        backend: OAuthBackend
+    ) -> tuple[User | None, bool]:
+        """
+        Get the user of the connection and check whether the email
+        of the OAuth user is taken, in one query.
+        """
+
+        connected_user_id = (
+            sa_select(OAuthConnection.user_id)
+            .where(*self._build_pk_clauses([oauth_user.id, backend]))
+            .scalar_subquery()
+        )
+        stmt = (
+            sa_select(User, (User.id == connected_user_id).label('is_connected'))
+            .where(or_(
+                User.id == connected_user_id,
+                User.email == oauth_user.email
+            ))
+        )
+        result = await self.session.execute(stmt)
+        connected_user = None
+        is_email_taken = False
+        for user, is_connected in result:
+            if is_connected:
+                connected_user = user
+            if user.email == oauth_user.email:
+                is_email_taken = True
+        return connected_user, is_email_taken
@@ -2,10 +2,28 @@ from datetime import (
     datetime,
     timedelta
 )
-from typing import ClassVar
+from typing import (
+    Any,
+    ClassVar,
+    cast
+)
+
+from sqlalchemy import (
+    cast as sa_cast,
+    delete as sa_delete,
+    insert as sa_insert
+)
+from sqlalchemy.exc import NoResultFound
+from sqlalchemy.future import select as sa_select
+from sqlalchemy.orm import aliased
 
 from .base import BaseRepo
-from ..models import RefreshSession
+from ..errors import EntityDoesNotExistError
+from ..functions.server_defaults import utcnow
+from ..models import (
+    RefreshSession,
+    User
+)
 
 
 __all__ = ['RefreshSessionsRepo']
@@ -30,6 +48,117 @@ class RefreshSessionsRepo(BaseRepo[RefreshSession]):
             [RefreshSession.refresh_token == refresh_token]
         )
 
+    async def create_one_within_limit(
+        self,
+        limit: int,
+        **insert_data: Any
+    ) -> RefreshSession:
+        """
+        Insert the session evicting the owner's oldest ones
+        so no more than `limit` of them are left.
+        """
+
+        evicted_ids = (
+            sa_select(RefreshSession.id)
+            .where(RefreshSession.user_id == insert_data['user_id'])
+            .order_by(RefreshSession.expires_at.desc())
+            .offset(limit - 1)
+        )
+        evict_cte = (
+            sa_delete(RefreshSession)
+            .where(RefreshSession.id.in_(evicted_ids))
+            .cte('evicted_sessions')
+        )
+        stmt = (
+            sa_insert(RefreshSession)
+            .values(insert_data)
+            # `add_cte` (SQLAlchemy 1.4.21) is missing from the stubs.
+            .add_cte(evict_cte)  # type: ignore[attr-defined]
+        )
+        result = await self._return_from_statement(stmt)
+        return cast(RefreshSession, result.scalar())
+
+    async def get_many_active_by_user_id(
+        self,
+        user_id: int,
+        *,
+        limit: int,
+        offset: int = 0
+    ) -> list[RefreshSession]:
+        stmt = (
+            sa_select(RefreshSession)
+            .where(
+                RefreshSession.user_id == user_id,
+                RefreshSession.expires_at > utcnow()
+            )
+            .order_by(RefreshSession.expires_at.desc())
+            .limit(limit)
+            .offset(offset)
+        )
+        result = await self.session.execute(stmt)
+        return result.scalars().all()
+
+    async def delete_all_by_user_id(self, user_id: int) -> None:
+        stmt = (
+            sa_delete(RefreshSession)
+            .where(RefreshSession.user_id == user_id)
+        )
+        async with self.session.begin_nested():
+            await self.session.execute(stmt)
+
+    async def rotate(
+        self,
+        refresh_token: str,
+        **insert_data: Any
+    ) -> tuple[User, RefreshSession, RefreshSession | None]:
+        """
+        Delete the session and insert its successor in one statement.
+
+        Returns the session owner, the deleted session
+        and the new one (`None` if the deleted session had expired).
+        """
+
+        columns = RefreshSession.__table__.c
+        old_cte = (
+            sa_delete(RefreshSession)
+            .where(RefreshSession.refresh_token == refresh_token)
+            .returning(*columns)
+            .cte('old_session')
+        )
+        new_cte = (
+            sa_insert(RefreshSession)
+            .from_select(
+                [columns.user_id, *insert_data],
+                sa_select(
+                    old_cte.c.user_id,
+                    *[
+                        sa_cast(value, columns[key].type)
+                        for key, value in insert_data.items()
+                    ]
+                )
+                .where(old_cte.c.expires_at > utcnow())
+            )
+            .returning(*columns)
+            .cte('new_session')
+        )
+        old_session = aliased(RefreshSession, old_cte)
+        new_session = aliased(RefreshSession, new_cte)
+        stmt = (
+            sa_select(User, old_session, new_session)
+            .select_from(old_session)
+            .join(User, User.id == old_session.user_id)
+            .outerjoin(new_session, new_session.user_id == old_session.user_id)
+            .execution_options(populate_existing=True)
+        )
+        async with self.session.begin_nested():
+            result = await self.session.execute(stmt)
+        try:
+            user, old, new = result.one()
+        except NoResultFound as error:
+            raise EntityDoesNotExistError from error
+        else:
+            return user, old, new
+
     async def expire(
         self,
         refresh_token: str,
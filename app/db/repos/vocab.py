@@ -1,7 +1,11 @@
 from typing import ClassVar
 
+from sqlalchemy.future import select as sa_select
+
 from .base import BaseRepo
+from ..errors import EntityDoesNotExistError
 from ..models import Vocab
+from ...dtos.vocab import VocabVersion
 
 
 __all__ = ['VocabsRepo']
@@ -23,3 +27,25 @@ class VocabsRepo(BaseRepo[Vocab]):
                 Vocab.is_public | Vocab.is_owner(reader_id)
             ]
         )
+
+    async def get_version_if_permitted_to_read(
+        self,
+        id_: int,
+        reader_id: int
+    ) -> VocabVersion:
+        """
+        Get what the ETag of the vocab with its words and tags is built from,
+        loading none of them.
+        """
+
+        stmt = (
+            sa_select(Vocab.id, Vocab.version)
+            .where(
+                Vocab.id == id_,
+                Vocab.is_public | Vocab.is_owner(reader_id)
+            )
+        )
+        result = await self.session.execute(stmt)
+        if (row := result.one_or_none()) is None:
+            raise EntityDoesNotExistError
+        return VocabVersion(*row)
@@ -4,7 +4,7 @@ from dataclasses import dataclass
 __all__ = ['JWTMetaClaims']
 
 
-@dataclass
+@dataclass(frozen=True)
 class JWTMetaClaims:
     exp: int
     sub: str
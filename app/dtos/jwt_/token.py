@@ -7,7 +7,7 @@ from .user import JWTUserClaims
 __all__ = ['JWTClaims']
 
 
-@dataclass
+@dataclass(frozen=True)
 class JWTClaims:
     meta: JWTMetaClaims
     user: JWTUserClaims
@@ -4,9 +4,10 @@ from dataclasses import dataclass
 __all__ = ['JWTUserClaims']
 
 
-@dataclass
+@dataclass(frozen=True)
 class JWTUserClaims:
     id: int
     email: str
     username: str
     is_superuser: bool
+    token_version: int
@@ -0,0 +1,4 @@
+from .version import VocabVersion
+
+
+__all__ = ['VocabVersion']
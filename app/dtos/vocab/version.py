@@ -0,0 +1,18 @@
+from dataclasses import dataclass
+
+from ...utils.etag import make_etag
+
+
+__all__ = ['VocabVersion']
+
+
+@dataclass
+class VocabVersion:
+    id: int
+    """ Vocab id. """
+    version: int
+    """ Bumped on every change of the vocab, its words and its tags. """
+
+    @property
+    def etag(self) -> str:
+        return make_etag(self.id, self.version)
@@ -0,0 +1,27 @@
+import asyncio
+import signal
+from dataclasses import replace
+
+from app.core.config import get_app_settings
+from app.core.settings import AppSettings
+from app.services.mail import MailWorker
+from app.services.redis_ import RedisState
+from app.utils.logging_.config import configure_base_logging
+
+
+async def run(settings: AppSettings) -> None:
+    # The worker reads no keys the client cache is meant for.
+    redis = RedisState(replace(settings.redis, client_cache=False))
+    worker = MailWorker(redis(), settings.mail, settings.mail_queue)
+    loop = asyncio.get_running_loop()
+    for signum in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(signum, worker.stop)
+    try:
+        await worker.run()
+    finally:
+        await redis.shutdown()
+
+
+if __name__ == '__main__':
+    configure_base_logging()
+    asyncio.run(run(get_app_settings()))
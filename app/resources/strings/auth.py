@@ -8,5 +8,5 @@ TOKEN_IS_NOT_BEARER = (
 )
 ACCESS_TOKEN_EXPIRED = 'The access token has expired. Please, refresh.'
 ACCESS_TOKEN_IS_INVALID = 'The access token is invalid.'
-ACCESS_TOKEN_IS_IN_BLACKLIST = 'The access token is in blacklist.'
+ACCESS_TOKEN_IS_REVOKED = 'The access token has been revoked.'
 CURRENT_USER_IS_NOT_SUPERUSER = 'The current user is not a superuser.'
@@ -1,14 +1,22 @@
+from datetime import datetime
 from typing import Literal
 
-from pydantic import BaseModel
+from pydantic import (
+    BaseModel,
+    IPvAnyAddress
+)
 
-from .mixins import OrmModeMixin
+from .mixins import (
+    IDMixin,
+    OrmModeMixin
+)
 from .user import UserInResponse
 
 
 __all__ = [
     'CredentialsInResponse',
-    'AuthResult'
+    'AuthResult',
+    'RefreshSessionInResponse'
 ]
 
 
@@ -22,3 +30,10 @@ class CredentialsInResponse(BaseModel):
 class AuthResult(OrmModeMixin):
     credentials: CredentialsInResponse
     user: UserInResponse
+
+
+class RefreshSessionInResponse(OrmModeMixin, IDMixin):
+    ip_address: IPvAnyAddress | None
+    user_agent: str
+    created_at: datetime
+    expires_at: datetime
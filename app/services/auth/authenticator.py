@@ -1,9 +1,9 @@
 import logging
-from contextlib import suppress
 from dataclasses import dataclass
+from typing import Any
+from uuid import UUID
 
 from fastapi import Depends
-from jwt import ExpiredSignatureError
 
 from .client_analyzer import ClientAnalyzer
 from .cookie import CookieService
@@ -15,7 +15,11 @@ from ..jwt_ import (
     JWTBlacklistService,
     JWTService
 )
-from ...api.dependencies.markers import AppSettingsMarker
+from ...api.dependencies.markers import (
+    AppSettingsMarker,
+    JWTBlacklistServiceMarker,
+    JWTServiceMarker
+)
 from ...core.settings import AppSettings
 from ...db.errors import EntityDoesNotExistError
 from ...db.models import (
@@ -27,7 +31,10 @@ from ...schemas.auth import (
     AuthResult,
     CredentialsInResponse
 )
-from ...utils.datetime_ import compute_expire
+from ...utils.datetime_ import (
+    compute_expire,
+    to_timestamp
+)
 
 
 __all__ = ['Authenticator']
@@ -37,50 +44,112 @@ logger = logging.getLogger(__name__)
 
 @dataclass
 class Authenticator:
-    jwt_service: JWTService = Depends()
+    jwt_service: JWTService = Depends(JWTServiceMarker)
     repo: RefreshSessionsRepo = Depends()
     cookie_service: CookieService = Depends()
     client_analyzer: ClientAnalyzer = Depends()
     settings: AppSettings = Depends(AppSettingsMarker)
-    blacklist_service: JWTBlacklistService = Depends()
+    blacklist_service: JWTBlacklistService = Depends(
+        JWTBlacklistServiceMarker
+    )
 
     async def authenticate(self, user: User) -> AuthResult:
-        session = await self._create(user)
-        self.cookie_service.set_refresh_token(session.refresh_token)
-        return AuthResult(
-            credentials=self._form_credentials(session),
-            user=user
-        )
-
-    async def _create(self, user: User) -> RefreshSession:
-        return await self.repo.create_one(
+        session = await self.repo.create_one_within_limit(
+            self.settings.refresh_sessions_per_user_limit,
             user_id=user.id,
-            ip_address=self.client_analyzer.ip_address,
-            user_agent=self.client_analyzer.user_agent,
-            expires_at=compute_expire(self.expire_in_seconds),
-            access_token=self.jwt_service.generate(user)
+            **self._form_session_data()
         )
+        return await self._form_result(user, session)
+
+    def _form_session_data(self) -> dict[str, Any]:
+        return {
+            'ip_address': self.client_analyzer.ip_address,
+            'user_agent': self.client_analyzer.user_agent,
+            'expires_at': compute_expire(self.expire_in_seconds),
+            'access_token_jti': UUID(self.jwt_service.generate_jti()),
+            'access_token_expires_at': compute_expire(
+                self.jwt_service.expire_in_seconds
+            )
+        }
 
     @property
     def expire_in_seconds(self) -> int:
         return self.settings.refresh_token_expire_in_seconds
 
-    def _form_credentials(
+    async def _form_result(
         self,
+        user: User,
         session: RefreshSession
+    ) -> AuthResult:
+        access_token = self.jwt_service.generate(
+            user,
+            jti=session.access_token_jti.hex,
+            exp=to_timestamp(session.access_token_expires_at),
+            token_version=await self.blacklist_service.get_token_version(
+                user.id
+            )
+        )
+        self.cookie_service.set_refresh_token(session.refresh_token)
+        return AuthResult(
+            credentials=self._form_credentials(session, access_token),
+            user=user
+        )
+
+    def _form_credentials(
+        self,
+        session: RefreshSession,
+        access_token: str
     ) -> CredentialsInResponse:
         return CredentialsInResponse(
-            access_token=session.access_token,
+            access_token=access_token,
             expires_in=self.settings.access_token_expire_in_seconds,
             refresh_token=session.refresh_token
         )
 
+    async def reauthenticate(self, refresh_token: str) -> AuthResult:
+        user, old_session, session = await self._rotate(refresh_token)
+        await self.blacklist_access_token(old_session)
+        return await self._form_result(user, session)
+
+    async def _rotate(
+        self,
+        refresh_token: str
+    ) -> tuple[User, RefreshSession, RefreshSession]:
+        try:
+            user, old_session, session = await self.repo.rotate(
+                refresh_token,
+                **self._form_session_data()
+            )
+        except EntityDoesNotExistError as error:
+            raise RefreshSessionDoesNotExistError from error
+        if session is None:
+            raise RefreshSessionExpiredError
+        return user, old_session, session
+
+    async def get_sessions(
+        self,
+        user_id: int,
+        *,
+        limit: int,
+        offset: int = 0
+    ) -> list[RefreshSession]:
+        return await self.repo.get_many_active_by_user_id(
+            user_id,
+            limit=limit,
+            offset=offset
+        )
+
     async def deauthenticate(
         self,
         refresh_token: str
     ) -> None:
         session = await self.validate_refresh_session(refresh_token)
-        await self.blacklist_access_token(session.access_token)
+        await self.blacklist_access_token(session)
+        self.cookie_service.delete_refresh_token()
+
+    async def deauthenticate_everywhere(self, user_id: int) -> None:
+        await self.blacklist_service.revoke_all(user_id)
+        await self.repo.delete_all_by_user_id(user_id)
         self.cookie_service.delete_refresh_token()
 
     async def validate_refresh_session(
@@ -103,10 +172,8 @@ class Authenticator:
         else:
             return session
 
-    async def blacklist_access_token(self, token: str) -> None:
-        with suppress(ExpiredSignatureError):
-            claims = self.jwt_service.verify(token)
-            await self.blacklist_service.blacklist(
-                jti=claims.meta.jti,
-                exp=claims.meta.exp
-            )
+    async def blacklist_access_token(self, session: RefreshSession) -> None:
+        await self.blacklist_service.blacklist(
+            jti=session.access_token_jti.hex,
+            exp=to_timestamp(session.access_token_expires_at)
+        )
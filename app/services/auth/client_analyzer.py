@@ -11,10 +11,10 @@ class ClientAnalyzer:
     request: Request
 
     @property
-    def ip_address(self) -> str:
+    def ip_address(self) -> str | None:
         if (address := self.request.client) is not None:
             return address.host
-        return ''
+        return None
 
     @property
     def user_agent(self) -> str:
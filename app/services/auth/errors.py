@@ -3,6 +3,7 @@ AuthError
     +-- LoginError
         +-- UserWithSuchEmailDoesNotExistError
         +-- IncorrectPasswordError
+        +-- LoginIsThrottledError
     +-- RegistrationError
         +-- EmailIsAlreadyTakenError
         +-- UsernameDiscriminatorsOutOfRange
@@ -39,6 +40,15 @@ class IncorrectPasswordError(LoginError):
     """
 
 
+class LoginIsThrottledError(LoginError):
+    """
+    Raised on login process
+    if too many attempts have failed for the email or the client address.
+    """
+
+    detail = 'Too many failed login attempts. Try again later.'
+
+
 class RegistrationError(AuthError):
     """ Common registration exception. """
     detail = 'Registration failed. Data is invalid.'
@@ -5,7 +5,10 @@ from fastapi import Depends
 
 from .authenticator import Authenticator
 from .base import BaseServerAuthService
+from .errors import LoginError
+from .throttler import LoginThrottler
 from .user import UserService
+from ...db.models import RefreshSession
 from ...schemas.auth import AuthResult
 from ...schemas.user import (
     UserInCreate,
@@ -23,6 +26,7 @@ logger = logging.getLogger(__name__)
 class AuthService(BaseServerAuthService):
     user_service: UserService = Depends()
     authenticator: Authenticator = Depends()
+    throttler: LoginThrottler = Depends()
 
     async def register(  # type: ignore[override]
         self,
@@ -35,14 +39,30 @@ class AuthService(BaseServerAuthService):
         self,
         user_in_login: UserInLogin
     ) -> AuthResult:
-        user = await self.user_service.verify(user_in_login)
+        await self.throttler.check(user_in_login.email)
+        try:
+            user = await self.user_service.verify(user_in_login)
+        except LoginError:
+            await self.throttler.register_failure(user_in_login.email)
+            raise
+        await self.throttler.reset(user_in_login.email)
         return await self.authenticator.authenticate(user)
 
     async def refresh(  # type: ignore[override]
         self,
         token: str
     ) -> AuthResult:
-        session = await self.authenticator.validate_refresh_session(token)
-        await self.authenticator.blacklist_access_token(session.access_token)
-        user = await self.user_service.repo.get_one_by_pk(session.user_id)
-        return await self.authenticator.authenticate(user)
+        return await self.authenticator.reauthenticate(token)
+
+    async def get_sessions(
+        self,
+        user_id: int,
+        *,
+        limit: int,
+        offset: int = 0
+    ) -> list[RefreshSession]:
+        return await self.authenticator.get_sessions(
+            user_id,
+            limit=limit,
+            offset=offset
+        )
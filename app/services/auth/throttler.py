@@ -0,0 +1,110 @@
+from dataclasses import dataclass
+from typing import ClassVar
+
+from fastapi import Depends
+
+from .client_analyzer import ClientAnalyzer
+from .errors import LoginIsThrottledError
+from ..redis_ import (
+    RedisClient,
+    RedisClientCache
+)
+from ...api.dependencies.markers import (
+    AppSettingsMarker,
+    RedisClientCacheMarker,
+    RedisMarker
+)
+from ...core.settings import AppSettings
+
+
+__all__ = ['LoginThrottler']
+
+
+REGISTER_FAILURE_SCRIPT = """
+local window = tonumber(ARGV[1])
+local base_lockout = tonumber(ARGV[2])
+local max_lockout = tonumber(ARGV[3])
+for i = 1, #KEYS, 2 do
+    local limit = tonumber(ARGV[3 + (i + 1) / 2])
+    local failures = redis.call('INCR', KEYS[i])
+    local ttl = window
+    if failures >= limit then
+        local lockout = math.min(
+            base_lockout * 2 ^ (failures - limit),
+            max_lockout
+        )
+        redis.call('SET', KEYS[i + 1], failures, 'EX', lockout)
+        ttl = window + lockout
+    end
+    redis.call('EXPIRE', KEYS[i], ttl)
+end
+"""
+"""
+Counts a failure for every (failures key, lockout key) pair
+and locks the subject out for exponentially growing periods
+once its limit is reached.
+"""
+
+
+@dataclass
+class LoginThrottler:
+    failures_key_pattern: ClassVar[str] = 'login:failures:{subject}'
+    lockout_key_pattern: ClassVar[str] = 'login:lockout:{subject}'
+    redis: RedisClient = Depends(RedisMarker)
+    cache: RedisClientCache = Depends(RedisClientCacheMarker)
+    settings: AppSettings = Depends(AppSettingsMarker)
+    client_analyzer: ClientAnalyzer = Depends()
+
+    @staticmethod
+    def format_failures_key(subject: str) -> str:
+        return LoginThrottler.failures_key_pattern.format(subject=subject)
+
+    @staticmethod
+    def format_lockout_key(subject: str) -> str:
+        return LoginThrottler.lockout_key_pattern.format(subject=subject)
+
+    def _subjects(self, email: str) -> list[tuple[str, int]]:
+        subjects = [
+            (f'email:{email}', self.settings.login_failures_limit_per_email)
+        ]
+        if ip_address := self.client_analyzer.ip_address:
+            subjects.append(
+                (f'ip:{ip_address}', self.settings.login_failures_limit_per_ip)
+            )
+        return subjects
+
+    async def check(self, email: str) -> None:
+        lockout_keys = [
+            self.format_lockout_key(subject)
+            for subject, _ in self._subjects(email)
+        ]
+        # Lockouts are rare and read on every login,
+        # so they are served from the client cache when it is enabled.
+        lockouts = await self.cache.mget(lockout_keys)
+        if any(lockout is not None for lockout in lockouts):
+            raise LoginIsThrottledError
+
+    async def register_failure(self, email: str) -> None:
+        keys: list[str] = []
+        limits: list[int] = []
+        for subject, limit in self._subjects(email):
+            keys += [
+                self.format_failures_key(subject),
+                self.format_lockout_key(subject)
+            ]
+            limits.append(limit)
+        script = self.redis.register_script(REGISTER_FAILURE_SCRIPT)
+        await script(
+            keys=keys,
+            args=[
+                self.settings.login_failures_window_in_seconds,
+                self.settings.login_lockout_base_in_seconds,
+                self.settings.login_lockout_max_in_seconds,
+                *limits
+            ]
+        )
+        # Drop the local copies at once, without waiting for invalidation.
+        self.cache.invalidate(keys[1::2])
+
+    async def reset(self, email: str) -> None:
+        await self.redis.delete(self.format_failures_key(f'email:{email}'))
@@ -44,8 +44,16 @@ class UserService:
         user = await self.get_for_login(payload.email)
         if not self.pwd_context.verify(payload.password, user.hashed_password):
             raise IncorrectPasswordError
+        if self.pwd_context.needs_update(user.hashed_password):
+            user = await self.rehash(user, payload.password)
         return user
 
+    async def rehash(self, user: User, password: str) -> User:
+        return await self.repo.update_one_by_pk(
+            user.id,
+            hashed_password=self.pwd_context.hash(password)
+        )
+
     async def get_for_login(self, email: str) -> User:
         try:
             user = await self.repo.get_one_by_email(email)
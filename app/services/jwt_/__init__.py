@@ -1,8 +1,18 @@
 from .blacklist import JWTBlacklistService
+from .cache import (
+    JWTClaimsCache,
+    JWTClaimsCacheState
+)
+from .local import LocalJWTBlacklist
 from .service import JWTService
+from .state import JWTBlacklistState
 
 
 __all__ = [
     'JWTBlacklistService',
-    'JWTService'
+    'JWTBlacklistState',
+    'JWTClaimsCache',
+    'JWTClaimsCacheState',
+    'JWTService',
+    'LocalJWTBlacklist'
 ]
@@ -4,27 +4,67 @@ from typing import ClassVar
 
 from fastapi import Depends
 
+from .local import (
+    LocalJWTBlacklist,
+    live_token_version
+)
 from ...api.dependencies.markers import (
     AppSettingsMarker,
+    LocalJWTBlacklistMarker,
     RedisMarker
 )
 from ...core.settings import AppSettings
+from ...dtos.jwt_ import JWTClaims
 from ...services.redis_ import RedisClient
 
 
 __all__ = ['JWTBlacklistService']
 
 
+REVOKE_ALL_SCRIPT = """
+local current = tonumber(redis.call('GET', KEYS[1]) or '0')
+local version = math.max(current + 1, tonumber(ARGV[3]))
+redis.call('SET', KEYS[1], version, 'EX', ARGV[4])
+redis.call('PUBLISH', ARGV[1], ARGV[2] .. ':' .. version)
+return version
+"""
+"""
+Bumps the user's token version and announces it to the workers.
+
+The version is at least the current time, so it keeps growing
+after the key has expired.
+"""
+
+
 @dataclass
 class JWTBlacklistService:
     key_pattern: ClassVar[str] = 'blacklist:{jti}'
+    channel: ClassVar[str] = 'blacklist'
+    token_version_key_pattern: ClassVar[str] = 'token_version:{user_id}'
+    token_versions_channel: ClassVar[str] = 'token_versions'
     redis: RedisClient = Depends(RedisMarker)
     settings: AppSettings = Depends(AppSettingsMarker)
+    local: LocalJWTBlacklist = Depends(LocalJWTBlacklistMarker)
 
     @staticmethod
     def format_key(jti: str) -> str:
         return JWTBlacklistService.key_pattern.format(jti=jti)
 
+    @staticmethod
+    def format_token_version_key(user_id: int | str) -> str:
+        return JWTBlacklistService.token_version_key_pattern.format(
+            user_id=user_id
+        )
+
+    @staticmethod
+    def format_message(jti: str, exp: int) -> str:
+        return f'{jti}:{exp}'
+
+    @staticmethod
+    def parse_message(message: bytes) -> tuple[str, int]:
+        jti, _, exp = message.decode().partition(':')
+        return jti, int(exp)
+
     @property
     def ex(self) -> int:
         return self.settings.access_token_expire_in_seconds
@@ -32,7 +72,56 @@ class JWTBlacklistService:
     async def blacklist(self, jti: str, exp: int) -> None:
         if exp < time.time():
             return
-        await self.redis.set(self.format_key(jti), 0, self.ex)
+        self.local.add(jti, exp)
+        async with self.redis.pipeline(transaction=False) as pipe:
+            pipe.set(self.format_key(jti), exp, self.ex)
+            pipe.publish(self.channel, self.format_message(jti, exp))
+            await pipe.execute()
 
     async def check_is_blacklisted(self, jti: str) -> bool:
+        if self.local.is_synced:
+            return jti in self.local
         return bool(await self.redis.exists(self.format_key(jti)))
+
+    async def check_is_revoked(self, claims: JWTClaims) -> bool:
+        """
+        Check the jti against the blacklist
+        and the token version against the user's current one.
+        """
+
+        if self.local.is_synced:
+            return (
+                claims.meta.jti in self.local
+                or claims.user.token_version
+                < self.local.get_token_version(claims.user.id)
+            )
+        async with self.redis.pipeline(transaction=False) as pipe:
+            pipe.exists(self.format_key(claims.meta.jti))
+            pipe.get(self.format_token_version_key(claims.user.id))
+            is_blacklisted, version = await pipe.execute()
+        return (
+            bool(is_blacklisted)
+            or claims.user.token_version
+            < live_token_version(int(version or 0), self.ex)
+        )
+
+    async def get_token_version(self, user_id: int) -> int:
+        if self.local.is_synced:
+            return self.local.get_token_version(user_id)
+        version = await self.redis.get(self.format_token_version_key(user_id))
+        return live_token_version(int(version or 0), self.ex)
+
+    async def revoke_all(self, user_id: int) -> None:
+        """ Revoke every access token issued to the user so far. """
+
+        script = self.redis.register_script(REVOKE_ALL_SCRIPT)
+        version = await script(
+            keys=[self.format_token_version_key(user_id)],
+            args=[
+                self.token_versions_channel,
+                user_id,
+                int(time.time()),
+                self.settings.refresh_token_expire_in_seconds
+            ]
+        )
+        self.local.set_token_version(user_id, int(version))
@@ -0,0 +1,93 @@
+import hashlib
+import logging
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+
+from ...dtos.jwt_ import JWTClaims
+
+
+__all__ = [
+    'JWTClaimsCache',
+    'JWTClaimsCacheInfo',
+    'JWTClaimsCacheState'
+]
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class JWTClaimsCacheInfo:
+    hits: int
+    misses: int
+    size: int
+    max_size: int
+
+
+class JWTClaimsCache:
+    """
+    Bounded LRU of the verified token claims.
+
+    Entries are keyed by the token digest and live until the token expires,
+    so a repeated bearer token skips the signature check and decoding.
+    """
+
+    def __init__(self, max_size: int) -> None:
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[bytes, JWTClaims] = OrderedDict()
+
+    @staticmethod
+    def digest(token: str) -> bytes:
+        return hashlib.sha256(token.encode()).digest()
+
+    def get(self, token: str) -> JWTClaims | None:
+        key = self.digest(token)
+        if (claims := self._entries.get(key)) is None:
+            self.misses += 1
+            return None
+        if claims.meta.exp <= time.time():
+            del self._entries[key]
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return claims
+
+    def set(self, token: str, claims: JWTClaims) -> None:
+        if self.max_size <= 0:
+            return
+        key = self.digest(token)
+        self._entries[key] = claims
+        self._entries.move_to_end(key)
+        if len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def info(self) -> JWTClaimsCacheInfo:
+        return JWTClaimsCacheInfo(
+            hits=self.hits,
+            misses=self.misses,
+            size=len(self._entries),
+            max_size=self.max_size
+        )
+
+
+@dataclass
+class JWTClaimsCacheState:
+    max_size: int
+
+    def __post_init__(self) -> None:
+        self.cache = JWTClaimsCache(self.max_size)
+        logger.info('JWT claims cache state has been set.')
+
+    def __call__(self) -> JWTClaimsCache:
+        return self.cache
+
+    def shutdown(self) -> None:
+        logger.info(
+            f'JWT claims cache state has been shutdown [{self.cache.info()}].'
+        )
@@ -0,0 +1,79 @@
+import time
+
+
+__all__ = [
+    'LocalJWTBlacklist',
+    'live_token_version'
+]
+
+PRUNE_INTERVAL_IN_SECONDS = 60
+
+
+def live_token_version(version: int, ttl_in_seconds: int) -> int:
+    """
+    Token versions are at least the time of the revocation in seconds.
+    Once one is older than the access token lifetime, every token
+    it revoked has expired, so it counts as no version at all.
+    """
+    return version if version > time.time() - ttl_in_seconds else 0
+
+
+class LocalJWTBlacklist:
+    """
+    Worker-local copy of the blacklisted jtis with their expiration
+    and of the users' token versions.
+
+    It is kept in sync by `JWTBlacklistState`.
+    Lookups must not trust it while `is_synced` is unset.
+    """
+
+    def __init__(self, token_version_ttl_in_seconds: int) -> None:
+        self.token_version_ttl_in_seconds = token_version_ttl_in_seconds
+        self.is_synced = False
+        self._entries: dict[str, int] = {}
+        self._token_versions: dict[int, int] = {}
+        self._next_prune_at = 0.0
+
+    def __contains__(self, jti: str) -> bool:
+        exp = self._entries.get(jti)
+        return exp is not None and exp > time.time()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def add(self, jti: str, exp: int) -> None:
+        self._entries[jti] = exp
+        self._prune_if_due()
+
+    def get_token_version(self, user_id: int) -> int:
+        return live_token_version(
+            self._token_versions.get(user_id, 0),
+            self.token_version_ttl_in_seconds
+        )
+
+    def set_token_version(self, user_id: int, version: int) -> None:
+        # Versions only grow, so a late message can not roll one back.
+        self._token_versions[user_id] = max(
+            version,
+            self.get_token_version(user_id)
+        )
+        self._prune_if_due()
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._token_versions.clear()
+
+    def _prune_if_due(self) -> None:
+        if (now := time.time()) < self._next_prune_at:
+            return
+        self._entries = {
+            jti: exp
+            for jti, exp in self._entries.items()
+            if exp > now
+        }
+        self._token_versions = {
+            user_id: version
+            for user_id, version in self._token_versions.items()
+            if live_token_version(version, self.token_version_ttl_in_seconds)
+        }
+        self._next_prune_at = now + PRUNE_INTERVAL_IN_SECONDS
@@ -46,37 +46,76 @@ class JWTService:
             [self.settings.jwt_algorithm]
         )
 
-    def generate(self, user: User) -> str:
-        claims = self._form_claims(user)
+    def generate(
+        self,
+        user: User,
+        *,
+        jti: str | None = None,
+        exp: int | None = None,
+        token_version: int = 0
+    ) -> str:
+        claims = self._form_claims(
+            user,
+            jti=jti,
+            exp=exp,
+            token_version=token_version
+        )
         return self._encode(claims)
 
-    def _form_claims(self, user: User) -> TokenClaims:
-        meta_claims = self._form_meta_claims(user)
-        user_claims = self._form_user_claims(user)
+    def _form_claims(
+        self,
+        user: User,
+        *,
+        jti: str | None = None,
+        exp: int | None = None,
+        token_version: int = 0
+    ) -> TokenClaims:
+        meta_claims = self._form_meta_claims(user, jti=jti, exp=exp)
+        user_claims = self._form_user_claims(user, token_version)
         return asdict(meta_claims) | asdict(user_claims)
 
     @staticmethod
-    def _form_user_claims(user: User) -> JWTUserClaims:
-        return to_dataclass(JWTUserClaims, user)
+    def _form_user_claims(user: User, token_version: int) -> JWTUserClaims:
+        return JWTUserClaims(
+            id=user.id,
+            email=user.email,
+            username=user.username,
+            is_superuser=user.is_superuser,
+            token_version=token_version
+        )
 
-    def _form_meta_claims(self, user: User) -> JWTMetaClaims:
+    def _form_meta_claims(
+        self,
+        user: User,
+        *,
+        jti: str | None = None,
+        exp: int | None = None
+    ) -> JWTMetaClaims:
         return JWTMetaClaims(
             sub=str(user.id),
-            exp=compute_expire(self.expire_in_seconds, as_int=True),
-            jti=self.generate_jti()
+            exp=exp or self.compute_expire(),
+            jti=jti or self.generate_jti()
         )
 
     @property
     def expire_in_seconds(self) -> int:
         return self.settings.access_token_expire_in_seconds
 
+    def compute_expire(self) -> int:
+        return compute_expire(self.expire_in_seconds, as_int=True)
+
     @staticmethod
     def generate_jti() -> str:
         return uuid4().hex
 
     def verify(self, token: str) -> JWTClaims:
         claims = self._decode(token)
-        return self._parse_claims(claims)
+        try:
+            return self._parse_claims(claims)
+        except KeyError as error:
+            raise jwt.InvalidTokenError(
+                f'Token is missing the "{error.args[0]}" claim.'
+            ) from error
 
     @staticmethod
     def _parse_claims(claims: TokenClaims) -> JWTClaims:
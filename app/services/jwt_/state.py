@@ -0,0 +1,169 @@
+import asyncio
+import logging
+import time
+from contextlib import suppress
+from dataclasses import dataclass
+from typing import (
+    Any,
+    Callable
+)
+
+from redis.asyncio.client import PubSub
+from redis.exceptions import (
+    ConnectionError as RedisConnectionError,
+    RedisError
+)
+
+from .blacklist import JWTBlacklistService
+from .local import LocalJWTBlacklist
+from ..redis_ import RedisClient
+
+
+__all__ = ['JWTBlacklistState']
+
+logger = logging.getLogger(__name__)
+
+PING_INTERVAL_IN_SECONDS = 5.0
+RESUBSCRIBE_DELAY_IN_SECONDS = 1.0
+SEED_BATCH_SIZE = 1000
+CHANNELS = (
+    JWTBlacklistService.channel,
+    JWTBlacklistService.token_versions_channel
+)
+
+
+@dataclass
+class JWTBlacklistState:
+    """
+    Keeps the worker-local blacklist and token versions in sync with Redis.
+
+    The subscription to the channels is made first,
+    then the existing records are loaded,
+    so no blacklisting is lost in between.
+    Whenever the subscription breaks the local blacklist is marked unsynced
+    and lookups fall back to Redis until it is restored.
+    """
+
+    redis: RedisClient
+    exp_in_seconds: int
+    """
+    Expiration assumed for records that do not store their own
+    and the lifetime of the token versions.
+    """
+
+    def __post_init__(self) -> None:
+        self.blacklist = LocalJWTBlacklist(self.exp_in_seconds)
+        self._task = asyncio.create_task(self._sync())
+        logger.info('JWT blacklist state has been set.')
+
+    def __call__(self) -> LocalJWTBlacklist:
+        return self.blacklist
+
+    async def shutdown(self) -> None:
+        self._task.cancel()
+        with suppress(asyncio.CancelledError):
+            await self._task
+        logger.info('JWT blacklist state has been shutdown.')
+
+    async def _sync(self) -> None:
+        while True:
+            try:
+                async with self.redis.pubsub() as pubsub:
+                    await pubsub.subscribe(*CHANNELS)
+                    await self._consume(pubsub)
+            except (RedisError, OSError) as error:
+                logger.warning(f'JWT blacklist sync has been broken: {error}.')
+            finally:
+                self.blacklist.is_synced = False
+            await asyncio.sleep(RESUBSCRIBE_DELAY_IN_SECONDS)
+
+    async def _consume(self, pubsub: PubSub) -> None:
+        last_seen_at = time.monotonic()
+        while True:
+            message = await pubsub.get_message(
+                timeout=PING_INTERVAL_IN_SECONDS
+            )
+            now = time.monotonic()
+            if message is None:
+                if now - last_seen_at > 2 * PING_INTERVAL_IN_SECONDS:
+                    raise RedisConnectionError('Subscription is stale.')
+                await pubsub.ping()
+                continue
+            last_seen_at = now
+            await self._handle(message)
+
+    async def _handle(self, message: dict[str, Any]) -> None:
+        if message['type'] == 'subscribe':
+            # Seed once every channel is confirmed.
+            if message['data'] == len(CHANNELS):
+                await self._seed()
+                self.blacklist.is_synced = True
+                logger.info(
+                    'JWT blacklist has been synced '
+                    f'[{len(self.blacklist)} records].'
+                )
+        elif message['type'] == 'message':
+            subject, value = JWTBlacklistService.parse_message(message['data'])
+            if message['channel'].decode() == JWTBlacklistService.channel:
+                self.blacklist.add(subject, value)
+            else:
+                self.blacklist.set_token_version(int(subject), value)
+
+    async def _seed(self) -> None:
+        self.blacklist.clear()
+        await self._scan(
+            JWTBlacklistService.format_key(''),
+            self._load_blacklist
+        )
+        await self._scan(
+            JWTBlacklistService.format_token_version_key(''),
+            self._load_token_versions
+        )
+
+    async def _scan(
+        self,
+        prefix: str,
+        load: Callable[[list[str], list[bytes | None]], None]
+    ) -> None:
+        keys: list[bytes] = []
+        async for key in self.redis.scan_iter(
+            match=f'{prefix}*',
+            count=SEED_BATCH_SIZE
+        ):
+            keys.append(key)
+            if len(keys) >= SEED_BATCH_SIZE:
+                await self._load(prefix, keys, load)
+                keys = []
+        if keys:
+            await self._load(prefix, keys, load)
+
+    async def _load(
+        self,
+        prefix: str,
+        keys: list[bytes],
+        load: Callable[[list[str], list[bytes | None]], None]
+    ) -> None:
+        values = await self.redis.mget(keys)
+        load([key.decode().removeprefix(prefix) for key in keys], values)
+
+    def _load_blacklist(
+        self,
+        jtis: list[str],
+        values: list[bytes | None]
+    ) -> None:
+        default_exp = int(time.time()) + self.exp_in_seconds
+        for jti, value in zip(jtis, values):
+            if value is None:
+                continue
+            # Records written before the sync stored no expiration.
+            exp = int(value) or default_exp
+            self.blacklist.add(jti, exp)
+
+    def _load_token_versions(
+        self,
+        user_ids: list[str],
+        values: list[bytes | None]
+    ) -> None:
+        for user_id, value in zip(user_ids, values):
+            if value is not None:
+                self.blacklist.set_token_version(int(user_id), int(value))
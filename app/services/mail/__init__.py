@@ -1,8 +1,16 @@
+from .queue import MailQueue
+from .renderer import MailRenderer
+from .sender import MailSender
 from .service import MailService
 from .state import MailState
+from .worker import MailWorker
 
 
 __all__ = [
+    'MailQueue',
+    'MailRenderer',
+    'MailSender',
     'MailService',
-    'MailState'
+    'MailState',
+    'MailWorker'
 ]
@@ -0,0 +1,50 @@
+import logging
+from dataclasses import dataclass
+from typing import ClassVar
+
+from fastapi import Depends
+from fastapi_mail import MessageSchema
+
+from ..redis_ import RedisClient
+from ...api.dependencies.markers import RedisMarker
+
+
+__all__ = ['MailQueue']
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class MailQueue:
+    """
+    Redis stream of mails to be delivered by the mail workers.
+
+    Entries hold the message and the template name, not the rendered mail,
+    so the web workers spend no time on rendering and SMTP.
+    """
+
+    stream: ClassVar[str] = 'mail:queue'
+    group: ClassVar[str] = 'mail:workers'
+    retries: ClassVar[str] = 'mail:retries'
+    """ Sorted set of mails to be returned to the stream at their score. """
+    dead_letters: ClassVar[str] = 'mail:dead'
+    redis: RedisClient = Depends(RedisMarker)
+
+    async def push(
+        self,
+        message: MessageSchema,
+        template_name: str | None = None
+    ) -> None:
+        if message.attachments:
+            raise ValueError('Mails with attachments can not be queued.')
+        await self.redis.xadd(
+            self.stream,
+            {
+                'message': message.json(exclude={'attachments'}),
+                'template_name': template_name or '',
+                'attempts': 0
+            }
+        )
+        logger.info(
+            f'Mail for {", ".join(message.recipients)} has been queued.'
+        )
@@ -0,0 +1,35 @@
+from fastapi_mail import (
+    ConnectionConfig as MailConnectionSettings,
+    FastMail,
+    MessageSchema
+)
+from fastapi_mail.connection import Connection
+from fastapi_mail.fastmail import email_dispatched
+
+from .renderer import MailRenderer
+
+
+__all__ = ['MailSender']
+
+
+class MailSender(FastMail):  # type: ignore[misc]
+    """ `FastMail` building mails with the precompiled templates. """
+
+    def __init__(
+        self,
+        config: MailConnectionSettings,
+        renderer: MailRenderer
+    ) -> None:
+        super().__init__(config)
+        self.renderer = renderer
+
+    async def send_message(
+        self,
+        message: MessageSchema,
+        template_name: str | None = None
+    ) -> None:
+        mail = await self.renderer.render(message, template_name)
+        async with Connection(self.config) as session:
+            if not self.config.SUPPRESS_SEND:
+                await session.session.send_message(mail)
+            email_dispatched.send(mail)
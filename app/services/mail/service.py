@@ -11,7 +11,13 @@ from fastapi_mail import (
     MessageSchema
 )
 
-from ...api.dependencies.markers import MailSenderMarker
+from .queue import MailQueue
+from ..metrics import run_tracked
+from ...api.dependencies.markers import (
+    AppSettingsMarker,
+    MailSenderMarker
+)
+from ...core.settings import AppSettings
 from ...resources.mail.subjects import (
     SUBJECT_FOR_THANK,
     SUBJECT_FOR_VERIFICATION
@@ -39,14 +45,33 @@ logger = logging.getLogger(__name__)
 class MailService:
     background_tasks: BackgroundTasks
     mail_sender: FastMail = Depends(MailSenderMarker)
+    mail_queue: MailQueue = Depends()
+    settings: AppSettings = Depends(AppSettingsMarker)
 
-    def send_verification(
+    async def send_message(
+        self,
+        message: MessageSchema,
+        template_name: str | None = None
+    ) -> None:
+        """ Queue the mail for the mail workers or send it in background. """
+
+        if self.settings.mail_use_queue:
+            await self.mail_queue.push(message, template_name)
+        else:
+            self.background_tasks.add_task(
+                run_tracked,
+                'mail',
+                self.mail_sender.send_message,
+                message=message,
+                template_name=template_name
+            )
+
+    async def send_verification(
         self,
         payload: VerificationInCreate,
         code: str
     ) -> None:
-        self.background_tasks.add_task(
-            self.mail_sender.send_message,
+        await self.send_message(
             message=MessageSchema(
                 subject=SUBJECT_FOR_VERIFICATION,
                 recipients=[payload.email],
@@ -60,14 +85,10 @@ class MailService:
             ),
             template_name='verification.html'
         )
-        logger.info(
-            f'Verification mail sending for {payload.email} '
-            'has been pushed in background tasks.'
-        )
+        logger.info(f'Verification mail for {payload.email} has been scheduled.')
 
-    def send_thank_for_registering(self, user: UserInResponse) -> None:
-        self.background_tasks.add_task(
-            self.mail_sender.send_message,
+    async def send_thank_for_registering(self, user: UserInResponse) -> None:
+        await self.send_message(
             message=MessageSchema(
                 subject=SUBJECT_FOR_THANK,
                 recipients=[user.email],
@@ -75,7 +96,4 @@ class MailService:
             ),
             template_name='thank.html'
         )
-        logger.info(
-            f'Thank mail sending for {user.email} '
-            'has been pushed in background tasks.'
-        )
+        logger.info(f'Thank mail for {user.email} has been scheduled.')
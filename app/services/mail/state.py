@@ -7,6 +7,9 @@ from fastapi_mail import (
     FastMail
 )
 
+from .renderer import MailRenderer
+from .sender import MailSender
+
 
 __all__ = ['MailState']
 
@@ -19,7 +22,8 @@ class MailState:
     settings: MailConnectionSettings
 
     def __post_init__(self) -> None:
-        self.sender = FastMail(self.settings)
+        self.renderer = MailRenderer(self.settings)
+        self.sender = MailSender(self.settings, self.renderer)
         logger.info('Mail state (sender) has been set.')
 
         if self.settings.SUPPRESS_SEND:
@@ -0,0 +1,252 @@
+import json
+import logging
+import os
+import socket
+import time
+from collections.abc import Sequence
+from dataclasses import (
+    dataclass,
+    field
+)
+from typing import (
+    TYPE_CHECKING,
+    TypeAlias,
+    cast
+)
+
+import aiosmtplib
+from fastapi_mail import (
+    ConnectionConfig as MailConnectionSettings,
+    MessageSchema
+)
+from fastapi_mail.fastmail import email_dispatched
+from redis.asyncio.client import Pipeline
+from redis.exceptions import ResponseError
+
+from .queue import MailQueue
+from .renderer import MailRenderer
+from ..redis_ import RedisClient
+from ...core.settings.dataclasses_ import MailQueueSettings
+
+
+if TYPE_CHECKING:
+    RedisPipeline: TypeAlias = Pipeline[bytes]
+else:
+    RedisPipeline: TypeAlias = Pipeline
+
+__all__ = ['MailWorker']
+
+logger = logging.getLogger(__name__)
+
+Entry = tuple[bytes, dict[bytes, bytes] | None]
+
+READ_BLOCK_IN_MS = 1000
+
+PROMOTE_RETRIES_SCRIPT = """
+local due = redis.call(
+    'ZRANGEBYSCORE', KEYS[1], '-inf', ARGV[1], 'LIMIT', 0, ARGV[2]
+)
+for _, payload in ipairs(due) do
+    local entry = cjson.decode(payload)
+    redis.call(
+        'XADD', KEYS[2], '*',
+        'message', entry.message,
+        'template_name', entry.template_name,
+        'attempts', entry.attempts
+    )
+    redis.call('ZREM', KEYS[1], payload)
+end
+return #due
+"""
+""" Moves the mails due for a retry back to the stream. """
+
+
+def _default_consumer() -> str:
+    return f'{socket.gethostname()}:{os.getpid()}'
+
+
+@dataclass
+class MailWorker:
+    """
+    Delivers the queued mails over a persistent SMTP connection.
+
+    Mails are read by the consumer group in batches
+    and acknowledged once the whole batch is handled.
+    Failed mails are retried with exponential backoff
+    and moved to the dead-letter stream after the last attempt.
+    Mails left pending by a dead worker are claimed once idle for long,
+    so every mail is delivered at least once.
+    """
+
+    redis: RedisClient
+    mail_settings: MailConnectionSettings
+    settings: MailQueueSettings
+    consumer: str = field(default_factory=_default_consumer)
+
+    def __post_init__(self) -> None:
+        self.renderer = MailRenderer(self.mail_settings)
+        self._smtp: aiosmtplib.SMTP | None = None
+        self._is_stopping = False
+
+    async def run(self) -> None:
+        await self.create_group()
+        logger.info(f'Mail worker [{self.consumer}] has been started.')
+        try:
+            while not self._is_stopping:
+                await self.promote_retries()
+                entries = await self.claim_stale()
+                if not entries:
+                    entries = await self.read()
+                await self.process(entries)
+        finally:
+            await self.disconnect()
+            logger.info(f'Mail worker [{self.consumer}] has been stopped.')
+
+    def stop(self) -> None:
+        """
+        Stop once the batch in hand is acknowledged.
+
+        Cancelling the worker instead may leave the batch pending
+        until it is claimed, and the blocking read is not reliably
+        interrupted by cancellation in redis-py.
+        """
+        self._is_stopping = True
+
+    async def create_group(self) -> None:
+        try:
+            await self.redis.xgroup_create(
+                MailQueue.stream,
+                MailQueue.group,
+                id='0',
+                mkstream=True
+            )
+        except ResponseError as error:
+            if 'BUSYGROUP' not in str(error):
+                raise
+
+    async def read(self) -> list[Entry]:
+        response = await self.redis.xreadgroup(
+            MailQueue.group,
+            self.consumer,
+            {MailQueue.stream: '>'},
+            count=self.settings.batch_size,
+            block=READ_BLOCK_IN_MS
+        )
+        return cast(list[Entry], response[0][1]) if response else []
+
+    async def claim_stale(self) -> list[Entry]:
+        response = await self.redis.xautoclaim(
+            MailQueue.stream,
+            MailQueue.group,
+            self.consumer,
+            min_idle_time=self.settings.claim_idle_in_seconds * 1000,
+            count=self.settings.batch_size
+        )
+        return cast(list[Entry], response[1])
+
+    async def promote_retries(self) -> int:
+        script = self.redis.register_script(PROMOTE_RETRIES_SCRIPT)
+        promoted = await script(
+            keys=[MailQueue.retries, MailQueue.stream],
+            args=[time.time(), self.settings.batch_size]
+        )
+        return cast(int, promoted)
+
+    async def process(self, entries: Sequence[Entry]) -> None:
+        if not entries:
+            return
+        failures: list[tuple[bytes, dict[bytes, bytes], Exception]] = []
+        for entry_id, fields in entries:
+            # Entries deleted while pending are only acknowledged.
+            if fields is None:
+                continue
+            try:
+                await self.deliver(fields)
+            except Exception as error:
+                # A broken mail must not hold up the rest of the queue.
+                logger.warning(f'Mail [{entry_id.decode()}] failed: {error!r}.')
+                failures.append((entry_id, fields, error))
+                await self.disconnect()
+        entry_ids = [entry_id for entry_id, _ in entries]
+        async with self.redis.pipeline(transaction=True) as pipe:
+            for failed_id, failed_fields, failure in failures:
+                self._schedule_retry(pipe, failed_id, failed_fields, failure)
+            pipe.xack(MailQueue.stream, MailQueue.group, *entry_ids)
+            pipe.xdel(MailQueue.stream, *entry_ids)
+            await pipe.execute()
+        logger.info(
+            f'Mail batch has been processed '
+            f'[{len(entries) - len(failures)} sent, {len(failures)} failed].'
+        )
+
+    def _schedule_retry(
+        self,
+        pipe: RedisPipeline,
+        entry_id: bytes,
+        fields: dict[bytes, bytes],
+        error: Exception
+    ) -> None:
+        attempts = int(fields[b'attempts']) + 1
+        if attempts >= self.settings.max_attempts:
+            pipe.xadd(
+                MailQueue.dead_letters,
+                {**fields, b'attempts': attempts, b'error': repr(error)}
+            )
+            logger.error(
+                f'Mail [{entry_id.decode()}] has been dead-lettered '
+                f'after {attempts} attempts.'
+            )
+            return
+        # The entry id keeps equal mails distinct in the set.
+        payload = json.dumps({
+            'id': entry_id.decode(),
+            'message': fields[b'message'].decode(),
+            'template_name': fields[b'template_name'].decode(),
+            'attempts': attempts
+        })
+        delay = self.settings.retry_delay_in_seconds * 2 ** (attempts - 1)
+        pipe.zadd(MailQueue.retries, {payload: time.time() + delay})
+
+    async def deliver(self, fields: dict[bytes, bytes]) -> None:
+        message = MessageSchema.parse_raw(fields[b'message'])
+        mail = await self.renderer.render(
+            message,
+            fields[b'template_name'].decode() or None
+        )
+        if not self.mail_settings.SUPPRESS_SEND:
+            try:
+                await (await self.connect()).send_message(mail)
+            except aiosmtplib.SMTPServerDisconnected:
+                # The server may have dropped the idle connection.
+                await self.disconnect()
+                await (await self.connect()).send_message(mail)
+        email_dispatched.send(mail)
+
+    async def connect(self) -> aiosmtplib.SMTP:
+        if self._smtp is not None and self._smtp.is_connected:
+            return self._smtp
+        smtp = aiosmtplib.SMTP(
+            hostname=self.mail_settings.MAIL_SERVER,
+            port=self.mail_settings.MAIL_PORT,
+            use_tls=self.mail_settings.MAIL_SSL,
+            start_tls=self.mail_settings.MAIL_TLS,
+            validate_certs=self.mail_settings.VALIDATE_CERTS
+        )
+        await smtp.connect()
+        if self.mail_settings.USE_CREDENTIALS:
+            await smtp.login(
+                self.mail_settings.MAIL_USERNAME,
+                self.mail_settings.MAIL_PASSWORD
+            )
+        self._smtp = smtp
+        logger.info('SMTP connection has been established.')
+        return smtp
+
+    async def disconnect(self) -> None:
+        if (smtp := self._smtp) is None:
+            return
+        self._smtp = None
+        try:
+            await smtp.quit()
+        except (aiosmtplib.SMTPException, OSError):
+            smtp.close()
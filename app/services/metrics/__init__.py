@@ -0,0 +1,14 @@
+from .exposition import (
+    mark_worker_dead,
+    render_metrics
+)
+from .state import MetricsState
+from .tasks import run_tracked
+
+
+__all__ = [
+    'MetricsState',
+    'mark_worker_dead',
+    'render_metrics',
+    'run_tracked'
+]
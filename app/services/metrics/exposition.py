@@ -0,0 +1,34 @@
+import os
+from typing import Any
+
+from prometheus_client import (
+    REGISTRY,
+    CollectorRegistry,
+    generate_latest,
+    multiprocess
+)
+
+from ...utils.prometheus_ import MULTIPROCESS_DIR_ENV
+
+
+__all__ = [
+    'render_metrics',
+    'mark_worker_dead'
+]
+
+
+def render_metrics() -> bytes:
+    """ Render the metrics of all the workers, or of this process only. """
+
+    if MULTIPROCESS_DIR_ENV not in os.environ:
+        return generate_latest(REGISTRY)
+    registry = CollectorRegistry()
+    multiprocess.MultiProcessCollector(registry)  # type: ignore[no-untyped-call]
+    return generate_latest(registry)
+
+
+def mark_worker_dead(server: Any, worker: Any) -> None:
+    """ Gunicorn `child_exit` hook dropping the live gauges of the worker. """
+
+    if MULTIPROCESS_DIR_ENV in os.environ:
+        multiprocess.mark_process_dead(worker.pid)  # type: ignore[no-untyped-call]
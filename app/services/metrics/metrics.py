@@ -0,0 +1,84 @@
+from prometheus_client import (
+    Counter,
+    Gauge,
+    Histogram
+)
+
+
+__all__ = [
+    'HTTP_REQUEST_DURATION',
+    'HTTP_REQUESTS_IN_FLIGHT',
+    'DB_POOL_SIZE',
+    'DB_POOL_CONNECTIONS',
+    'REDIS_POOL_SIZE',
+    'REDIS_POOL_CONNECTIONS',
+    'REDIS_POOL_EXHAUSTED',
+    'REDIS_POOL_TIMEOUTS',
+    'PASSWORD_HASH_DURATION',
+    'BACKGROUND_TASKS_IN_PROGRESS',
+    'BACKGROUND_TASKS'
+]
+
+# Gauges are kept per worker (`liveall`) where the saturation of each one
+# matters, and summed (`livesum`) where only the total does.
+
+HTTP_REQUEST_DURATION = Histogram(
+    'http_request_duration_seconds',
+    'Time to respond, by the route template.',
+    ['method', 'route', 'status']
+)
+HTTP_REQUESTS_IN_FLIGHT = Gauge(
+    'http_requests_in_flight',
+    'Requests being handled.',
+    multiprocess_mode='livesum'
+)
+
+DB_POOL_SIZE = Gauge(
+    'db_pool_size',
+    'Connections the DB pool keeps, overflow aside.',
+    multiprocess_mode='liveall'
+)
+DB_POOL_CONNECTIONS = Gauge(
+    'db_pool_connections',
+    'DB pool connections by state: checked_out, idle or overflow.',
+    ['state'],
+    multiprocess_mode='liveall'
+)
+
+REDIS_POOL_SIZE = Gauge(
+    'redis_pool_size',
+    'Connections the Redis pool may open.',
+    multiprocess_mode='liveall'
+)
+REDIS_POOL_CONNECTIONS = Gauge(
+    'redis_pool_connections_in_use',
+    'Redis pool connections held by commands.',
+    multiprocess_mode='liveall'
+)
+REDIS_POOL_EXHAUSTED = Counter(
+    'redis_pool_exhausted',
+    'Redis connection acquisitions that had to wait.'
+)
+REDIS_POOL_TIMEOUTS = Counter(
+    'redis_pool_timeouts',
+    'Redis connection acquisitions that timed out.'
+)
+
+PASSWORD_HASH_DURATION = Histogram(
+    'password_hash_duration_seconds',
+    'Time bcrypt blocks the event loop, by operation: hash or verify.',
+    ['operation'],
+    buckets=(0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5)
+)
+
+BACKGROUND_TASKS_IN_PROGRESS = Gauge(
+    'background_tasks_in_progress',
+    'Background tasks being run after the response.',
+    ['task'],
+    multiprocess_mode='livesum'
+)
+BACKGROUND_TASKS = Counter(
+    'background_tasks',
+    'Background tasks run after the response, by result: ok or failed.',
+    ['task', 'result']
+)
@@ -0,0 +1,94 @@
+import asyncio
+import logging
+from contextlib import suppress
+from dataclasses import dataclass
+from typing import Protocol
+
+from .metrics import (
+    DB_POOL_CONNECTIONS,
+    DB_POOL_SIZE,
+    REDIS_POOL_CONNECTIONS,
+    REDIS_POOL_EXHAUSTED,
+    REDIS_POOL_SIZE,
+    REDIS_POOL_TIMEOUTS
+)
+from ..redis_.pool import InstrumentedConnectionPool
+
+
+__all__ = [
+    'DBPoolStatus',
+    'MetricsState'
+]
+
+logger = logging.getLogger(__name__)
+
+
+class DBPoolStatus(Protocol):
+    """ Status of the queue pool, which the stubs leave untyped. """
+
+    def size(self) -> int: ...
+
+    def checkedout(self) -> int: ...
+
+    def checkedin(self) -> int: ...
+
+    def overflow(self) -> int: ...
+
+
+@dataclass
+class MetricsState:
+    """
+    Samples the pools of the worker into the metrics.
+
+    In the multi-process mode a scrape reads the values the workers
+    have written, so every worker samples its pools on its own.
+    """
+
+    db_pool: DBPoolStatus
+    redis_pool: InstrumentedConnectionPool
+    sample_interval_in_seconds: float
+
+    def __post_init__(self) -> None:
+        self._redis_exhausted = 0
+        self._redis_timed_out = 0
+        self._task: asyncio.Task[None] | None = None
+
+    def start(self) -> None:
+        if self._task is None:
+            self.sample()
+            self._task = asyncio.create_task(self._sample_periodically())
+        logger.info('Metrics state has been started.')
+
+    def sample(self) -> None:
+        DB_POOL_SIZE.set(self.db_pool.size())
+        DB_POOL_CONNECTIONS.labels('checked_out').set(self.db_pool.checkedout())
+        DB_POOL_CONNECTIONS.labels('idle').set(self.db_pool.checkedin())
+        DB_POOL_CONNECTIONS.labels('overflow').set(
+            max(self.db_pool.overflow(), 0)
+        )
+
+        stats = self.redis_pool.stats()
+        REDIS_POOL_SIZE.set(stats.max_connections)
+        REDIS_POOL_CONNECTIONS.set(stats.in_use)
+        # The pool counts from zero again if it is reset.
+        REDIS_POOL_EXHAUSTED.inc(max(stats.exhausted - self._redis_exhausted, 0))
+        REDIS_POOL_TIMEOUTS.inc(max(stats.timed_out - self._redis_timed_out, 0))
+        self._redis_exhausted = stats.exhausted
+        self._redis_timed_out = stats.timed_out
+
+    async def _sample_periodically(self) -> None:
+        while True:
+            await asyncio.sleep(self.sample_interval_in_seconds)
+            try:
+                self.sample()
+            except Exception as error:
+                # The gauges would freeze if the task ended.
+                logger.exception('Pools have not been sampled.', exc_info=error)
+
+    async def shutdown(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            with suppress(asyncio.CancelledError):
+                await self._task
+            self._task = None
+        logger.info('Metrics state has been shutdown.')
@@ -0,0 +1,30 @@
+from collections.abc import (
+    Awaitable,
+    Callable
+)
+from typing import Any
+
+from .metrics import (
+    BACKGROUND_TASKS,
+    BACKGROUND_TASKS_IN_PROGRESS
+)
+
+
+__all__ = ['run_tracked']
+
+
+async def run_tracked(
+    name: str,
+    func: Callable[..., Awaitable[Any]],
+    *args: Any,
+    **kwargs: Any
+) -> None:
+    """ Run the background task, counting it under the name. """
+
+    result = 'failed'
+    with BACKGROUND_TASKS_IN_PROGRESS.labels(name).track_inprogress():
+        try:
+            await func(*args, **kwargs)
+            result = 'ok'
+        finally:
+            BACKGROUND_TASKS.labels(name, result).inc()
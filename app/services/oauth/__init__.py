@@ -1,11 +1,15 @@
 from .authorizer import OAuthAuthorizer
 from .service import OAuthService
 from .session import OAuthRequestSession
-from .state import OAuthState
+from .state import (
+    OAuthClients,
+    OAuthState
+)
 
 
 __all__ = [
     'OAuthAuthorizer',
+    'OAuthClients',
     'OAuthService',
     'OAuthRequestSession',
     'OAuthState'
@@ -1,10 +1,7 @@
 from collections.abc import Callable
 from dataclasses import dataclass
 
-from authlib.integrations.starlette_client import (
-    OAuth,
-    StarletteOAuth2App
-)
+from authlib.integrations.starlette_client import StarletteOAuth2App
 from authlib.oauth2.rfc6749 import OAuth2Token
 from authlib.oidc.core.claims import UserInfo
 from fastapi import (
@@ -13,6 +10,7 @@ from fastapi import (
 )
 
 from .mixins import CtxOAuthBackendMixin
+from .state import OAuthClients
 from .userinfo_ import USERINFO_CASTERS
 from ...api.dependencies.markers import OAuthMarker
 from ...dtos.oauth import OAuthUser
@@ -24,11 +22,11 @@ __all__ = ['OAuthAuthorizer']
 @dataclass
 class OAuthAuthorizer(CtxOAuthBackendMixin):
     request: Request
-    oauth: OAuth = Depends(OAuthMarker)
+    clients: OAuthClients = Depends(OAuthMarker)
 
     @property
     def client(self) -> StarletteOAuth2App:
-        return self.oauth.create_client(self.backend)
+        return self.clients[self.backend]
 
     async def get_oauth_user(self) -> OAuthUser:
         userinfo = await self.get_userinfo()
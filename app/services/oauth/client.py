@@ -0,0 +1,25 @@
+from authlib.integrations.starlette_client import StarletteOAuth2App
+
+from .jwks import (
+    JWKSCache,
+    JWKSet
+)
+
+
+__all__ = ['OAuthClient']
+
+
+class OAuthClient(StarletteOAuth2App):  # type: ignore[misc]
+    """ Takes the provider key sets from the shared cache. """
+
+    jwks_cache: JWKSCache | None = None
+
+    async def fetch_jwk_set(self, force: bool = False) -> JWKSet:
+        if self.jwks_cache is None:
+            return await super().fetch_jwk_set(force)  # type: ignore[no-any-return]
+        return await self.jwks_cache.get(self.name, force)
+
+    async def request_jwk_set(self) -> JWKSet:
+        """ Fetch the key set from the provider. """
+
+        return await super().fetch_jwk_set(force=True)  # type: ignore[no-any-return]
@@ -0,0 +1,47 @@
+import logging
+
+from httpx import (
+    AsyncBaseTransport,
+    AsyncHTTPTransport,
+    Limits,
+    Request,
+    Response
+)
+
+from ...core.settings.dataclasses_ import OAuthHTTPSettings
+
+
+__all__ = ['SharedTransport']
+
+logger = logging.getLogger(__name__)
+
+
+class SharedTransport(AsyncBaseTransport):
+    """
+    Connection pool of a provider, shared by all its requests.
+
+    authlib builds a new `httpx.AsyncClient` for every call
+    and closes it, along with its transport, right after,
+    so every callback paid for new TCP and TLS handshakes.
+    Closing by the clients is ignored here, the pool is closed
+    only on `shutdown`.
+    """
+
+    def __init__(self, settings: OAuthHTTPSettings) -> None:
+        self._transport = AsyncHTTPTransport(
+            http2=settings.http2,
+            limits=Limits(
+                max_connections=settings.max_connections,
+                max_keepalive_connections=settings.max_connections,
+                keepalive_expiry=settings.keepalive_expiry_in_seconds
+            )
+        )
+
+    async def handle_async_request(self, request: Request) -> Response:
+        return await self._transport.handle_async_request(request)
+
+    async def aclose(self) -> None:
+        pass
+
+    async def shutdown(self) -> None:
+        await self._transport.aclose()
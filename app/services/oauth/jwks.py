@@ -0,0 +1,105 @@
+import asyncio
+import logging
+import math
+import time
+from collections.abc import (
+    Awaitable,
+    Callable
+)
+from contextlib import suppress
+from typing import (
+    Any,
+    TypeAlias
+)
+
+
+__all__ = [
+    'JWKSet',
+    'JWKSCache'
+]
+
+logger = logging.getLogger(__name__)
+
+JWKSet: TypeAlias = dict[str, Any]
+
+FORCED_REFRESH_INTERVAL_IN_SECONDS = 10.0
+""" Least age of a key set refreshed for a token signed by an unknown key. """
+RETRY_DELAY_IN_SECONDS = 30.0
+
+
+class JWKSCache:
+    """
+    JWK sets of the OpenID providers, shared by all callbacks.
+
+    authlib keeps a fetched key set forever and, for a token signed
+    by an unknown key, refetches it on the callback.
+    Here the key sets are refreshed in the background once their TTL
+    passes, and callbacks are served from memory even while
+    the key endpoint is down. A refresh is forced for an unknown key
+    only if the key set in hand is older than a few seconds,
+    so forged tokens can not make every callback wait for a fetch.
+    """
+
+    def __init__(self, ttl_in_seconds: int) -> None:
+        self.ttl_in_seconds = ttl_in_seconds
+        self._fetchers: dict[str, Callable[[], Awaitable[JWKSet]]] = {}
+        self._key_sets: dict[str, JWKSet] = {}
+        self._fetched_at: dict[str, float] = {}
+        self._locks: dict[str, asyncio.Lock] = {}
+        self._task: asyncio.Task[None] | None = None
+
+    def add(self, name: str, fetch: Callable[[], Awaitable[JWKSet]]) -> None:
+        self._fetchers[name] = fetch
+        self._locks[name] = asyncio.Lock()
+
+    async def get(self, name: str, force: bool = False) -> JWKSet:
+        if name not in self._key_sets:
+            return await self.refresh(name)
+        if force:
+            return await self.refresh(name, FORCED_REFRESH_INTERVAL_IN_SECONDS)
+        return self._key_sets[name]
+
+    async def refresh(self, name: str, min_age_in_seconds: float = 0) -> JWKSet:
+        """
+        Fetch the key set unless it is younger than the given age.
+
+        Concurrent refreshes of a key set are made as one fetch.
+        """
+
+        async with self._locks[name]:
+            if self._get_age(name) >= min_age_in_seconds:
+                self._key_sets[name] = await self._fetchers[name]()
+                self._fetched_at[name] = time.monotonic()
+                logger.info(f'JWK set of {name} has been refreshed.')
+        return self._key_sets[name]
+
+    def _get_age(self, name: str) -> float:
+        if (fetched_at := self._fetched_at.get(name)) is None:
+            return math.inf
+        return time.monotonic() - fetched_at
+
+    def start(self) -> None:
+        if self._fetchers and self._task is None:
+            self._task = asyncio.create_task(self._refresh_periodically())
+
+    async def shutdown(self) -> None:
+        if self._task is None:
+            return
+        self._task.cancel()
+        with suppress(asyncio.CancelledError):
+            await self._task
+        self._task = None
+
+    async def _refresh_periodically(self) -> None:
+        while True:
+            delay: float = self.ttl_in_seconds
+            for name in self._fetchers:
+                try:
+                    await self.refresh(name, self.ttl_in_seconds)
+                except Exception as error:
+                    # Keys in hand are used until the endpoint is back.
+                    logger.warning(
+                        f'JWK set of {name} is not refreshed: {error!r}.'
+                    )
+                    delay = min(delay, RETRY_DELAY_IN_SECONDS)
+            await asyncio.sleep(delay)
@@ -0,0 +1,61 @@
+import json
+import logging
+import os
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import (
+    Any,
+    TypeAlias
+)
+
+
+__all__ = [
+    'OAuthMetadata',
+    'OAuthMetadataCache'
+]
+
+logger = logging.getLogger(__name__)
+
+OAuthMetadata: TypeAlias = dict[str, Any]
+""" Provider metadata, as loaded by authlib, with its `_loaded_at` time. """
+
+
+@dataclass
+class OAuthMetadataCache:
+    """
+    On-disk cache of the OAuth providers metadata, shared by the workers.
+
+    Only the first worker started after the cache has expired
+    fetches the metadata, the rest load it from the file.
+    """
+
+    path: Path
+    ttl_in_seconds: int
+
+    def load(self) -> dict[str, OAuthMetadata]:
+        """ Load the metadata not expired yet, by backend. """
+
+        try:
+            data: dict[str, OAuthMetadata] = json.loads(self.path.read_text())
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError) as error:
+            logger.warning(f'OAuth metadata cache is unreadable: {error}.')
+            return {}
+        expired_at = time.time() - self.ttl_in_seconds
+        return {
+            backend: metadata
+            for backend, metadata in data.items()
+            if metadata.get('_loaded_at', 0) > expired_at
+        }
+
+    def store(self, metadata: dict[str, OAuthMetadata]) -> None:
+        # Written aside and renamed, so workers never read a partial file.
+        temp_path = self.path.with_name(f'{self.path.name}.{os.getpid()}')
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            temp_path.write_text(json.dumps(metadata))
+            os.replace(temp_path, self.path)
+        except OSError as error:
+            logger.warning(f'OAuth metadata cache is not stored: {error}.')
@@ -9,7 +9,6 @@ from ..auth import (
     AuthService
 )
 from ..auth.base import BaseAuthService
-from ...db.errors import EntityDoesNotExistError
 from ...db.models import OAuthConnection
 from ...db.repos import OAuthConnectionsRepo
 from ...dtos.oauth import OAuthUser
@@ -68,19 +67,12 @@ class OAuthService(CtxOAuthBackendMixin, BaseAuthService):
         self,
         oauth_user: OAuthUser
     ) -> AuthResult:
-        connection = await self._get_oauth_connection(oauth_user.id)
-        return await self.authenticator.authenticate(connection.user)
+        """ Sets `is_email_taken` of the OAuth user on the way. """
 
-    async def _get_oauth_connection(
-        self,
-        oauth_id: str
-    ) -> OAuthConnection:
-        try:
-            connection = await self.repo.get_one_by_pk(
-                [oauth_id, self.backend],
-                [OAuthConnection.user]
-            )
-        except EntityDoesNotExistError as error:
-            raise OAuthConnectionDoesNotExistError from error
-        else:
-            return connection
+        user, oauth_user.is_email_taken = await self.repo.get_connected_user(
+            oauth_user,
+            self.backend
+        )
+        if user is None:
+            raise OAuthConnectionDoesNotExistError
+        return await self.authenticator.authenticate(user)
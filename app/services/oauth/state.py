@@ -1,29 +1,133 @@
 import logging
 from dataclasses import dataclass
+from typing import (
+    Any,
+    TypeAlias
+)
 
 from authlib.integrations.starlette_client import OAuth
+from httpx import (
+    HTTPError,
+    Timeout
+)
 from starlette.config import Config
 
+from .client import OAuthClient
 from .config import BACKENDS_CONFIG
+from .http import SharedTransport
+from .jwks import JWKSCache
+from .metadata import (
+    OAuthMetadata,
+    OAuthMetadataCache
+)
+from ...core.settings.dataclasses_ import OAuthHTTPSettings
+from ...db.enums import OAuthBackend
 
 
-__all__ = ['OAuthState']
+__all__ = [
+    'OAuthClients',
+    'OAuthState'
+]
 
 logger = logging.getLogger(__name__)
 
+OAuthClients: TypeAlias = dict[OAuthBackend, OAuthClient]
+
+JWKS_CACHE_TTL_IN_SECONDS = 3600
+
 
 @dataclass
 class OAuthState:
+    """
+    Builds the OAuth clients once for all requests.
+
+    Providers discovered through `server_metadata_url` are fetched
+    by authlib on the first request of every worker.
+    `load_metadata` does it at startup instead, through the on-disk cache.
+    Their key sets are shared through the JWKS cache.
+    Every provider is requested through its own connection pool.
+    """
+
     settings: dict[str, str]
+    metadata_cache: OAuthMetadataCache | None = None
+    jwks_cache_ttl_in_seconds: int = JWKS_CACHE_TTL_IN_SECONDS
+    http_settings: OAuthHTTPSettings | None = None
+    """ Without them every request is made on a new connection. """
 
     def __post_init__(self) -> None:
         self.oauth = OAuth(Config(environ=self.settings))
-        self._register_backends()
+        self.jwks_cache = JWKSCache(self.jwks_cache_ttl_in_seconds)
+        self.transports: dict[OAuthBackend, SharedTransport] = {}
+        self.clients: OAuthClients = {}
+        # Backends configured through `server_metadata_url`.
+        self.discovered_backends: set[OAuthBackend] = set()
+        for backend, config in BACKENDS_CONFIG.items():
+            self.oauth.register(
+                backend.value,
+                client_cls=OAuthClient,
+                **self._with_transport(backend, config)
+            )
+            client = self.oauth.create_client(backend.value)
+            if 'server_metadata_url' in config:
+                self.discovered_backends.add(backend)
+                client.jwks_cache = self.jwks_cache
+                self.jwks_cache.add(backend.value, client.request_jwk_set)
+            self.clients[backend] = client
         logger.info('OAuth state has been set.')
 
-    def _register_backends(self) -> None:
-        for name, config in BACKENDS_CONFIG.items():
-            self.oauth.register(name, **config)
+    def _with_transport(
+        self,
+        backend: OAuthBackend,
+        config: dict[str, Any]
+    ) -> dict[str, Any]:
+        if (settings := self.http_settings) is None:
+            return config
+        transport = self.transports[backend] = SharedTransport(settings)
+        client_kwargs = {
+            **config.get('client_kwargs', {}),
+            'transport': transport,
+            'timeout': Timeout(
+                settings.timeout_in_seconds,
+                connect=settings.connect_timeout_in_seconds
+            )
+        }
+        return {**config, 'client_kwargs': client_kwargs}
+
+    def __call__(self) -> OAuthClients:
+        return self.clients
+
+    async def shutdown(self) -> None:
+        await self.jwks_cache.shutdown()
+        for transport in self.transports.values():
+            await transport.shutdown()
+        logger.info('OAuth state has been shutdown.')
+
+    async def load_metadata(self) -> None:
+        """
+        Load the providers metadata from the cache or fetch it
+        and start refreshing their key sets in the background.
+
+        Failures are only logged, the metadata is fetched
+        on the first request then as before.
+        """
 
-    def __call__(self) -> OAuth:
-        return self.oauth
+        cached = {} if self.metadata_cache is None else self.metadata_cache.load()
+        fetched: dict[str, OAuthMetadata] = {}
+        for backend in self.discovered_backends:
+            client = self.clients[backend]
+            if (metadata := cached.get(backend.value)) is not None:
+                client.server_metadata.update(metadata)
+                continue
+            try:
+                fetched[backend.value] = await client.load_server_metadata()
+            except HTTPError as error:
+                logger.warning(
+                    f'OAuth metadata of {backend.value} is not fetched: {error!r}.'
+                )
+        if fetched and self.metadata_cache is not None:
+            self.metadata_cache.store({**cached, **fetched})
+        logger.info(
+            f'OAuth metadata has been loaded '
+            f'[{len(cached)} cached, {len(fetched)} fetched].'
+        )
+        self.jwks_cache.start()
@@ -1,15 +1,85 @@
+import logging
+import math
+import time
+from dataclasses import dataclass
+from typing import (
+    Any,
+    cast
+)
+
 from passlib.context import CryptContext
+from passlib.hash import bcrypt
+
+from .metrics.metrics import PASSWORD_HASH_DURATION
+from ..core.settings.dataclasses_ import PasswordSettings
+
+
+__all__ = [
+    'InstrumentedCryptContext',
+    'PasswordState',
+    'calibrate_bcrypt_rounds'
+]
+
+logger = logging.getLogger(__name__)
+
+CALIBRATION_ROUNDS = 8
+CALIBRATION_SAMPLES = 3
+CALIBRATION_TOLERANCE_IN_ROUNDS = 1
 
 
-__all__ = ['PasswordState']
+def calibrate_bcrypt_rounds(target_time_in_ms: int) -> int:
+    """
+    Estimate the bcrypt cost closest to the target hash time on this host.
 
+    Each extra round doubles the work,
+    so a few cheap samples are enough to extrapolate.
+    """
+    hasher = bcrypt.using(rounds=CALIBRATION_ROUNDS)
+    elapsed = math.inf
+    for _ in range(CALIBRATION_SAMPLES):
+        start = time.perf_counter()
+        hasher.hash('calibration')
+        elapsed = min(elapsed, time.perf_counter() - start)
+    rounds = CALIBRATION_ROUNDS + round(
+        math.log2(target_time_in_ms / 1000 / elapsed)
+    )
+    return cast(int, max(bcrypt.min_rounds, min(rounds, bcrypt.max_rounds)))
 
+
+class InstrumentedCryptContext(CryptContext):  # type: ignore[misc]
+    """ Times hashing and verification, which run on the event loop. """
+
+    def hash(self, secret: str, *args: Any, **kwargs: Any) -> str:
+        with PASSWORD_HASH_DURATION.labels('hash').time():
+            return cast(str, super().hash(secret, *args, **kwargs))
+
+    def verify(self, secret: str, hash: str, *args: Any, **kwargs: Any) -> bool:
+        with PASSWORD_HASH_DURATION.labels('verify').time():
+            return cast(bool, super().verify(secret, hash, *args, **kwargs))
+
+
+@dataclass
 class PasswordState:
-    def __init__(self) -> None:
-        self.pwd_context = CryptContext(
+    settings: PasswordSettings
+
+    def __post_init__(self) -> None:
+        if (rounds := self.settings.hash_rounds) is not None:
+            tolerance = 0
+        else:
+            rounds = calibrate_bcrypt_rounds(
+                self.settings.hash_target_time_in_ms
+            )
+            # Workers calibrate independently; the slack keeps them
+            # from rehashing each other's passwords back and forth.
+            tolerance = CALIBRATION_TOLERANCE_IN_ROUNDS
+        self.pwd_context = InstrumentedCryptContext(
             schemes=['bcrypt'],
-            deprecated='auto'
+            deprecated='auto',
+            bcrypt__default_rounds=rounds,
+            bcrypt__min_rounds=max(rounds - tolerance, bcrypt.min_rounds),
+            bcrypt__max_rounds=min(rounds + tolerance, bcrypt.max_rounds)
         )
+        logger.info(f'Password state has been set [bcrypt rounds: {rounds}].')
 
     def __call__(self) -> CryptContext:
         return self.pwd_context
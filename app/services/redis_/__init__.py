@@ -0,0 +1,22 @@
+from .cache import (
+    RedisClientCache,
+    RedisClientCacheInfo
+)
+from .pool import (
+    InstrumentedConnectionPool,
+    RedisPoolStats
+)
+from .state import (
+    RedisClient,
+    RedisState
+)
+
+
+__all__ = [
+    'InstrumentedConnectionPool',
+    'RedisClient',
+    'RedisClientCache',
+    'RedisClientCacheInfo',
+    'RedisPoolStats',
+    'RedisState'
+]
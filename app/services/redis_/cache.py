@@ -0,0 +1,188 @@
+import asyncio
+import logging
+import time
+from collections import OrderedDict
+from collections.abc import Iterable
+from dataclasses import dataclass
+from typing import (
+    TYPE_CHECKING,
+    Any
+)
+
+from redis.asyncio.client import PubSub
+from redis.exceptions import (
+    ConnectionError as RedisConnectionError,
+    RedisError
+)
+
+
+if TYPE_CHECKING:
+    from .state import RedisClient
+
+__all__ = [
+    'RedisClientCache',
+    'RedisClientCacheInfo'
+]
+
+logger = logging.getLogger(__name__)
+
+INVALIDATION_CHANNEL = '__redis__:invalidate'
+PING_INTERVAL_IN_SECONDS = 5.0
+RETRACK_DELAY_IN_SECONDS = 1.0
+
+
+@dataclass(frozen=True)
+class RedisClientCacheInfo:
+    is_synced: bool
+    hits: int
+    misses: int
+    invalidations: int
+    size: int
+    max_size: int
+
+
+class RedisClientCache:
+    """
+    Worker-local cache of read-mostly keys, invalidated by Redis.
+
+    Tracking runs in the broadcasting mode over RESP2:
+    a dedicated connection has the tracking of the key prefixes
+    redirected to itself and listens to the invalidation channel.
+    Lookups go straight to Redis while the tracking is not established.
+    """
+
+    def __init__(
+        self,
+        redis: 'RedisClient',
+        prefixes: Iterable[str],
+        *,
+        max_size: int,
+        ttl_in_seconds: int
+    ) -> None:
+        self.redis = redis
+        self.prefixes = tuple(prefixes)
+        self.max_size = max_size
+        self.ttl_in_seconds = ttl_in_seconds
+        self.is_synced = False
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+        self._entries: OrderedDict[str, tuple[float, bytes | None]] = (
+            OrderedDict()
+        )
+        self._epoch = 0
+
+    async def mget(self, keys: list[str]) -> list[bytes | None]:
+        if not self.is_synced:
+            return await self.redis.mget(keys)
+        now = time.monotonic()
+        values: dict[str, bytes | None] = {}
+        missing: list[str] = []
+        for key in keys:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] > now:
+                self._entries.move_to_end(key)
+                values[key] = entry[1]
+            else:
+                missing.append(key)
+        self.hits += len(keys) - len(missing)
+        self.misses += len(missing)
+        if missing:
+            epoch = self._epoch
+            fetched = await self.redis.mget(missing)
+            for key, value in zip(missing, fetched):
+                values[key] = value
+                # An invalidation during the read may concern the value.
+                if self.is_synced and epoch == self._epoch:
+                    self._store(key, value, now)
+        return [values[key] for key in keys]
+
+    def _store(self, key: str, value: bytes | None, now: float) -> None:
+        if not key.startswith(self.prefixes) or self.max_size <= 0:
+            return
+        self._entries[key] = (now + self.ttl_in_seconds, value)
+        self._entries.move_to_end(key)
+        if len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, keys: Iterable[str] | None = None) -> None:
+        """ Drop the keys or, if none are given, everything. """
+
+        self._epoch += 1
+        self.invalidations += 1
+        if keys is None:
+            self._entries.clear()
+            return
+        for key in keys:
+            self._entries.pop(key, None)
+
+    def info(self) -> RedisClientCacheInfo:
+        return RedisClientCacheInfo(
+            is_synced=self.is_synced,
+            hits=self.hits,
+            misses=self.misses,
+            invalidations=self.invalidations,
+            size=len(self._entries),
+            max_size=self.max_size
+        )
+
+    async def track(self) -> None:
+        while True:
+            try:
+                async with self.redis.pubsub() as pubsub:
+                    await self._enable_tracking(pubsub)
+                    await self._consume(pubsub)
+            except (RedisError, OSError) as error:
+                logger.warning(
+                    f'Redis client cache tracking has been broken: {error}.'
+                )
+            finally:
+                self.is_synced = False
+                self.invalidate()
+            await asyncio.sleep(RETRACK_DELAY_IN_SECONDS)
+
+    async def _enable_tracking(self, pubsub: PubSub) -> None:
+        # `PubSub.connect` (redis 4.2) is missing from the stubs.
+        await pubsub.connect()  # type: ignore[attr-defined]
+        connection = pubsub.connection
+        await connection.send_command('CLIENT', 'ID')
+        client_id = await connection.read_response()
+        prefix_args: list[str] = []
+        for prefix in self.prefixes:
+            prefix_args += ['PREFIX', prefix]
+        await connection.send_command(
+            'CLIENT', 'TRACKING', 'ON',
+            'REDIRECT', client_id,
+            'BCAST', *prefix_args
+        )
+        await connection.read_response()
+        await pubsub.subscribe(INVALIDATION_CHANNEL)
+
+    async def _consume(self, pubsub: PubSub) -> None:
+        last_seen_at = time.monotonic()
+        while True:
+            message = await pubsub.get_message(
+                timeout=PING_INTERVAL_IN_SECONDS
+            )
+            now = time.monotonic()
+            if message is None:
+                if now - last_seen_at > 2 * PING_INTERVAL_IN_SECONDS:
+                    raise RedisConnectionError('Tracking is stale.')
+                await pubsub.ping()
+                continue
+            last_seen_at = now
+            self._handle(message)
+
+    def _handle(self, message: dict[str, Any]) -> None:
+        if message['type'] == 'subscribe':
+            # A resubscription means the connection has been re-established
+            # and the tracking, bound to the old one, is gone.
+            if self.is_synced:
+                raise RedisConnectionError('Tracking connection has changed.')
+            self.is_synced = True
+            logger.info('Redis client cache tracking has been established.')
+        elif message['type'] == 'message':
+            keys = message['data']
+            self.invalidate(
+                None if keys is None else [key.decode() for key in keys]
+            )
@@ -0,0 +1,107 @@
+import time
+from dataclasses import dataclass
+from typing import Any
+
+from redis.asyncio.connection import (
+    BlockingConnectionPool,
+    Connection
+)
+from redis.exceptions import ConnectionError as RedisConnectionError
+
+
+__all__ = [
+    'InstrumentedConnectionPool',
+    'RedisPoolStats'
+]
+
+
+@dataclass(frozen=True)
+class RedisPoolStats:
+    max_connections: int
+    in_use: int
+    acquired: int
+    exhausted: int
+    """ Acquisitions that found no idle connection and had to wait. """
+    timed_out: int
+    wait_time_in_seconds: float
+    """ Time spent waiting on the exhausted pool. """
+    hold_time_in_seconds: float
+    """ Time connections were held by commands, i.e. their latency. """
+    max_hold_time_in_seconds: float
+
+    @property
+    def mean_hold_time_in_ms(self) -> float:
+        if not self.acquired:
+            return 0.0
+        return self.hold_time_in_seconds / self.acquired * 1000
+
+
+class InstrumentedConnectionPool(BlockingConnectionPool):
+    """
+    Blocking pool counting exhaustion, waits and command latency.
+
+    Pub/sub connections are held for their lifetime,
+    so they are left out of the latency.
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self.acquired = 0
+        self.exhausted = 0
+        self.timed_out = 0
+        self.wait_time_in_seconds = 0.0
+        self.hold_time_in_seconds = 0.0
+        self.max_hold_time_in_seconds = 0.0
+        self._acquired_at: dict[Connection, float] = {}
+
+    async def get_connection(
+        self,
+        command_name: str,
+        *keys: Any,
+        **options: Any
+    ) -> Connection:
+        is_exhausted = self.pool.empty()
+        start = time.perf_counter()
+        try:
+            connection: Connection = (
+                await super().get_connection(  # type: ignore[no-untyped-call]
+                    command_name,
+                    *keys,
+                    **options
+                )
+            )
+        except RedisConnectionError:
+            if is_exhausted and self.timeout is not None:
+                waited = time.perf_counter() - start
+                self.timed_out += int(waited >= self.timeout)
+            raise
+        finally:
+            if is_exhausted:
+                self.exhausted += 1
+                self.wait_time_in_seconds += time.perf_counter() - start
+        if command_name != 'pubsub':
+            self.acquired += 1
+            self._acquired_at[connection] = time.perf_counter()
+        return connection
+
+    async def release(self, connection: Connection) -> None:
+        if (acquired_at := self._acquired_at.pop(connection, None)) is not None:
+            held = time.perf_counter() - acquired_at
+            self.hold_time_in_seconds += held
+            self.max_hold_time_in_seconds = max(
+                held,
+                self.max_hold_time_in_seconds
+            )
+        await super().release(connection)
+
+    def stats(self) -> RedisPoolStats:
+        return RedisPoolStats(
+            max_connections=self.max_connections,
+            in_use=self.max_connections - self.pool.qsize(),
+            acquired=self.acquired,
+            exhausted=self.exhausted,
+            timed_out=self.timed_out,
+            wait_time_in_seconds=self.wait_time_in_seconds,
+            hold_time_in_seconds=self.hold_time_in_seconds,
+            max_hold_time_in_seconds=self.max_hold_time_in_seconds
+        )
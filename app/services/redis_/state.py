@@ -0,0 +1,99 @@
+import asyncio
+import logging
+from collections.abc import Iterable
+from contextlib import suppress
+from dataclasses import (
+    dataclass,
+    field
+)
+from typing import (
+    TYPE_CHECKING,
+    TypeAlias,
+    cast
+)
+
+from redis import asyncio as aioredis
+from redis.asyncio.retry import Retry
+from redis.backoff import ExponentialBackoff
+from redis.exceptions import (
+    ConnectionError as RedisConnectionError,
+    TimeoutError as RedisTimeoutError
+)
+
+from .cache import RedisClientCache
+from .pool import InstrumentedConnectionPool
+from ...core.settings.dataclasses_ import RedisSettings
+
+
+if TYPE_CHECKING:
+    RedisClient: TypeAlias = aioredis.Redis[bytes]
+else:
+    RedisClient: TypeAlias = aioredis.Redis
+
+__all__ = [
+    'RedisClient',
+    'RedisState'
+]
+
+logger = logging.getLogger(__name__)
+
+RETRY_BACKOFF_BASE_IN_SECONDS = 0.01
+RETRY_BACKOFF_CAP_IN_SECONDS = 0.5
+
+
+@dataclass
+class RedisState:
+    settings: RedisSettings
+    cache_prefixes: Iterable[str] = field(default_factory=tuple)
+    """ Key prefixes served by the client cache (if it is enabled). """
+
+    def __post_init__(self) -> None:
+        pool = InstrumentedConnectionPool.from_url(
+            self.settings.url,
+            max_connections=self.settings.max_connections,
+            timeout=self.settings.pool_timeout_in_seconds,
+            socket_timeout=self.settings.socket_timeout_in_seconds,
+            socket_connect_timeout=(
+                self.settings.socket_connect_timeout_in_seconds
+            ),
+            socket_keepalive=self.settings.socket_keepalive,
+            health_check_interval=(
+                self.settings.health_check_interval_in_seconds
+            ),
+            retry=Retry(
+                ExponentialBackoff(
+                    cap=RETRY_BACKOFF_CAP_IN_SECONDS,
+                    base=RETRY_BACKOFF_BASE_IN_SECONDS
+                ),
+                self.settings.retry_attempts
+            ),
+            retry_on_error=[RedisConnectionError, RedisTimeoutError]
+        )
+        # `from_url` is typed to return the base pool in the stubs.
+        self.pool = cast(InstrumentedConnectionPool, pool)
+        self.redis: RedisClient = aioredis.Redis(connection_pool=self.pool)
+        self.cache = RedisClientCache(
+            self.redis,
+            self.cache_prefixes,
+            max_size=self.settings.client_cache_max_size,
+            ttl_in_seconds=self.settings.client_cache_ttl_in_seconds
+        )
+        self._tracking: asyncio.Task[None] | None = None
+        if self.settings.client_cache:
+            self._tracking = asyncio.create_task(self.cache.track())
+        logger.info('Redis state has been initialized.')
+
+    def __call__(self) -> RedisClient:
+        return self.redis
+
+    async def shutdown(self) -> None:
+        if self._tracking is not None:
+            self._tracking.cancel()
+            with suppress(asyncio.CancelledError):
+                await self._tracking
+        await self.redis.close()
+        await self.pool.disconnect()
+        logger.info(
+            'Redis state has been shutdown '
+            f'[{self.pool.stats()}, {self.cache.info()}].'
+        )
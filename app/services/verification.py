@@ -21,10 +21,50 @@ __all__ = [
 VERIFICATION_CODE_LENGTH = 6
 VERIFICATION_CODES_RANGE = range(1, 10 ** VERIFICATION_CODE_LENGTH)
 
+ISSUE_SCRIPT = """
+if KEYS[2] and not redis.call('SET', KEYS[2], 1, 'NX', 'EX', ARGV[3]) then
+    return false
+end
+local code = redis.call('HGET', KEYS[1], 'code')
+if code then
+    return code
+end
+redis.call('HSET', KEYS[1], 'code', ARGV[1], 'attempts', 0)
+redis.call('EXPIRE', KEYS[1], ARGV[2])
+return ARGV[1]
+"""
+"""
+Returns the existing code or stores the proposed one.
+If the cooldown key is given, returns nothing while it is held.
+"""
+
+CONSUME_SCRIPT = """
+local code = redis.call('HGET', KEYS[1], 'code')
+if not code then
+    return 0
+end
+if code == ARGV[1] then
+    redis.call('DEL', KEYS[1])
+    return 1
+end
+local attempts = redis.call('HINCRBY', KEYS[1], 'attempts', 1)
+if attempts >= tonumber(ARGV[2]) then
+    redis.call('DEL', KEYS[1])
+end
+return 0
+"""
+"""
+Deletes the code if it matches, so it can be used only once,
+or counts the failed attempt and deletes the code after too many.
+"""
+
 
 @dataclass
 class VerificationService:
-    key_pattern: ClassVar[str] = 'verification:{email}'
+    # Codes were stored as plain strings under `verification:{email}`,
+    # so the hashes take a new key rather than hit WRONGTYPE on those.
+    key_pattern: ClassVar[str] = 'verification:code:{email}'
+    cooldown_key_pattern: ClassVar[str] = 'verification:cooldown:{email}'
     redis: RedisClient = Depends(RedisMarker)
     settings: AppSettings = Depends(AppSettingsMarker)
 
@@ -36,6 +76,10 @@ class VerificationService:
     def format_key(email: str) -> str:
         return VerificationService.key_pattern.format(email=email)
 
+    @staticmethod
+    def format_cooldown_key(email: str) -> str:
+        return VerificationService.cooldown_key_pattern.format(email=email)
+
     @staticmethod
     def format_code(code: int) -> str:
         return str(code).zfill(VERIFICATION_CODE_LENGTH)
@@ -45,22 +89,43 @@ class VerificationService:
         return self.settings.verification_code_expire_in_seconds
 
     async def get(self, email: str) -> str:
-        key = self.format_key(email)
-        if (code := await self.raw_get(key)) is not None:
-            return self.format_code(code)
-        code = self.generate_code()
-        await self.redis.set(key, code, self.ex)
-        return self.format_code(code)
+        # Concurrent requests for the same email must agree on the code.
+        script = self.redis.register_script(ISSUE_SCRIPT)
+        code = await script(
+            keys=[self.format_key(email)],
+            args=[self.generate_code(), self.ex]
+        )
+        return self.format_code(int(code))
+
+    async def get_to_send(self, email: str) -> str | None:
+        """
+        Get the code unless it has been sent to the email recently.
+
+        Sends are deduplicated within the cooldown,
+        so repeated requests do not render and send the mail again.
+        """
+
+        cooldown = self.settings.verification_send_cooldown_in_seconds
+        if not cooldown:
+            return await self.get(email)
+        script = self.redis.register_script(ISSUE_SCRIPT)
+        code = await script(
+            keys=[self.format_key(email), self.format_cooldown_key(email)],
+            args=[self.generate_code(), self.ex, cooldown]
+        )
+        return self.format_code(int(code)) if code is not None else None
 
     async def verify(self, email: str, code: int) -> bool:
-        db_code = await self.raw_get(self.format_key(email))
-        if db_code is None or db_code != code:
-            return False
-        return True
+        """
+        Check the code and consume it on success.
 
-    async def raw_get(self, key: str) -> int | None:
-        code = await self.redis.get(key)
-        return int(code) if code is not None else None
+        The code is invalidated after too many failed attempts,
+        so the codes range can not be enumerated.
+        """
 
-    async def delete(self, email: str) -> None:
-        await self.redis.delete(self.format_key(email))
+        script = self.redis.register_script(CONSUME_SCRIPT)
+        is_verified = await script(
+            keys=[self.format_key(email)],
+            args=[code, self.settings.verification_code_max_attempts]
+        )
+        return bool(is_verified)
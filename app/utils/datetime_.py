@@ -1,3 +1,4 @@
+import calendar
 import time
 from datetime import (
     datetime,
@@ -9,7 +10,10 @@ from typing import (
 )
 
 
-__all__ = ['compute_expire']
+__all__ = [
+    'compute_expire',
+    'to_timestamp'
+]
 
 
 @overload
@@ -49,3 +53,7 @@ def _compute_expire_as_datetime(expire_in_seconds: int) -> datetime:
         datetime.utcnow()
         + timedelta(seconds=expire_in_seconds)
     )
+
+
+def to_timestamp(naive_utc: datetime) -> int:
+    return calendar.timegm(naive_utc.utctimetuple())
@@ -0,0 +1,35 @@
+import hashlib
+from typing import Any
+
+
+__all__ = [
+    'make_etag',
+    'is_etag_matched'
+]
+
+
+def make_etag(*parts: Any) -> str:
+    """ Strong ETag of the parts, equal only for the equal parts. """
+
+    digest = hashlib.blake2b(
+        '\x1f'.join(map(str, parts)).encode(),
+        digest_size=16
+    )
+    return f'"{digest.hexdigest()}"'
+
+
+def is_etag_matched(if_none_match: str | None, etag: str) -> bool:
+    """
+    Check `If-None-Match` against the current ETag.
+
+    The weak comparison is used, as RFC 9110 requires for the header.
+    """
+
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == '*':
+        return True
+    return any(
+        tag.strip().removeprefix('W/') == etag.removeprefix('W/')
+        for tag in if_none_match.split(',')
+    )
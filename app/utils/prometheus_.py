@@ -0,0 +1,32 @@
+import os
+import shutil
+from pathlib import Path
+
+
+__all__ = [
+    'MULTIPROCESS_DIR_ENV',
+    'prepare_multiprocess_dir'
+]
+
+MULTIPROCESS_DIR_ENV = 'PROMETHEUS_MULTIPROC_DIR'
+"""
+Turns on the multi-process mode for Gunicorn workers.
+
+prometheus_client reads it on import, so it has to be set
+in the environment of the process, not in the `.env` files.
+"""
+
+
+def prepare_multiprocess_dir() -> None:
+    """
+    Wipe the values of the previous run, as prometheus_client requires.
+
+    The metrics write their values into the directory once created,
+    so it is prepared before the app is imported, and only in the master.
+    This module imports no prometheus_client for that reason.
+    """
+
+    if (path := os.environ.get(MULTIPROCESS_DIR_ENV)) is None:
+        return
+    shutil.rmtree(path, ignore_errors=True)
+    Path(path).mkdir(parents=True)
@@ -11,6 +11,7 @@ logger = logging.getLogger(__name__)
 
 def run(app_path: str, settings: AppProdSettings) -> None:
     from ..gunicorn_ import StandaloneApplication
+    from ...services.metrics import mark_worker_dead
 
     logger.info(
         'Used runner for prod environment [Gunicorn] '
@@ -24,5 +25,6 @@ def run(app_path: str, settings: AppProdSettings) -> None:
             settings=settings.logging
         ),
         workers=settings.gunicorn_workers_number,
-        worker_class=settings.gunicorn_worker_class
+        worker_class=settings.gunicorn_worker_class,
+        child_exit=mark_worker_dead
     ).run()
@@ -0,0 +1,50 @@
+import statistics
+import time
+from collections.abc import (
+    Awaitable,
+    Callable
+)
+from dataclasses import dataclass
+
+
+__all__ = [
+    'Timing',
+    'measure'
+]
+
+
+@dataclass(frozen=True)
+class Timing:
+    name: str
+    rounds: int
+    median_in_us: float
+    p95_in_us: float
+
+    def __str__(self) -> str:
+        return (
+            f'{self.name}: median {self.median_in_us:.1f} us, '
+            f'p95 {self.p95_in_us:.1f} us [{self.rounds} rounds]'
+        )
+
+
+async def measure(
+    name: str,
+    call: Callable[[], Awaitable[object]],
+    *,
+    rounds: int = 5000,
+    warmup: int = 500
+) -> Timing:
+    for _ in range(warmup):
+        await call()
+    samples: list[float] = []
+    for _ in range(rounds):
+        start = time.perf_counter()
+        await call()
+        samples.append((time.perf_counter() - start) * 1_000_000)
+    samples.sort()
+    return Timing(
+        name=name,
+        rounds=rounds,
+        median_in_us=statistics.median(samples),
+        p95_in_us=samples[int(rounds * 0.95)]
+    )
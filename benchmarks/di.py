@@ -0,0 +1,75 @@
+"""
+Per-request dependency injection overhead of `auth:login`.
+
+Resolves the route dependencies (without running the endpoint)
+against an initialized app in the test environment:
+
+    $ APP_ENV=test python -m benchmarks.di
+
+No query is issued, but the lifespan expects Redis to be reachable.
+"""
+
+import asyncio
+from contextlib import AsyncExitStack
+
+from asgi_lifespan import LifespanManager
+from fastapi import FastAPI
+from fastapi.dependencies.utils import solve_dependencies
+from fastapi.routing import APIRoute
+from starlette.requests import Request
+from starlette.responses import Response
+
+from .common import measure
+from app.builder import get_app
+from app.core.config import get_app_settings
+
+
+ROUTE_NAME = 'auth:login'
+BODY = {'email': 'user@gmail.com', 'password': 'password'}
+
+
+def _find_route(app: FastAPI, name: str) -> APIRoute:
+    for route in app.routes:
+        if isinstance(route, APIRoute) and route.name == name:
+            return route
+    raise LookupError(name)
+
+
+def _form_request(app: FastAPI, route: APIRoute) -> Request:
+    return Request({
+        'type': 'http',
+        'app': app,
+        'method': 'POST',
+        'path': route.path,
+        'headers': [
+            (b'user-agent', b'benchmark'),
+            (b'x-forwarded-for', b'127.0.0.1')
+        ],
+        'query_string': b'',
+        'client': ('127.0.0.1', 12345)
+    })
+
+
+async def main() -> None:
+    app = get_app(get_app_settings())
+    route = _find_route(app, ROUTE_NAME)
+
+    async def resolve() -> None:
+        request = _form_request(app, route)
+        async with AsyncExitStack() as stack:
+            request.scope['fastapi_astack'] = stack
+            _, errors, *_ = await solve_dependencies(
+                request=request,
+                dependant=route.dependant,
+                body=BODY,
+                response=Response(),
+                dependency_overrides_provider=app
+            )
+        assert not errors, errors
+
+    async with LifespanManager(app):
+        print(await measure(f'{ROUTE_NAME} dependencies', resolve))
+
+
+if __name__ == '__main__':
+    asyncio.run(main())
@@ -0,0 +1,185 @@
+"""
+Verification mail throughput and latency at increasing concurrency.
+
+Drives `MailService.send_verification` against an in-process SMTP sink.
+Latency is measured until the mail is delivered to the sink:
+
+    $ APP_ENV=test python -m benchmarks.mail
+    # through the Redis queue and a mail worker (needs Redis)
+    $ APP_ENV=test python -m benchmarks.mail --queue
+"""
+
+import argparse
+import asyncio
+import socket
+import statistics
+import time
+from contextlib import AsyncExitStack
+from dataclasses import (
+    dataclass,
+    replace
+)
+from email.mime.multipart import MIMEMultipart
+from typing import Any
+
+from aiosmtpd.controller import Controller
+from fastapi import BackgroundTasks
+from fastapi_mail.fastmail import email_dispatched
+
+from app.core.config import get_app_settings
+from app.core.settings import AppSettings
+from app.db.enums import VerificationAction
+from app.schemas.verification import VerificationInCreate
+from app.services.mail import (
+    MailQueue,
+    MailService,
+    MailState,
+    MailWorker
+)
+from app.services.redis_ import RedisState
+
+
+CONCURRENCY_LEVELS = (1, 4, 16, 64)
+MAILS_PER_LEVEL = 500
+
+
+@dataclass(frozen=True)
+class Throughput:
+    concurrency: int
+    mails: int
+    mails_per_second: float
+    p50_in_ms: float
+    p95_in_ms: float
+    p99_in_ms: float
+
+    def __str__(self) -> str:
+        return (
+            f'concurrency {self.concurrency:>3}: '
+            f'{self.mails_per_second:7.1f} mails/s, '
+            f'p50 {self.p50_in_ms:.1f} ms, p95 {self.p95_in_ms:.1f} ms, '
+            f'p99 {self.p99_in_ms:.1f} ms [{self.mails} mails]'
+        )
+
+
+class SinkHandler:
+    async def handle_DATA(self, *args: Any) -> str:
+        return '250 OK'
+
+
+class Deliveries:
+    """ Resolves a future per recipient once its mail is dispatched. """
+
+    def __init__(self) -> None:
+        self.pending: dict[str, asyncio.Future[None]] = {}
+        email_dispatched.connect(self._on_dispatched)
+
+    def expect(self, recipient: str) -> asyncio.Future[None]:
+        future = asyncio.get_running_loop().create_future()
+        self.pending[recipient] = future
+        return future
+
+    def _on_dispatched(self, mail: MIMEMultipart) -> None:
+        if (future := self.pending.pop(mail['To'], None)) is not None:
+            future.set_result(None)
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        return int(sock.getsockname()[1])
+
+
+async def _run_level(
+    send: Any,
+    deliveries: Deliveries,
+    concurrency: int
+) -> Throughput:
+    latencies: list[float] = []
+    counter = iter(range(MAILS_PER_LEVEL))
+
+    async def client() -> None:
+        for i in counter:
+            recipient = f'user{concurrency}.{i}@gmail.com'
+            delivered = deliveries.expect(recipient)
+            start = time.perf_counter()
+            await send(recipient)
+            await delivered
+            latencies.append((time.perf_counter() - start) * 1000)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(client() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - start
+    percentiles = statistics.quantiles(latencies, n=100)
+    return Throughput(
+        concurrency=concurrency,
+        mails=len(latencies),
+        mails_per_second=len(latencies) / elapsed,
+        p50_in_ms=percentiles[49],
+        p95_in_ms=percentiles[94],
+        p99_in_ms=percentiles[98]
+    )
+
+
+async def main(use_queue: bool) -> None:
+    port = _free_port()
+    controller = Controller(SinkHandler(), hostname='127.0.0.1', port=port)
+    controller.start()
+    settings: AppSettings = get_app_settings().copy(
+        update={'mail_use_queue': use_queue}
+    )
+    mail_settings = settings.mail.copy(update={
+        'MAIL_SERVER': '127.0.0.1',
+        'MAIL_PORT': port,
+        'MAIL_TLS': False,
+        'MAIL_SSL': False,
+        'USE_CREDENTIALS': False,
+        'SUPPRESS_SEND': False
+    })
+    mail_sender = MailState(mail_settings)()
+    deliveries = Deliveries()
+    async with AsyncExitStack() as stack:
+        stack.callback(controller.stop)
+        redis = RedisState(replace(settings.redis, client_cache=False))
+        stack.push_async_callback(redis.shutdown)
+        mail_queue = MailQueue(redis=redis())
+        if use_queue:
+            await redis().delete(MailQueue.stream)
+            worker = MailWorker(redis(), mail_settings, settings.mail_queue)
+            task = asyncio.create_task(worker.run())
+            stack.push_async_callback(_stop, worker, task)
+
+        async def send(recipient: str) -> None:
+            background_tasks = BackgroundTasks()
+            await MailService(
+                background_tasks=background_tasks,
+                mail_sender=mail_sender,
+                mail_queue=mail_queue,
+                settings=settings
+            ).send_verification(
+                VerificationInCreate(
+                    email=recipient,
+                    action=VerificationAction.REGISTRATION
+                ),
+                '000001'
+            )
+            # Run after the response, as Starlette does.
+            await background_tasks()
+
+        print(f'Mode: {"queue and worker" if use_queue else "in-process"}.')
+        for concurrency in CONCURRENCY_LEVELS:
+            print(await _run_level(send, deliveries, concurrency))
+
+
+async def _stop(worker: MailWorker, task: asyncio.Task[None]) -> None:
+    worker.stop()
+    await task
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        '--queue',
+        action='store_true',
+        help='send through the Redis queue and a mail worker'
+    )
+    asyncio.run(main(parser.parse_args().queue))
@@ -0,0 +1,74 @@
+"""
+Mail rendering throughput of `verification.html` on a single core.
+
+Compares `fastapi_mail`, which recompiles the template for every mail,
+with `MailRenderer` rendering on the event loop and off it:
+
+    $ APP_ENV=test python -m benchmarks.mail_templates
+
+Needs no services.
+"""
+
+import asyncio
+
+from fastapi_mail import (
+    FastMail,
+    MessageSchema
+)
+from starlette.concurrency import run_in_threadpool
+
+from .common import measure
+from app.core.config import get_app_settings
+from app.services.mail import MailRenderer
+
+
+TEMPLATE_NAME = 'verification.html'
+
+
+def _form_message() -> MessageSchema:
+    return MessageSchema(
+        recipients=['user@gmail.com'],
+        subject='Verification',
+        template_body={'code': '000001', 'message': 'Confirm the action.'}
+    )
+
+
+async def main() -> None:
+    settings = get_app_settings().mail
+    fast_mail = FastMail(settings)
+    renderer = MailRenderer(settings)
+
+    async def render_with_fastapi_mail() -> None:
+        template = await fast_mail.get_mail_template(
+            settings.template_engine(),
+            TEMPLATE_NAME
+        )
+        await fast_mail._FastMail__prepare_message(  # type: ignore
+            _form_message(),
+            template
+        )
+
+    async def render() -> None:
+        await renderer.render(_form_message(), TEMPLATE_NAME)
+
+    async def render_in_threadpool() -> None:
+        message = _form_message()
+        message.template_body = await run_in_threadpool(
+            renderer.render_body,
+            TEMPLATE_NAME,
+            message.template_body
+        )
+        message.subtype = 'html'
+        await renderer.render(message)
+
+    for name, call in [
+        ('fastapi_mail', render_with_fastapi_mail),
+        ('precompiled', render),
+        ('precompiled, threadpool', render_in_threadpool)
+    ]:
+        timing = await measure(name, call, rounds=2000, warmup=200)
+        print(f'{timing} ~ {1_000_000 / timing.median_in_us:.0f} mails/s')
+
+
+if __name__ == '__main__':
+    asyncio.run(main())
@@ -0,0 +1,108 @@
+"""
+Per-response serialization cost of an `AuthResult`.
+
+Runs the same endpoint, returning a prebuilt result, through FastAPI's
+`APIRoute` with the stdlib encoder and through `ORJSONRoute`.
+Only the route handler is called, with no server in between:
+
+    $ APP_ENV=test python -m benchmarks.responses
+
+Needs no services.
+"""
+
+import asyncio
+from typing import Any
+
+from fastapi import (
+    APIRouter,
+    FastAPI
+)
+from fastapi.responses import JSONResponse
+from fastapi.routing import APIRoute
+
+from .common import (
+    Timing,
+    measure
+)
+from app.api.responses import ORJSONResponse
+from app.api.routing import ORJSONRoute
+from app.schemas.auth import (
+    AuthResult,
+    CredentialsInResponse
+)
+from app.schemas.user import UserInResponse
+
+
+AUTH_RESULT = AuthResult(
+    credentials=CredentialsInResponse(
+        access_token='a' * 220,
+        expires_in=600,
+        refresh_token='b2c4ff0a-8d0b-4bcb-a0f5-6a09b3b0b3a4'
+    ),
+    user=UserInResponse(
+        id=1,
+        email='user@gmail.com',
+        username='userUsername',
+        is_active=True,
+        is_superuser=False
+    )
+)
+
+
+def _build_app(
+    route_class: type[APIRoute],
+    response_class: type[JSONResponse]
+) -> FastAPI:
+    router = APIRouter(route_class=route_class)
+
+    @router.get('/result', response_model=AuthResult)
+    async def get_result() -> AuthResult:
+        return AUTH_RESULT
+
+    app = FastAPI(default_response_class=response_class)
+    app.include_router(router)
+    return app
+
+
+async def _measure(name: str, app: FastAPI) -> Timing:
+    scope = {
+        'type': 'http',
+        'app': app,
+        'method': 'GET',
+        'path': '/result',
+        'headers': [],
+        'query_string': b''
+    }
+
+    async def receive() -> dict[str, Any]:
+        return {'type': 'http.request', 'body': b''}
+
+    async def send(message: dict[str, Any]) -> None:
+        pass
+
+    async def respond() -> None:
+        await app(scope, receive, send)
+
+    return await measure(name, respond)
+
+
+async def main() -> None:
+    fastapi = await _measure(
+        'APIRoute + JSONResponse',
+        _build_app(APIRoute, JSONResponse)
+    )
+    orjson = await _measure(
+        'ORJSONRoute + ORJSONResponse',
+        _build_app(ORJSONRoute, ORJSONResponse)
+    )
+    print(fastapi)
+    print(orjson)
+    print(
+        f'Saving per response: '
+        f'{fastapi.median_in_us - orjson.median_in_us:.1f} us '
+        f'({1 - orjson.median_in_us / fastapi.median_in_us:.0%}).'
+    )
+
+
+if __name__ == '__main__':
+    asyncio.run(main())
@@ -1,5 +1,6 @@
 from datetime import timedelta
 
+import jwt
 from httpx import Response
 from starlette.status import HTTP_200_OK
 
@@ -11,6 +12,7 @@ from app.db.repos import (
     RefreshSessionsRepo,
     UsersRepo
 )
+from app.utils.datetime_ import to_timestamp
 from tests.test_api.dtos import MetaUser
 
 
@@ -64,7 +66,14 @@ async def assert_refresh_session_is_created(
     refresh_token = response_json['credentials']['refresh_token']
     session = await repo.get_one_by_refresh_token(refresh_token)
     assert session.user_id == (user_id or response_json['user']['id'])
-    assert session.access_token == access_token
+    access_token_claims = jwt.decode(
+        access_token,
+        options={'verify_signature': False}
+    )
+    assert session.access_token_jti.hex == access_token_claims['jti']
+    assert to_timestamp(session.access_token_expires_at) == (
+        access_token_claims['exp']
+    )
     expire_in_seconds = settings.refresh_token_expire_in_seconds
     expire_timedelta: timedelta = session.expires_at - session.created_at
     assert (
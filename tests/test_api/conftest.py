@@ -25,6 +25,8 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.dependencies.markers import (
     DBSessionInTransactionMarker,
+    JWTBlacklistServiceMarker,
+    JWTServiceMarker,
     MailSenderMarker,
     PasswordCryptContextMarker,
     RedisMarker
@@ -132,27 +134,27 @@ async def db_session(
 
 
 @pytest.fixture
-def redis(
+async def redis(
     deps: Deps
 ) -> RedisClient:
     call = deps[RedisMarker]
-    return call()
+    return await call()
 
 
 @pytest.fixture
-def mail_sender(
+async def mail_sender(
     deps: Deps
 ) -> FastMail:
     call = deps[MailSenderMarker]
-    return call()
+    return await call()
 
 
 @pytest.fixture
-def pwd_context(
+async def pwd_context(
     deps: Deps
 ) -> CryptContext:
     call = deps[PasswordCryptContextMarker]
-    return call()
+    return await call()
 
 
 @pytest.fixture
@@ -178,21 +180,19 @@ def user_service(
 
 
 @pytest.fixture
-def jwt_service(
-    settings: AppSettings
+async def jwt_service(
+    deps: Deps
 ) -> JWTService:
-    return JWTService(settings)
+    call = deps[JWTServiceMarker]
+    return await call()
 
 
 @pytest.fixture
-def jwt_blacklist_service(
-    settings: AppSettings,
-    redis: RedisClient
+async def jwt_blacklist_service(
+    deps: Deps
 ) -> JWTBlacklistService:
-    return JWTBlacklistService(
-        redis=redis,
-        settings=settings
-    )
+    call = deps[JWTBlacklistServiceMarker]
+    return await call()
 
 
 # users
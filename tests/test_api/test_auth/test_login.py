@@ -1,19 +1,30 @@
 """
-Route works with DB.
+Route works with Redis and DB.
 
 Cleanup:
+    - cleanup_redis
     - user_1
 """
 
+from uuid import uuid4
+
+import pytest
 from fastapi import FastAPI
 from httpx import AsyncClient
 from sqlalchemy.ext.asyncio import AsyncSession
-from starlette.status import HTTP_401_UNAUTHORIZED
+from starlette.status import (
+    HTTP_401_UNAUTHORIZED,
+    HTTP_429_TOO_MANY_REQUESTS
+)
 
 from app.core.settings import AppSettings
 from app.db.models import User
 from app.db.repos import RefreshSessionsRepo
-from app.services.auth.errors import LoginError
+from app.services.auth.errors import (
+    LoginError,
+    LoginIsThrottledError
+)
+from app.utils.datetime_ import compute_expire
 from tests.test_api.common.auth import (
     assert_auth_result_is_correct,
     assert_refresh_session_is_created
@@ -24,6 +35,11 @@ from tests.test_api.dtos import MetaUser
 ROUTE_NAME = 'auth:login'
 
 
+@pytest.fixture(autouse=True)
+async def cleanup_redis(flush_redis_db_after_test: None) -> None:
+    pass
+
+
 async def test_response_when_user_with_such_email_does_not_exist(
     app: FastAPI,
     meta_user_1: MetaUser,
@@ -57,6 +73,30 @@ async def test_response_when_password_is_incorrect(
     assert response.json()['detail'] == LoginError.detail
 
 
+async def test_response_when_too_many_attempts_have_failed(
+    settings: AppSettings,
+    app: FastAPI,
+    no_auth_client_1: AsyncClient,
+    meta_user_1: MetaUser
+):
+    payload = meta_user_1.in_login.copy(
+        update={'password': 'incorrectPassword'}
+    )
+    for _ in range(settings.login_failures_limit_per_email):
+        await no_auth_client_1.post(
+            app.url_path_for(ROUTE_NAME),
+            json=payload.dict()
+        )
+
+    response = await no_auth_client_1.post(
+        app.url_path_for(ROUTE_NAME),
+        json=meta_user_1.in_login.dict()
+    )
+
+    assert response.status_code == HTTP_429_TOO_MANY_REQUESTS
+    assert response.json()['detail'] == LoginIsThrottledError.detail
+
+
 async def test_response_on_success(
     settings: AppSettings,
     app: FastAPI,
@@ -93,3 +133,39 @@ async def test_create_refresh_session_on_success(
         repo=RefreshSessionsRepo(db_session),
         response=response
     )
+
+
+async def test_evict_oldest_refresh_sessions_on_success(
+    settings: AppSettings,
+    app: FastAPI,
+    db_session: AsyncSession,
+    meta_user_1: MetaUser,
+    user_1: User,
+    no_auth_client_1: AsyncClient
+):
+    repo = RefreshSessionsRepo(db_session)
+    limit = settings.refresh_sessions_per_user_limit
+    sessions = await repo.create_many(*[
+        {
+            'user_id': user_1.id,
+            'ip_address': '127.0.0.1',
+            'user_agent': 'httpx',
+            'expires_at': compute_expire(100 + i),
+            'access_token_jti': uuid4(),
+            'access_token_expires_at': compute_expire(100)
+        }
+        for i in range(limit)
+    ])
+    await db_session.commit()
+
+    await no_auth_client_1.post(
+        app.url_path_for(ROUTE_NAME),
+        json=meta_user_1.in_login.dict()
+    )
+
+    user_sessions = await repo.get_many_active_by_user_id(
+        user_1.id,
+        limit=limit + 1
+    )
+    assert len(user_sessions) == limit
+    assert sessions[0].id not in {session.id for session in user_sessions}
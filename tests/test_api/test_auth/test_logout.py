@@ -68,7 +68,8 @@ async def test_response_when_refresh_session_expired(
         ip_address='127.0.0.1',
         user_agent='httpx',
         expires_at=compute_expire(-100),
-        access_token=jwt_service.generate(user_1)
+        access_token_jti=uuid4(),
+        access_token_expires_at=compute_expire(jwt_service.expire_in_seconds)
     )
     await db_session.commit()
 
@@ -95,7 +96,8 @@ async def test_response_on_success(
         ip_address='127.0.0.1',
         user_agent='httpx',
         expires_at=compute_expire(settings.refresh_token_expire_in_seconds),
-        access_token=jwt_service.generate(user_1)
+        access_token_jti=uuid4(),
+        access_token_expires_at=compute_expire(jwt_service.expire_in_seconds)
     )
     await db_session.commit()
 
@@ -118,24 +120,25 @@ async def test_blacklist_access_token_on_success(
     user_1: User,
     no_auth_client_1: AsyncClient
 ):
-    access_token = jwt_service.generate(user_1)
+    access_token_jti = uuid4()
     refresh_session = await RefreshSessionsRepo(db_session).create_one(
         user_id=user_1.id,
         ip_address='127.0.0.1',
         user_agent='httpx',
         expires_at=compute_expire(settings.refresh_token_expire_in_seconds),
-        access_token=access_token
+        access_token_jti=access_token_jti,
+        access_token_expires_at=compute_expire(jwt_service.expire_in_seconds)
     )
     await db_session.commit()
-    token_claims = jwt_service.verify(access_token)
 
     await no_auth_client_1.get(
         app.url_path_for(ROUTE_NAME),
         cookies={REFRESH_TOKEN_COOKIE_KEY: refresh_session.refresh_token}
     )
 
-    jti = token_claims.meta.jti
-    assert await jwt_blacklist_service.check_is_blacklisted(jti)
+    assert await jwt_blacklist_service.check_is_blacklisted(
+        access_token_jti.hex
+    )
 
 
 async def test_delete_refresh_session_on_success(
@@ -152,7 +155,8 @@ async def test_delete_refresh_session_on_success(
         ip_address='127.0.0.1',
         user_agent='httpx',
         expires_at=compute_expire(settings.refresh_token_expire_in_seconds),
-        access_token=jwt_service.generate(user_1)
+        access_token_jti=uuid4(),
+        access_token_expires_at=compute_expire(jwt_service.expire_in_seconds)
     )
     await db_session.commit()
 
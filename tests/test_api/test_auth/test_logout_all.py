@@ -0,0 +1,100 @@
+"""
+Route works with Redis and DB.
+
+Cleanup:
+    - cleanup_redis
+    - user_1
+"""
+
+from uuid import uuid4
+
+import pytest
+from fastapi import FastAPI
+from httpx import AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession
+from starlette.status import (
+    HTTP_200_OK,
+    HTTP_401_UNAUTHORIZED
+)
+
+from app.core.settings import AppSettings
+from app.db.models import User
+from app.db.repos import RefreshSessionsRepo
+from app.resources.strings.auth import ACCESS_TOKEN_IS_REVOKED
+from app.services.jwt_ import (
+    JWTBlacklistService,
+    JWTService
+)
+from app.services.redis_ import RedisClient
+from app.utils.datetime_ import compute_expire
+
+
+ROUTE_NAME = 'auth:logout_all'
+
+
+@pytest.fixture(autouse=True)
+async def cleanup_redis(flush_redis_db_after_test: None) -> None:
+    pass
+
+
+async def test_response_on_success(
+    app: FastAPI,
+    client_1: AsyncClient
+):
+    response = await client_1.get(app.url_path_for(ROUTE_NAME))
+
+    assert response.status_code == HTTP_200_OK
+    assert 'refresh_token' not in response.cookies
+
+
+async def test_revoke_access_tokens_on_success(
+    app: FastAPI,
+    client_1: AsyncClient
+):
+    await client_1.get(app.url_path_for(ROUTE_NAME))
+
+    response = await client_1.get(app.url_path_for(ROUTE_NAME))
+
+    assert response.status_code == HTTP_401_UNAUTHORIZED
+    assert response.json()['detail'] == ACCESS_TOKEN_IS_REVOKED
+
+
+async def test_expire_token_version_on_success(
+    app: FastAPI,
+    settings: AppSettings,
+    redis: RedisClient,
+    user_1: User,
+    client_1: AsyncClient
+):
+    await client_1.get(app.url_path_for(ROUTE_NAME))
+
+    ttl = await redis.ttl(JWTBlacklistService.format_token_version_key(user_1.id))
+    assert 0 < ttl <= settings.refresh_token_expire_in_seconds
+
+
+async def test_delete_refresh_sessions_on_success(
+    app: FastAPI,
+    db_session: AsyncSession,
+    jwt_service: JWTService,
+    user_1: User,
+    client_1: AsyncClient
+):
+    repo = RefreshSessionsRepo(db_session)
+    for _ in range(2):
+        await repo.create_one(
+            user_id=user_1.id,
+            ip_address='127.0.0.1',
+            user_agent='httpx',
+            expires_at=compute_expire(100),
+            access_token_jti=uuid4(),
+            access_token_expires_at=compute_expire(
+                jwt_service.expire_in_seconds
+            )
+        )
+    await db_session.commit()
+
+    await client_1.get(app.url_path_for(ROUTE_NAME))
+
+    assert not await repo.exists(
+        [RefreshSessionsRepo.model.user_id == user_1.id]
+    )
@@ -69,7 +69,8 @@ async def test_response_when_refresh_session_expired(
         ip_address='127.0.0.1',
         user_agent='httpx',
         expires_at=compute_expire(-100),
-        access_token=jwt_service.generate(user_1)
+        access_token_jti=uuid4(),
+        access_token_expires_at=compute_expire(jwt_service.expire_in_seconds)
     )
     await db_session.commit()
 
@@ -96,7 +97,8 @@ async def test_response_on_success(
         ip_address='127.0.0.1',
         user_agent='httpx',
         expires_at=compute_expire(settings.refresh_token_expire_in_seconds),
-        access_token=jwt_service.generate(user_1)
+        access_token_jti=uuid4(),
+        access_token_expires_at=compute_expire(jwt_service.expire_in_seconds)
     )
     await db_session.commit()
 
@@ -131,7 +133,8 @@ async def test_delete_old_refresh_session_on_success(
         ip_address='127.0.0.1',
         user_agent='httpx',
         expires_at=compute_expire(settings.refresh_token_expire_in_seconds),
-        access_token=jwt_service.generate(user_1)
+        access_token_jti=uuid4(),
+        access_token_expires_at=compute_expire(jwt_service.expire_in_seconds)
     )
     await db_session.commit()
 
@@ -157,24 +160,25 @@ async def test_blacklist_access_token_on_success(
     user_1: User,
     no_auth_client_1: AsyncClient
 ):
-    access_token = jwt_service.generate(user_1)
+    access_token_jti = uuid4()
     refresh_session = await RefreshSessionsRepo(db_session).create_one(
         user_id=user_1.id,
         ip_address='127.0.0.1',
         user_agent='httpx',
         expires_at=compute_expire(settings.refresh_token_expire_in_seconds),
-        access_token=access_token
+        access_token_jti=access_token_jti,
+        access_token_expires_at=compute_expire(jwt_service.expire_in_seconds)
     )
     await db_session.commit()
-    token_claims = jwt_service.verify(access_token)
 
     await no_auth_client_1.get(
         app.url_path_for(ROUTE_NAME),
         cookies={REFRESH_TOKEN_COOKIE_KEY: refresh_session.refresh_token}
     )
 
-    jti = token_claims.meta.jti
-    assert await jwt_blacklist_service.check_is_blacklisted(jti)
+    assert await jwt_blacklist_service.check_is_blacklisted(
+        access_token_jti.hex
+    )
 
 
 async def test_create_refresh_session_on_success(
@@ -191,7 +195,8 @@ async def test_create_refresh_session_on_success(
         ip_address='127.0.0.1',
         user_agent='httpx',
         expires_at=compute_expire(settings.refresh_token_expire_in_seconds),
-        access_token=jwt_service.generate(user_1)
+        access_token_jti=uuid4(),
+        access_token_expires_at=compute_expire(jwt_service.expire_in_seconds)
     )
     await db_session.commit()
 
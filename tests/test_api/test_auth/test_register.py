@@ -25,6 +25,7 @@ from app.services.auth.errors import (
     EmailIsAlreadyTakenError,
     UsernameIsAlreadyTakenError
 )
+from app.services.redis_ import RedisClient
 from app.services.verification import VerificationService
 from tests.test_api.common.auth import (
     assert_auth_result_is_correct,
@@ -81,6 +82,32 @@ async def test_response_when_verification_is_incorrect(
     assert response.status_code == HTTP_401_UNAUTHORIZED
 
 
+async def test_invalidate_verification_after_max_attempts(
+    settings: AppSettings,
+    app: FastAPI,
+    verification_service: VerificationService,
+    meta_user_1: MetaUser,
+    client: AsyncClient
+):
+    code = await verification_service.get(meta_user_1.email)
+    incorrect_code = int(code) % 999_999 + 1
+    assert incorrect_code != int(code)
+    for _ in range(settings.verification_code_max_attempts):
+        await client.post(
+            app.url_path_for(ROUTE_NAME),
+            params={'code': incorrect_code},
+            json=meta_user_1.in_create.dict()
+        )
+
+    response = await client.post(
+        app.url_path_for(ROUTE_NAME),
+        params={'code': code},
+        json=meta_user_1.in_create.dict()
+    )
+
+    assert response.status_code == HTTP_401_UNAUTHORIZED
+
+
 async def test_response_when_email_is_taken(
     app: FastAPI,
     verification_service: VerificationService,
@@ -194,6 +221,7 @@ async def test_create_refresh_session_on_success(
 
 async def test_delete_verification_on_success(
     app: FastAPI,
+    redis: RedisClient,
     verification_service: VerificationService,
     meta_user_1: MetaUser,
     client: AsyncClient
@@ -207,8 +235,29 @@ async def test_delete_verification_on_success(
     )
 
     key = verification_service.format_key(meta_user_1.email)
-    db_code = await verification_service.raw_get(key)
-    assert db_code is None
+    assert not await redis.exists(key)
+
+
+async def test_reject_reused_code(
+    app: FastAPI,
+    verification_service: VerificationService,
+    meta_user_1: MetaUser,
+    client: AsyncClient
+):
+    code = await verification_service.get(meta_user_1.email)
+    await client.post(
+        app.url_path_for(ROUTE_NAME),
+        params={'code': code},
+        json=meta_user_1.in_create.dict()
+    )
+
+    response = await client.post(
+        app.url_path_for(ROUTE_NAME),
+        params={'code': code},
+        json=meta_user_1.in_create.dict()
+    )
+
+    assert response.status_code == HTTP_401_UNAUTHORIZED
 
 
 async def test_send_mail_on_success(
@@ -0,0 +1,81 @@
+"""
+Route works with Redis and DB.
+
+Cleanup:
+    - cleanup_redis
+    - user_1
+"""
+
+from uuid import uuid4
+
+import pytest
+from fastapi import FastAPI
+from httpx import AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession
+from starlette.status import HTTP_200_OK
+
+from app.db.models import (
+    RefreshSession,
+    User
+)
+from app.db.repos import RefreshSessionsRepo
+from app.utils.datetime_ import compute_expire
+
+
+ROUTE_NAME = 'auth:sessions'
+
+
+@pytest.fixture(autouse=True)
+async def cleanup_redis(flush_redis_db_after_test: None) -> None:
+    pass
+
+
+@pytest.fixture
+async def refresh_sessions(
+    db_session: AsyncSession,
+    user_1: User
+) -> list[RefreshSession]:
+    sessions = await RefreshSessionsRepo(db_session).create_many(*[
+        {
+            'user_id': user_1.id,
+            'ip_address': f'127.0.0.{i}',
+            'user_agent': 'httpx',
+            'expires_at': compute_expire(expire_in_seconds),
+            'access_token_jti': uuid4(),
+            'access_token_expires_at': compute_expire(100)
+        }
+        for i, expire_in_seconds in enumerate([100, 300, -100, 200])
+    ])
+    await db_session.commit()
+    return sessions
+
+
+async def test_response_on_success(
+    app: FastAPI,
+    refresh_sessions: list[RefreshSession],
+    client_1: AsyncClient
+):
+    response = await client_1.get(app.url_path_for(ROUTE_NAME))
+
+    assert response.status_code == HTTP_200_OK
+    assert [session['id'] for session in response.json()] == [
+        refresh_sessions[i].id for i in (1, 3, 0)
+    ]
+    assert response.json()[0]['ip_address'] == '127.0.0.1'
+    assert response.json()[0]['user_agent'] == 'httpx'
+
+
+async def test_response_is_paginated(
+    app: FastAPI,
+    refresh_sessions: list[RefreshSession],
+    client_1: AsyncClient
+):
+    response = await client_1.get(
+        app.url_path_for(ROUTE_NAME),
+        params={'limit': 1, 'offset': 1}
+    )
+
+    assert response.status_code == HTTP_200_OK
+    assert [session['id'] for session in response.json()] == [
+        refresh_sessions[3].id
+    ]
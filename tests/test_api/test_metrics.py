@@ -0,0 +1,24 @@
+"""
+Route works with DB and Redis.
+"""
+
+from fastapi import FastAPI
+from httpx import AsyncClient
+from prometheus_client import CONTENT_TYPE_LATEST
+from starlette.status import HTTP_200_OK
+
+
+async def test_expose_metrics(app: FastAPI, client: AsyncClient):
+    url = app.url_path_for('metrics:get')
+    await client.get(url)
+
+    response = await client.get(url)
+
+    assert response.status_code == HTTP_200_OK
+    assert response.headers['content-type'] == CONTENT_TYPE_LATEST
+    assert 'db_pool_size' in response.text
+    assert 'redis_pool_size' in response.text
+    assert (
+        'http_request_duration_seconds_count'
+        '{method="GET",route="/metrics",status="200"}'
+    ) in response.text
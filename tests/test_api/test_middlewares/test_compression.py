@@ -0,0 +1,181 @@
+"""
+Middleware works with no data backends.
+"""
+
+import gzip
+from collections.abc import (
+    AsyncGenerator,
+    Callable,
+    Iterator
+)
+
+import brotli
+import pytest
+from fastapi import FastAPI
+from fastapi.responses import (
+    PlainTextResponse,
+    StreamingResponse
+)
+from httpx import AsyncClient
+
+from app.api.middlewares import CompressionMiddleware
+from app.api.responses import ORJSONResponse
+
+
+MINIMUM_SIZE = 100
+
+LARGE_CONTENT = {'words': [f'word {i}' for i in range(50)]}
+SMALL_CONTENT = {'access_token': 'token'}
+ETAG = '"etag"'
+
+
+@pytest.fixture
+async def client() -> AsyncGenerator[AsyncClient, None]:
+    app = FastAPI(default_response_class=ORJSONResponse)
+    app.add_middleware(
+        CompressionMiddleware,
+        minimum_size=MINIMUM_SIZE,
+        media_types=['application/json'],
+        gzip_level=6,
+        brotli_quality=4
+    )
+
+    @app.get('/large')
+    async def get_large() -> dict[str, list[str]]:
+        return LARGE_CONTENT
+
+    @app.get('/small')
+    async def get_small() -> dict[str, str]:
+        return SMALL_CONTENT
+
+    @app.get('/text')
+    async def get_text() -> PlainTextResponse:
+        return PlainTextResponse('text' * MINIMUM_SIZE)
+
+    @app.get('/encoded')
+    async def get_encoded() -> ORJSONResponse:
+        return ORJSONResponse(
+            LARGE_CONTENT,
+            headers={'Content-Encoding': 'identity'}
+        )
+
+    @app.get('/etag')
+    async def get_etag() -> ORJSONResponse:
+        return ORJSONResponse(LARGE_CONTENT, headers={'ETag': ETAG})
+
+    @app.get('/stream')
+    async def get_stream() -> StreamingResponse:
+        def iterate() -> Iterator[bytes]:
+            yield b'['
+            yield b','.join(b'"word"' for _ in range(MINIMUM_SIZE))
+            yield b']'
+
+        return StreamingResponse(iterate(), media_type='application/json')
+
+    async with AsyncClient(app=app, base_url='http://test') as client:
+        yield client
+
+
+async def _get_raw(
+    client: AsyncClient,
+    path: str,
+    accept_encoding: str
+) -> tuple[dict[str, str], bytes]:
+    async with client.stream(
+        'GET',
+        path,
+        headers={'Accept-Encoding': accept_encoding}
+    ) as response:
+        return dict(response.headers), b''.join(
+            [chunk async for chunk in response.aiter_raw()]
+        )
+
+
+@pytest.mark.parametrize(
+    'accept_encoding, encoding, decompress',
+    [
+        ('gzip, deflate, br', 'br', brotli.decompress),
+        ('gzip, br;q=0', 'gzip', gzip.decompress),
+        ('gzip', 'gzip', gzip.decompress)
+    ]
+)
+async def test_compress_large_response_with_accepted_encoding(
+    accept_encoding: str,
+    encoding: str,
+    decompress: Callable[[bytes], bytes],
+    client: AsyncClient
+):
+    headers, body = await _get_raw(client, '/large', accept_encoding)
+
+    assert headers['content-encoding'] == encoding
+    assert headers['vary'] == 'Accept-Encoding'
+    assert int(headers['content-length']) == len(body)
+    assert ORJSONResponse(LARGE_CONTENT).body == decompress(body)
+
+
+@pytest.mark.parametrize(
+    'path, accept_encoding',
+    [
+        ('/small', 'gzip, br'),
+        ('/text', 'gzip, br'),
+        ('/encoded', 'gzip, br'),
+        ('/large', 'deflate'),
+        ('/large', '')
+    ]
+)
+async def test_leave_response_uncompressed(
+    path: str,
+    accept_encoding: str,
+    client: AsyncClient
+):
+    headers, body = await _get_raw(client, path, accept_encoding)
+
+    assert headers.get('content-encoding') in {None, 'identity'}
+    assert int(headers['content-length']) == len(body)
+
+
+@pytest.mark.parametrize(
+    'accept_encoding, etag',
+    [
+        ('br', f'W/{ETAG}'),
+        ('gzip', f'W/{ETAG}'),
+        ('', ETAG)
+    ]
+)
+async def test_weaken_etag_of_compressed_response(
+    accept_encoding: str,
+    etag: str,
+    client: AsyncClient
+):
+    headers, _ = await _get_raw(client, '/etag', accept_encoding)
+
+    assert headers['etag'] == etag
+
+
+async def test_compress_streamed_response(client: AsyncClient):
+    headers, body = await _get_raw(client, '/stream', 'gzip')
+
+    assert headers['content-encoding'] == 'gzip'
+    assert 'content-length' not in headers
+    assert gzip.decompress(body) == (
+        b'[' + b','.join(b'"word"' for _ in range(MINIMUM_SIZE)) + b']'
+    )
+
+
+@pytest.mark.parametrize(
+    'accept_encoding, encoding',
+    [
+        ('br;q=0.5, gzip;q=1', 'gzip'),
+        ('gzip;q=0.5, br;q=0.5', 'br'),
+        ('GZIP', 'gzip'),
+        ('gzip;q=0, br;q=0', None),
+        ('gzip;q=x', None),
+        ('*', 'br'),
+        ('*;q=0.5, br;q=0.1', 'gzip'),
+        ('gzip, *;q=0', 'gzip'),
+        ('identity', None),
+        ('', None)
+    ]
+)
+def test_choose_encoding(accept_encoding: str, encoding: str | None):
+    assert CompressionMiddleware.choose_encoding(accept_encoding) == encoding
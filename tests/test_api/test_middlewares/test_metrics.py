@@ -0,0 +1,71 @@
+"""
+Middleware works with no data backends.
+"""
+
+from collections.abc import AsyncGenerator
+
+import pytest
+from fastapi import FastAPI
+from httpx import AsyncClient
+from prometheus_client import REGISTRY
+
+from app.api.middlewares import MetricsMiddleware
+from app.api.middlewares.metrics import UNMATCHED_ROUTE
+
+
+@pytest.fixture
+async def client() -> AsyncGenerator[AsyncClient, None]:
+    app = FastAPI()
+    app.add_middleware(MetricsMiddleware)
+
+    @app.get('/items/{item_id}')
+    async def get_item(item_id: int) -> dict[str, int]:
+        return {'id': item_id}
+
+    @app.get('/error')
+    async def get_error() -> None:
+        raise RuntimeError
+
+    async with AsyncClient(app=app, base_url='http://test') as client:
+        yield client
+
+
+def _count(method: str, route: str, status: str) -> float:
+    value = REGISTRY.get_sample_value(
+        'http_request_duration_seconds_count',
+        {'method': method, 'route': route, 'status': status}
+    )
+    return value or 0
+
+
+@pytest.mark.parametrize(
+    'path, route, status',
+    [
+        ('/items/1', '/items/{item_id}', '200'),
+        ('/items/one', '/items/{item_id}', '422'),
+        ('/unknown', UNMATCHED_ROUTE, '404')
+    ]
+)
+async def test_time_request_by_route_template(
+    path: str,
+    route: str,
+    status: str,
+    client: AsyncClient
+):
+    before = _count('GET', route, status)
+
+    await client.get(path)
+    await client.get(path)
+
+    assert _count('GET', route, status) == before + 2
+    assert REGISTRY.get_sample_value('http_requests_in_flight') == 0
+
+
+async def test_time_failed_request_as_server_error(client: AsyncClient):
+    before = _count('GET', '/error', '500')
+
+    with pytest.raises(RuntimeError):
+        await client.get('/error')
+
+    assert _count('GET', '/error', '500') == before + 1
+    assert REGISTRY.get_sample_value('http_requests_in_flight') == 0
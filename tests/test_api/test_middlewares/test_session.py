@@ -0,0 +1,156 @@
+"""
+Middleware works with Redis and DB.
+
+Cleanup:
+    - cleanup
+"""
+
+import json
+from collections.abc import AsyncGenerator
+
+import pytest
+from fastapi import (
+    FastAPI,
+    Request
+)
+from httpx import AsyncClient
+from pytest_mock import MockerFixture
+from starlette.status import (
+    HTTP_200_OK,
+    HTTP_300_MULTIPLE_CHOICES,
+    HTTP_400_BAD_REQUEST
+)
+
+from app.api.middlewares import RedisSessionMiddleware
+from app.db.enums import OAuthBackend
+from app.resources.strings.oauth import OAUTH_USER_IS_NOT_IN_SESSION
+from app.services.redis_ import RedisClient
+from tests.test_api.dtos import MetaUser
+
+
+@pytest.fixture(autouse=True)
+async def cleanup(
+    flush_redis_db_after_test: None,
+    delete_all_users_after_test: None,
+    client: AsyncClient
+) -> AsyncGenerator[None, None]:
+    yield
+    client.cookies.clear()
+
+
+async def _start_oauth_flow(
+    mocker: MockerFixture,
+    app: FastAPI,
+    meta_user: MetaUser,
+    client: AsyncClient
+) -> str:
+    get_oauth_user = mocker.patch(
+        'app.services.oauth.authorizer.OAuthAuthorizer.get_oauth_user'
+    )
+    get_oauth_user.return_value = meta_user.oauth
+    response = await client.get(
+        app.url_path_for('oauth:callback', backend=OAuthBackend.GOOGLE.value)
+    )
+    assert response.status_code == HTTP_300_MULTIPLE_CHOICES
+    return response.headers['set-cookie']
+
+
+async def test_keep_session_in_redis_and_only_id_in_cookie(
+    mocker: MockerFixture,
+    app: FastAPI,
+    redis: RedisClient,
+    meta_user_1: MetaUser,
+    client: AsyncClient
+):
+    cookie = await _start_oauth_flow(mocker, app, meta_user_1, client)
+
+    session_id = client.cookies['session']
+    assert 'path=/oauth;' in cookie
+    assert meta_user_1.email not in cookie
+    data = await redis.get(RedisSessionMiddleware.format_key(session_id))
+    assert data is not None
+    session = json.loads(data)
+    assert meta_user_1.email in json.dumps(session)
+
+
+async def test_delete_session_once_cleared(
+    mocker: MockerFixture,
+    app: FastAPI,
+    redis: RedisClient,
+    meta_user_1: MetaUser,
+    client: AsyncClient
+):
+    await _start_oauth_flow(mocker, app, meta_user_1, client)
+    session_id = client.cookies['session']
+
+    response = await client.post(
+        app.url_path_for('oauth:register', backend=OAuthBackend.GOOGLE.value),
+        json=meta_user_1.in_oauth_create.dict()
+    )
+
+    assert response.status_code == HTTP_200_OK
+    assert 'session' not in client.cookies
+    key = RedisSessionMiddleware.format_key(session_id)
+    assert not await redis.exists(key)
+
+
+async def test_start_empty_session_for_unknown_id(
+    app: FastAPI,
+    meta_user_1: MetaUser,
+    client: AsyncClient
+):
+    client.cookies.set('session', 'unknownSessionId', path='/oauth')
+
+    response = await client.post(
+        app.url_path_for('oauth:register', backend=OAuthBackend.GOOGLE.value),
+        json=meta_user_1.in_oauth_create.dict()
+    )
+
+    assert response.status_code == HTTP_400_BAD_REQUEST
+    assert response.json()['detail'] == OAUTH_USER_IS_NOT_IN_SESSION
+
+
+async def test_not_touch_session_out_of_path(
+    app: FastAPI,
+    redis: RedisClient,
+    meta_user_1: MetaUser,
+    client: AsyncClient
+):
+    response = await client.post(
+        app.url_path_for('auth:login'),
+        json=meta_user_1.in_login.dict()
+    )
+
+    assert 'set-cookie' not in response.headers
+    assert not await redis.keys(RedisSessionMiddleware.format_key('*'))
+
+
+@pytest.mark.parametrize(
+    'path, is_in_path',
+    [
+        ('/oauth', True),
+        ('/oauth/google/callback', True),
+        ('/oauthorize', False)
+    ]
+)
+async def test_load_session_only_under_path(
+    path: str,
+    is_in_path: bool,
+    redis: RedisClient
+):
+    app = FastAPI()
+    app.add_middleware(
+        RedisSessionMiddleware,
+        redis=lambda: redis,
+        path='/oauth',
+        max_age_in_seconds=60
+    )
+
+    @app.get('/{path:path}')
+    async def get_path(request: Request) -> dict[str, bool]:
+        return {'has_session': 'session' in request.scope}
+
+    async with AsyncClient(app=app, base_url='http://test') as app_client:
+        response = await app_client.get(path)
+
+    assert response.json() == {'has_session': is_in_path}
@@ -5,10 +5,14 @@ Cleanup:
     - user_1
 """
 
+from dataclasses import replace
+from typing import Any
+
 from authlib.integrations.starlette_client import OAuthError
 from fastapi import FastAPI
 from httpx import AsyncClient
 from pytest_mock import MockerFixture
+from sqlalchemy import event
 from sqlalchemy.ext.asyncio import AsyncSession
 from starlette.status import (
     HTTP_300_MULTIPLE_CHOICES,
@@ -194,3 +198,71 @@ async def test_oauth_user_is_recorded_in_session_when_connection_does_not_exist(
 
     record.assert_called_once_with(get_oauth_user.return_value)
     assert isinstance(get_oauth_user.return_value.is_email_taken, bool)
+
+
+async def test_login_connected_user_whose_email_differs_from_oauth_one(
+    mocker: MockerFixture,
+    settings: AppSettings,
+    app: FastAPI,
+    db_session: AsyncSession,
+    meta_user_1: MetaUser,
+    user_1: User,
+    client_1: AsyncClient
+):
+    backend = OAuthBackend.GOOGLE
+    oauth_user = replace(meta_user_1.oauth, email='other@gmail.com')
+    await OAuthConnectionsRepo(db_session).link(
+        oauth_user=oauth_user,
+        internal_user_id=user_1.id,
+        backend=backend
+    )
+    await db_session.commit()
+    get_oauth_user = mocker.patch(
+        'app.services.oauth.authorizer.OAuthAuthorizer.get_oauth_user'
+    )
+    get_oauth_user.return_value = oauth_user
+
+    response = await client_1.get(
+        app.url_path_for(
+            ROUTE_NAME,
+            backend=backend.value
+        )
+    )
+
+    assert_auth_result_is_correct(
+        settings=settings,
+        meta_user=meta_user_1,
+        response=response
+    )
+
+
+async def test_query_db_once_when_connection_does_not_exist(
+    mocker: MockerFixture,
+    app: FastAPI,
+    db_session: AsyncSession,
+    meta_user_1: MetaUser,
+    client_1: AsyncClient
+):
+    get_oauth_user = mocker.patch(
+        'app.services.oauth.authorizer.OAuthAuthorizer.get_oauth_user'
+    )
+    get_oauth_user.return_value = meta_user_1.oauth
+    statements: list[str] = []
+
+    def record(*args: Any) -> None:
+        statements.append(args[2])
+
+    engine = db_session.bind.sync_engine
+    event.listen(engine, 'before_cursor_execute', record)
+    try:
+        response = await client_1.get(
+            app.url_path_for(
+                ROUTE_NAME,
+                backend=OAuthBackend.GOOGLE.value
+            )
+        )
+    finally:
+        event.remove(engine, 'before_cursor_execute', record)
+
+    assert response.status_code == HTTP_401_UNAUTHORIZED
+    assert len(statements) == 1
@@ -1,10 +1,12 @@
 """
-Route works with DB.
+Route works with Redis and DB.
 
 Cleanup:
+    - cleanup_redis
     - user_1
 """
 
+import pytest
 from fastapi import FastAPI
 from httpx import AsyncClient
 from pytest_mock import MockerFixture
@@ -36,6 +38,11 @@ from tests.test_api.dtos import MetaUser
 ROUTE_NAME = 'oauth:link'
 
 
+@pytest.fixture(autouse=True)
+async def cleanup_redis(flush_redis_db_after_test: None) -> None:
+    pass
+
+
 async def test_response_when_oauth_user_is_not_in_session(
     mocker: MockerFixture,
     app: FastAPI,
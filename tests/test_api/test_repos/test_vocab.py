@@ -0,0 +1,202 @@
+"""
+Repo works with DB.
+
+Cleanup:
+    - delete_all_users_after_test
+"""
+
+from typing import Any
+
+import pytest
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db.errors import EntityDoesNotExistError
+from app.db.models import (
+    Tag,
+    User,
+    Vocab,
+    Word
+)
+from app.db.repos import (
+    TagsRepo,
+    VocabsRepo,
+    VocabTagAssociationsRepo,
+    WordsRepo
+)
+from app.dtos.vocab import VocabVersion
+
+
+@pytest.fixture(autouse=True)
+async def cleanup(delete_all_users_after_test: None) -> None:
+    pass
+
+
+@pytest.fixture
+def vocabs_repo(db_session: AsyncSession) -> VocabsRepo:
+    return VocabsRepo(db_session)
+
+
+@pytest.fixture
+def words_repo(db_session: AsyncSession) -> WordsRepo:
+    return WordsRepo(db_session)
+
+
+@pytest.fixture
+def tags_repo(db_session: AsyncSession) -> TagsRepo:
+    return TagsRepo(db_session)
+
+
+@pytest.fixture
+def vocab_tags_repo(db_session: AsyncSession) -> VocabTagAssociationsRepo:
+    return VocabTagAssociationsRepo(db_session)
+
+
+@pytest.fixture
+async def tag(user_1: User, tags_repo: TagsRepo) -> Tag:
+    tag = await tags_repo.create_one(
+        title='title',
+        description='description',
+        user_id=user_1.id
+    )
+    await tags_repo.session.commit()
+    return tag
+
+
+@pytest.fixture
+async def vocab(user_1: User, vocabs_repo: VocabsRepo) -> Vocab:
+    vocab = await vocabs_repo.create_one(
+        title='title',
+        description='description',
+        is_public=False,
+        user_id=user_1.id
+    )
+    await vocabs_repo.session.commit()
+    return vocab
+
+
+async def _create_word(words_repo: WordsRepo, vocab: Vocab, word: str) -> Word:
+    created = await words_repo.create_one(
+        word=word,
+        sentences=[],
+        vocab_id=vocab.id
+    )
+    await words_repo.session.commit()
+    return created
+
+
+async def test_get_version__of_vocab_with_no_words(
+    user_1: User,
+    vocab: Vocab,
+    vocabs_repo: VocabsRepo
+):
+    version = await vocabs_repo.get_version_if_permitted_to_read(
+        vocab.id,
+        user_1.id
+    )
+
+    assert version == VocabVersion(vocab.id, 1)
+
+
+async def test_get_version__changes_with_words_and_tags(
+    user_1: User,
+    tag: Tag,
+    vocab: Vocab,
+    tags_repo: TagsRepo,
+    vocabs_repo: VocabsRepo,
+    vocab_tags_repo: VocabTagAssociationsRepo,
+    words_repo: WordsRepo
+):
+    etags: list[str] = []
+
+    async def save_etag() -> None:
+        version = await vocabs_repo.get_version_if_permitted_to_read(
+            vocab.id,
+            user_1.id
+        )
+        etags.append(version.etag)
+
+    await save_etag()
+    word = await _create_word(words_repo, vocab, 'word')
+    await save_etag()
+    await _create_word(words_repo, vocab, 'other')
+    await save_etag()
+    await words_repo.update_one_by_pk(word.id, is_learned=True)
+    await words_repo.session.commit()
+    await save_etag()
+    await words_repo.delete_one_by_pk(word.id)
+    await words_repo.session.commit()
+    await save_etag()
+    await vocabs_repo.update_one_by_pk(vocab.id, title='new title')
+    await vocabs_repo.session.commit()
+    await save_etag()
+    await vocab_tags_repo.create_one(vocab_id=vocab.id, tag_id=tag.id)
+    await vocab_tags_repo.session.commit()
+    await save_etag()
+    await tags_repo.update_one_by_pk(tag.id, title='new title')
+    await tags_repo.session.commit()
+    await save_etag()
+    await vocab_tags_repo.delete_one_by_pk((vocab.id, tag.id))
+    await vocab_tags_repo.session.commit()
+    await save_etag()
+
+    assert len(set(etags)) == len(etags)
+
+
+async def test_get_version__changes_within_one_transaction(
+    user_1: User,
+    vocab: Vocab,
+    vocabs_repo: VocabsRepo,
+    words_repo: WordsRepo
+):
+    await words_repo.create_one(word='word', sentences=[], vocab_id=vocab.id)
+    first = await vocabs_repo.get_version_if_permitted_to_read(
+        vocab.id,
+        user_1.id
+    )
+    await words_repo.create_one(word='other', sentences=[], vocab_id=vocab.id)
+    second = await vocabs_repo.get_version_if_permitted_to_read(
+        vocab.id,
+        user_1.id
+    )
+    await words_repo.session.commit()
+
+    assert first.etag != second.etag
+
+
+async def test_get_version__in_one_query(
+    user_1: User,
+    vocab: Vocab,
+    vocabs_repo: VocabsRepo,
+    words_repo: WordsRepo
+):
+    await _create_word(words_repo, vocab, 'word')
+    statements = []
+
+    def record(*args: Any) -> None:
+        statements.append(args[2])
+
+    engine = vocabs_repo.session.bind.sync_engine
+    event.listen(engine, 'before_cursor_execute', record)
+    try:
+        version = await vocabs_repo.get_version_if_permitted_to_read(
+            vocab.id,
+            user_1.id
+        )
+    finally:
+        event.remove(engine, 'before_cursor_execute', record)
+
+    assert version.version == 2
+    assert len(statements) == 1
+
+
+async def test_get_version__of_not_permitted_vocab(
+    user_1: User,
+    vocab: Vocab,
+    vocabs_repo: VocabsRepo
+):
+    with pytest.raises(EntityDoesNotExistError):
+        await vocabs_repo.get_version_if_permitted_to_read(
+            vocab.id,
+            user_1.id + 1
+        )
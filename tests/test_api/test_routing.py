@@ -0,0 +1,209 @@
+"""
+Routes work with no data backends.
+"""
+
+from collections.abc import AsyncGenerator
+from dataclasses import dataclass
+from datetime import (
+    datetime,
+    timezone
+)
+from ipaddress import IPv4Address
+from unittest.mock import Mock
+
+import orjson
+import pytest
+from fastapi import (
+    APIRouter,
+    FastAPI,
+    Response
+)
+from fastapi.responses import JSONResponse
+from fastapi.routing import APIRoute
+from httpx import AsyncClient
+from pytest_mock import MockerFixture
+from starlette.status import HTTP_201_CREATED
+
+from app.api.responses import ORJSONResponse
+from app.api.routing import ORJSONRoute
+from app.schemas.mixins import OrmModeMixin
+
+
+class Session(OrmModeMixin):
+    ip_address: IPv4Address
+    created_at: datetime
+
+
+class SessionWithUserAgent(Session):
+    user_agent: str
+
+
+@dataclass
+class SessionRow:
+    ip_address: str
+    created_at: datetime
+
+
+SESSION = Session(
+    ip_address=IPv4Address('127.0.0.1'),
+    created_at=datetime(2022, 1, 2, 3, 4, 5, tzinfo=timezone.utc)
+)
+
+
+def _build_app(route_class: type[APIRoute], content: Mock) -> FastAPI:
+    router = APIRouter(route_class=route_class)
+
+    @router.get('/model', response_model=Session)
+    async def get_model(response: Response) -> Session:
+        response.set_cookie('cookie', 'value')
+        return content()
+
+    @router.post('/created', response_model=Session, status_code=HTTP_201_CREATED)
+    async def get_created() -> Session:
+        return content()
+
+    @router.get('/json', response_model=Session, response_class=JSONResponse)
+    async def get_json() -> Session:
+        return content()
+
+    @router.get('/sync', response_model=Session)
+    def get_sync() -> Session:
+        return content()
+
+    @router.post(
+        '/shaped',
+        response_model=Session,
+        response_model_exclude={'created_at'},
+        status_code=HTTP_201_CREATED
+    )
+    async def get_shaped() -> Session:
+        return content()
+
+    app = FastAPI(default_response_class=ORJSONResponse)
+    app.include_router(router)
+    return app
+
+
+@pytest.fixture
+def content() -> Mock:
+    return Mock(return_value=SESSION)
+
+
+@pytest.fixture
+async def orjson_client(
+    content: Mock
+) -> AsyncGenerator[AsyncClient, None]:
+    app = _build_app(ORJSONRoute, content)
+    async with AsyncClient(app=app, base_url='http://test') as client:
+        yield client
+
+
+@pytest.fixture
+async def fastapi_client(
+    content: Mock
+) -> AsyncGenerator[AsyncClient, None]:
+    app = _build_app(APIRoute, content)
+    async with AsyncClient(app=app, base_url='http://test') as client:
+        yield client
+
+
+@pytest.mark.parametrize(
+    'method, path',
+    [
+        ('GET', '/model'),
+        ('POST', '/created'),
+        ('GET', '/json'),
+        ('GET', '/sync')
+    ]
+)
+async def test_response_is_the_same_as_fastapi_one(
+    method: str,
+    path: str,
+    orjson_client: AsyncClient,
+    fastapi_client: AsyncClient
+):
+    response = await orjson_client.request(method, path)
+    expected = await fastapi_client.request(method, path)
+
+    assert response.status_code == expected.status_code
+    assert response.json() == expected.json()
+    assert response.headers.get('set-cookie') == (
+        expected.headers.get('set-cookie')
+    )
+
+
+async def test_response_of_shaped_model_is_left_to_fastapi(
+    orjson_client: AsyncClient,
+    fastapi_client: AsyncClient
+):
+    response = await orjson_client.post('/shaped')
+    expected = await fastapi_client.post('/shaped')
+
+    assert response.status_code == HTTP_201_CREATED
+    assert response.json() == expected.json() == {'ip_address': '127.0.0.1'}
+
+
+async def test_response_validates_orm_object(
+    content: Mock,
+    orjson_client: AsyncClient
+):
+    content.return_value = SessionRow('127.0.0.1', SESSION.created_at)
+
+    response = await orjson_client.get('/model')
+
+    assert Session.parse_obj(response.json()) == SESSION
+
+
+async def test_response_skips_validation_of_model(
+    mocker: MockerFixture,
+    orjson_client: AsyncClient
+):
+    validate = mocker.spy(Session, 'validate')
+
+    await orjson_client.get('/model')
+
+    validate.assert_not_called()
+
+
+async def test_response_leaves_out_fields_of_model_subclass(
+    content: Mock,
+    orjson_client: AsyncClient
+):
+    content.return_value = SessionWithUserAgent(
+        **SESSION.dict(),
+        user_agent='Mozilla/5.0'
+    )
+
+    response = await orjson_client.get('/model')
+
+    assert 'user_agent' not in response.json()
+    assert Session.parse_obj(response.json()) == SESSION
+
+
+async def test_response_is_left_to_fastapi_for_other_response_class(
+    mocker: MockerFixture,
+    orjson_client: AsyncClient
+):
+    dumps = mocker.spy(orjson, 'dumps')
+
+    await orjson_client.get('/json')
+
+    dumps.assert_not_called()
+
+
+async def test_response_passes_response_through(
+    content: Mock,
+    orjson_client: AsyncClient
+):
+    content.return_value = Response('text')
+
+    response = await orjson_client.get('/model')
+
+    assert response.text == 'text'
+
+
+def test_response_class_encodes_models():
+    assert ORJSONResponse({'session': SESSION}).body == (
+        b'{"session":{"ip_address":"127.0.0.1",'
+        b'"created_at":"2022-01-02T03:04:05+00:00"}}'
+    )
@@ -5,6 +5,8 @@ Cleanup:
     - cleanup_redis
 """
 
+import asyncio
+
 import pytest
 from fastapi import FastAPI
 from fastapi_mail import FastMail
@@ -12,6 +14,7 @@ from httpx import AsyncClient
 from pytest_mock import MockerFixture
 from starlette.status import HTTP_200_OK
 
+from app.core.settings import AppSettings
 from app.db.enums import VerificationAction
 from app.resources.mail.subjects import SUBJECT_FOR_VERIFICATION
 from app.resources.mail.verification import (
@@ -65,7 +68,10 @@ async def test_create_verification_in_db_if_does_not_exist(
         json=payload.dict()
     )
 
-    code = await redis.get(VerificationService.format_key(payload.email))
+    code = await redis.hget(
+        VerificationService.format_key(payload.email),
+        'code'
+    )
     assert code is not None
 
 
@@ -83,8 +89,9 @@ async def test_use_verification_from_db_if_exists(
         action=VerificationAction.REGISTRATION
     )
     code = VerificationService.generate_code()
-    await redis.set(
+    await redis.hset(
         VerificationService.format_key(payload.email),
+        'code',
         code
     )
 
@@ -99,6 +106,29 @@ async def test_use_verification_from_db_if_exists(
     )
 
 
+async def test_response_when_code_is_stored_as_string(
+    app: FastAPI,
+    redis: RedisClient,
+    client: AsyncClient
+):
+    payload = VerificationInCreate(
+        email='user@gmail.com',
+        action=VerificationAction.REGISTRATION
+    )
+    # The key and the value the previous releases stored.
+    await redis.set(
+        f'verification:{payload.email}',
+        VerificationService.generate_code()
+    )
+
+    response = await client.post(
+        app.url_path_for(ROUTE_NAME),
+        json=payload.dict()
+    )
+
+    assert response.status_code == HTTP_200_OK
+
+
 async def test_send_verification_mail(
     app: FastAPI,
     redis: RedisClient,
@@ -110,8 +140,9 @@ async def test_send_verification_mail(
         action=VerificationAction.REGISTRATION
     )
     code = VerificationService.generate_code()
-    await redis.set(
+    await redis.hset(
         VerificationService.format_key(payload.email),
+        'code',
         code
     )
 
@@ -132,3 +163,51 @@ async def test_send_verification_mail(
         mail,
         ACTION_TO_MESSAGE.get(payload.action, DEFAULT_ACTION_MESSAGE)
     )
+
+
+async def test_send_same_code_on_concurrent_requests(
+    monkeypatch: pytest.MonkeyPatch,
+    mocker: MockerFixture,
+    settings: AppSettings,
+    app: FastAPI,
+    client: AsyncClient
+):
+    # Without the cooldown every request sends the code.
+    monkeypatch.setattr(settings, 'verification_send_cooldown_in_seconds', 0)
+    send_verification = mocker.patch(
+        'app.services.mail.service.MailService.send_verification'
+    )
+    payload = VerificationInCreate(
+        email='user@gmail.com',
+        action=VerificationAction.REGISTRATION
+    )
+
+    await asyncio.gather(*(
+        client.post(app.url_path_for(ROUTE_NAME), json=payload.dict())
+        for _ in range(5)
+    ))
+
+    codes = {call.args[1] for call in send_verification.call_args_list}
+    assert send_verification.call_count == 5
+    assert len(codes) == 1
+
+
+async def test_send_mail_once_within_cooldown(
+    mocker: MockerFixture,
+    app: FastAPI,
+    client: AsyncClient
+):
+    send_verification = mocker.patch(
+        'app.services.mail.service.MailService.send_verification'
+    )
+    payload = VerificationInCreate(
+        email='user@gmail.com',
+        action=VerificationAction.REGISTRATION
+    )
+
+    await asyncio.gather(*(
+        client.post(app.url_path_for(ROUTE_NAME), json=payload.dict())
+        for _ in range(5)
+    ))
+
+    send_verification.assert_called_once()
@@ -1,7 +1,8 @@
+from datetime import datetime
 from unittest.mock import Mock
+from uuid import UUID
 
 import pytest
-from jwt import ExpiredSignatureError
 from pytest_mock import MockerFixture
 
 from app.core.settings import AppSettings
@@ -26,7 +27,10 @@ from app.services.jwt_ import (
 
 @pytest.fixture
 def jwt_service() -> Mock:
-    return Mock(JWTService)
+    jwt_service = Mock(JWTService, expire_in_seconds=100)
+    jwt_service.generate.return_value = 'accessToken'
+    jwt_service.generate_jti.return_value = '3c4a5fe0a5d54a39bf1b7b2bba20e3b4'
+    return jwt_service
 
 
 @pytest.fixture
@@ -50,6 +54,7 @@ def settings() -> Mock:
         AppSettings,
         refresh_token_expire_in_seconds=200,
         access_token_expire_in_seconds=100,
+        refresh_sessions_per_user_limit=5
     )
 
 
@@ -93,7 +98,8 @@ def user() -> Mock:
 def refresh_session() -> Mock:
     return Mock(
         RefreshSession,
-        access_token='accessToken',
+        access_token_jti=UUID('0f5d2c8e4b7a4e0c9a1d3b6f8e2c4a7d'),
+        access_token_expires_at=datetime(2030, 1, 1),
         refresh_token='refreshToken',
         is_expired=False
     )
@@ -106,15 +112,40 @@ async def test_authenticate__create_session(
     user: Mock,
     refresh_session: Mock
 ):
-    repo.create_one.return_value = refresh_session
+    repo.create_one_within_limit.return_value = refresh_session
 
     await authenticator.authenticate(user)
 
-    repo.create_one.assert_called_once()
-    kwargs = repo.create_one.call_args.kwargs
+    repo.create_one_within_limit.assert_called_once()
+    assert repo.create_one_within_limit.call_args.args == (5,)
+    kwargs = repo.create_one_within_limit.call_args.kwargs
     assert kwargs['user_id'] == user.id
-    jwt_service.generate.assert_called_once_with(user)
-    assert kwargs['access_token'] == jwt_service.generate.return_value
+    assert kwargs['access_token_jti'].hex == (
+        jwt_service.generate_jti.return_value
+    )
+
+
+async def test_authenticate__sign_token_for_session(
+    jwt_service: Mock,
+    repo: Mock,
+    blacklist_service: Mock,
+    authenticator: Authenticator,
+    user: Mock,
+    refresh_session: Mock
+):
+    repo.create_one_within_limit.return_value = refresh_session
+
+    result = await authenticator.authenticate(user)
+
+    jwt_service.generate.assert_called_once_with(
+        user,
+        jti=refresh_session.access_token_jti.hex,
+        exp=1893456000,
+        token_version=blacklist_service.get_token_version.return_value
+    )
+    assert result.credentials.access_token == (
+        jwt_service.generate.return_value
+    )
 
 
 async def test_authenticate__set_token_cookie(
@@ -124,7 +155,7 @@ async def test_authenticate__set_token_cookie(
     user: Mock,
     refresh_session: Mock
 ):
-    repo.create_one.return_value = refresh_session
+    repo.create_one_within_limit.return_value = refresh_session
 
     await authenticator.authenticate(user)
 
@@ -133,6 +164,76 @@ async def test_authenticate__set_token_cookie(
     )
 
 
+async def test_reauthenticate__rotate_session(
+    repo: Mock,
+    authenticator: Authenticator,
+    user: Mock,
+    refresh_session: Mock
+):
+    repo.rotate.return_value = (user, refresh_session, refresh_session)
+
+    await authenticator.reauthenticate('refreshToken')
+
+    repo.rotate.assert_called_once()
+    assert repo.rotate.call_args.args == ('refreshToken',)
+
+
+async def test_reauthenticate__raise_error_if_session_does_not_exist(
+    repo: Mock,
+    authenticator: Authenticator
+):
+    repo.rotate.side_effect = EntityDoesNotExistError
+
+    with pytest.raises(RefreshSessionDoesNotExistError):
+        await authenticator.reauthenticate('refreshToken')
+
+
+async def test_reauthenticate__raise_error_if_session_expired(
+    repo: Mock,
+    authenticator: Authenticator,
+    user: Mock,
+    refresh_session: Mock
+):
+    repo.rotate.return_value = (user, refresh_session, None)
+
+    with pytest.raises(RefreshSessionExpiredError):
+        await authenticator.reauthenticate('refreshToken')
+
+
+async def test_reauthenticate__blacklist_old_access_token(
+    mocker: MockerFixture,
+    repo: Mock,
+    authenticator: Authenticator,
+    user: Mock,
+    refresh_session: Mock
+):
+    blacklist_access_token = mocker.patch(
+        'app.services.auth.authenticator.Authenticator.blacklist_access_token'
+    )
+    old_session = Mock(RefreshSession)
+    repo.rotate.return_value = (user, old_session, refresh_session)
+
+    await authenticator.reauthenticate('refreshToken')
+
+    blacklist_access_token.assert_called_once_with(old_session)
+
+
+async def test_reauthenticate__set_new_token_cookie(
+    repo: Mock,
+    cookie_service: Mock,
+    authenticator: Authenticator,
+    user: Mock,
+    refresh_session: Mock
+):
+    repo.rotate.return_value = (user, refresh_session, refresh_session)
+
+    await authenticator.reauthenticate('refreshToken')
+
+    cookie_service.set_refresh_token.assert_called_once_with(
+        refresh_session.refresh_token
+    )
+
+
 async def test_deauthenticate__validate_session(
     mocker: MockerFixture,
     repo: Mock,
@@ -141,6 +242,9 @@ async def test_deauthenticate__validate_session(
     validate_refresh_session = mocker.patch(
         'app.services.auth.authenticator.Authenticator.validate_refresh_session'
     )
+    mocker.patch(
+        'app.services.auth.authenticator.Authenticator.blacklist_access_token'
+    )
     token = 'refreshToken'
 
     await authenticator.deauthenticate(token)
@@ -163,7 +267,7 @@ async def test_deauthenticate__blacklist_access_token(
 
     await authenticator.deauthenticate(refresh_session.refresh_token)
 
-    blacklist_access_token.assert_called_once_with(refresh_session.access_token)
+    blacklist_access_token.assert_called_once_with(refresh_session)
 
 
 async def test_deauthenticate__delete_token_cookie(
@@ -179,6 +283,19 @@ async def test_deauthenticate__delete_token_cookie(
     cookie_service.delete_refresh_token.assert_called_once_with()
 
 
+async def test_deauthenticate_everywhere__revoke_tokens_and_sessions(
+    repo: Mock,
+    cookie_service: Mock,
+    blacklist_service: Mock,
+    authenticator: Authenticator
+):
+    await authenticator.deauthenticate_everywhere(12345)
+
+    blacklist_service.revoke_all.assert_called_once_with(12345)
+    repo.delete_all_by_user_id.assert_called_once_with(12345)
+    cookie_service.delete_refresh_token.assert_called_once_with()
+
+
 async def test_validate_refresh_session__delete_session(
     repo: Mock,
     authenticator: Authenticator,
@@ -213,27 +330,28 @@ async def test_validate_refresh_session__raise_error_if_session_expired(
         await authenticator.validate_refresh_session('refreshToken')
 
 
-async def test_blacklist_access_token__pass_if_token_expired(
-    jwt_service: Mock,
+async def test_blacklist_access_token__blacklist_token(
     blacklist_service: Mock,
-    authenticator: Authenticator
+    authenticator: Authenticator,
+    refresh_session: Mock
 ):
-    jwt_service.verify.side_effect = ExpiredSignatureError
+    await authenticator.blacklist_access_token(refresh_session)
 
-    await authenticator.blacklist_access_token('accessToken')
-
-    blacklist_service.blacklist.assert_not_called()
+    blacklist_service.blacklist.assert_called_once_with(
+        jti=refresh_session.access_token_jti.hex,
+        exp=1893456000
+    )
 
 
-async def test_blacklist_access_token__blacklist_token(
-    jwt_service: Mock,
-    blacklist_service: Mock,
+async def test_get_sessions__list_active_sessions(
+    repo: Mock,
     authenticator: Authenticator
 ):
-    await authenticator.blacklist_access_token('accessToken')
+    result = await authenticator.get_sessions(1, limit=10)
 
-    meta_claims = jwt_service.verify.return_value.meta
-    blacklist_service.blacklist.assert_called_once_with(
-        jti=meta_claims.jti,
-        exp=meta_claims.exp
+    repo.get_many_active_by_user_id.assert_called_once_with(
+        1,
+        limit=10,
+        offset=0
     )
+    assert result is repo.get_many_active_by_user_id.return_value
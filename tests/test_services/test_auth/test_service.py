@@ -9,6 +9,11 @@ from app.services.auth import (
     AuthService,
     UserService
 )
+from app.services.auth.errors import (
+    IncorrectPasswordError,
+    LoginIsThrottledError
+)
+from app.services.auth.throttler import LoginThrottler
 
 
 @pytest.fixture
@@ -24,14 +29,21 @@ def authenticator() -> Mock:
     return Mock(Authenticator)
 
 
+@pytest.fixture
+def throttler() -> Mock:
+    return Mock(LoginThrottler)
+
+
 @pytest.fixture
 def service(
     user_service: Mock,
-    authenticator: Mock
+    authenticator: Mock,
+    throttler: Mock
 ) -> AuthService:
     return AuthService(
         user_service=user_service,
-        authenticator=authenticator
+        authenticator=authenticator,
+        throttler=throttler
     )
 
 
@@ -63,7 +75,7 @@ async def test_login__verify_user(
     user_service: Mock,
     service: AuthService
 ):
-    payload = Mock(BaseModel)
+    payload = Mock(BaseModel, email='user@gmail.com')
 
     await service.login(payload)
 
@@ -75,7 +87,7 @@ async def test_login__authenticate_user_from_db(
     authenticator: Mock,
     service: AuthService
 ):
-    result = await service.login(Mock(BaseModel))
+    result = await service.login(Mock(BaseModel, email='user@gmail.com'))
 
     authenticator.authenticate.assert_called_once_with(
         user_service.verify.return_value
@@ -83,37 +95,64 @@ async def test_login__authenticate_user_from_db(
     assert result is authenticator.authenticate.return_value
 
 
-async def test_refresh__validate_session(
-    authenticator: Mock,
+async def test_login__do_not_verify_user_if_throttled(
+    user_service: Mock,
+    throttler: Mock,
     service: AuthService
 ):
-    token = 'refreshToken'
+    throttler.check.side_effect = LoginIsThrottledError
+
+    with pytest.raises(LoginIsThrottledError):
+        await service.login(Mock(BaseModel, email='user@gmail.com'))
+
+    user_service.verify.assert_not_called()
+    throttler.register_failure.assert_not_called()
+
+
+async def test_login__register_failure_if_verification_failed(
+    user_service: Mock,
+    throttler: Mock,
+    service: AuthService
+):
+    payload = Mock(BaseModel, email='user@gmail.com')
+    user_service.verify.side_effect = IncorrectPasswordError
+
+    with pytest.raises(IncorrectPasswordError):
+        await service.login(payload)
+
+    throttler.register_failure.assert_called_once_with(payload.email)
+    throttler.reset.assert_not_called()
+
 
-    await service.refresh(token)
+async def test_login__reset_failures_on_success(
+    throttler: Mock,
+    service: AuthService
+):
+    payload = Mock(BaseModel, email='user@gmail.com')
+
+    await service.login(payload)
 
-    authenticator.validate_refresh_session.assert_called_once_with(token)
+    throttler.reset.assert_called_once_with(payload.email)
+    throttler.register_failure.assert_not_called()
 
 
-async def test_refresh__blacklist_access_token(
+async def test_refresh__reauthenticate_by_token(
     authenticator: Mock,
     service: AuthService
 ):
-    await service.refresh('refreshToken')
+    token = 'refreshToken'
 
-    refresh_session = authenticator.validate_refresh_session.return_value
-    authenticator.blacklist_access_token.assert_called_once_with(
-        refresh_session.access_token
-    )
+    result = await service.refresh(token)
 
+    authenticator.reauthenticate.assert_called_once_with(token)
+    assert result is authenticator.reauthenticate.return_value
 
-async def test_refresh__authenticate_user_from_db(
-    user_service: Mock,
+
+async def test_get_sessions__list_by_user_id(
     authenticator: Mock,
     service: AuthService
 ):
-    result = await service.refresh(Mock(BaseModel))
+    result = await service.get_sessions(1, limit=10, offset=20)
 
-    authenticator.authenticate.assert_called_once_with(
-        user_service.repo.get_one_by_pk.return_value
-    )
-    assert result is authenticator.authenticate.return_value
+    authenticator.get_sessions.assert_called_once_with(1, limit=10, offset=20)
+    assert result is authenticator.get_sessions.return_value
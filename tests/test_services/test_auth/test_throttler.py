@@ -0,0 +1,153 @@
+from unittest.mock import (
+    AsyncMock,
+    Mock
+)
+
+import pytest
+from redis import asyncio as aioredis
+
+from app.core.settings import AppSettings
+from app.services.auth.client_analyzer import ClientAnalyzer
+from app.services.auth.errors import LoginIsThrottledError
+from app.services.auth.throttler import LoginThrottler
+from app.services.redis_ import RedisClientCache
+
+
+@pytest.fixture
+def script() -> AsyncMock:
+    return AsyncMock()
+
+
+@pytest.fixture
+def redis(script: AsyncMock) -> Mock:
+    return Mock(
+        aioredis.Redis,
+        delete=AsyncMock(),
+        register_script=Mock(return_value=script)
+    )
+
+
+@pytest.fixture
+def cache() -> Mock:
+    return Mock(
+        RedisClientCache,
+        mget=AsyncMock(return_value=[None, None])
+    )
+
+
+@pytest.fixture
+def settings() -> Mock:
+    return Mock(
+        AppSettings,
+        login_failures_window_in_seconds=900,
+        login_failures_limit_per_email=5,
+        login_failures_limit_per_ip=50,
+        login_lockout_base_in_seconds=30,
+        login_lockout_max_in_seconds=3600
+    )
+
+
+@pytest.fixture
+def client_analyzer() -> Mock:
+    return Mock(
+        ClientAnalyzer,
+        ip_address='127.0.0.1'
+    )
+
+
+@pytest.fixture
+def throttler(
+    redis: Mock,
+    cache: Mock,
+    settings: Mock,
+    client_analyzer: Mock
+) -> LoginThrottler:
+    return LoginThrottler(
+        redis=redis,
+        cache=cache,
+        settings=settings,
+        client_analyzer=client_analyzer
+    )
+
+
+async def test_check__check_email_and_ip_lockouts_in_one_call(
+    cache: Mock,
+    throttler: LoginThrottler
+):
+    await throttler.check('user@gmail.com')
+
+    cache.mget.assert_called_once_with([
+        throttler.format_lockout_key('email:user@gmail.com'),
+        throttler.format_lockout_key('ip:127.0.0.1')
+    ])
+
+
+async def test_check__raise_error_if_locked_out(
+    cache: Mock,
+    throttler: LoginThrottler
+):
+    cache.mget.return_value = [None, b'5']
+
+    with pytest.raises(LoginIsThrottledError):
+        await throttler.check('user@gmail.com')
+
+
+async def test_check__skip_ip_if_client_address_is_unknown(
+    cache: Mock,
+    client_analyzer: Mock,
+    throttler: LoginThrottler
+):
+    client_analyzer.ip_address = None
+
+    await throttler.check('user@gmail.com')
+
+    cache.mget.assert_called_once_with([
+        throttler.format_lockout_key('email:user@gmail.com')
+    ])
+
+
+async def test_register_failure__run_script_with_limits_per_subject(
+    script: AsyncMock,
+    settings: Mock,
+    throttler: LoginThrottler
+):
+    await throttler.register_failure('user@gmail.com')
+
+    script.assert_called_once_with(
+        keys=[
+            throttler.format_failures_key('email:user@gmail.com'),
+            throttler.format_lockout_key('email:user@gmail.com'),
+            throttler.format_failures_key('ip:127.0.0.1'),
+            throttler.format_lockout_key('ip:127.0.0.1')
+        ],
+        args=[
+            settings.login_failures_window_in_seconds,
+            settings.login_lockout_base_in_seconds,
+            settings.login_lockout_max_in_seconds,
+            settings.login_failures_limit_per_email,
+            settings.login_failures_limit_per_ip
+        ]
+    )
+
+
+async def test_register_failure__invalidate_cached_lockouts(
+    cache: Mock,
+    throttler: LoginThrottler
+):
+    await throttler.register_failure('user@gmail.com')
+
+    cache.invalidate.assert_called_once_with([
+        throttler.format_lockout_key('email:user@gmail.com'),
+        throttler.format_lockout_key('ip:127.0.0.1')
+    ])
+
+
+async def test_reset__delete_email_failures(
+    redis: Mock,
+    throttler: LoginThrottler
+):
+    await throttler.reset('user@gmail.com')
+
+    redis.delete.assert_called_once_with(
+        throttler.format_failures_key('email:user@gmail.com')
+    )
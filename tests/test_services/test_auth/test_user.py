@@ -34,7 +34,8 @@ def repo() -> Mock:
 def pwd_context() -> Mock:
     return Mock(
         CryptContext,
-        verify=Mock(return_value=True)
+        verify=Mock(return_value=True),
+        needs_update=Mock(return_value=False)
     )
 
 
@@ -125,6 +126,37 @@ async def test_verify__return_user_from_db(
     assert result is repo.get_one_by_email.return_value
 
 
+async def test_verify__rehash_password_if_hash_needs_update(
+    repo: Mock,
+    pwd_context: Mock,
+    service: UserService,
+    payload_for_login: UserInLogin
+):
+    pwd_context.needs_update.return_value = True
+    user = repo.get_one_by_email.return_value
+
+    result = await service.verify(payload_for_login)
+
+    pwd_context.hash.assert_called_once_with(payload_for_login.password)
+    repo.update_one_by_pk.assert_called_once_with(
+        user.id,
+        hashed_password=pwd_context.hash.return_value
+    )
+    assert result is repo.update_one_by_pk.return_value
+
+
+async def test_verify__do_not_rehash_password_if_hash_is_actual(
+    repo: Mock,
+    pwd_context: Mock,
+    service: UserService,
+    payload_for_login: UserInLogin
+):
+    await service.verify(payload_for_login)
+
+    pwd_context.hash.assert_not_called()
+    repo.update_one_by_pk.assert_not_called()
+
+
 async def test_get_for_login__raise_error_if_user_does_not_exist(
     repo: Mock,
     service: UserService,
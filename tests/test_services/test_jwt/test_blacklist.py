@@ -1,22 +1,50 @@
 import time
+from dataclasses import replace
 from unittest.mock import (
+    ANY,
     AsyncMock,
+    MagicMock,
     Mock
 )
 
 import pytest
 from redis import asyncio as aioredis
+from redis.asyncio.client import Pipeline
 
 from app.core.settings import AppSettings
-from app.services.jwt_ import JWTBlacklistService
+from app.dtos.jwt_ import (
+    JWTClaims,
+    JWTMetaClaims,
+    JWTUserClaims
+)
+from app.services.jwt_ import (
+    JWTBlacklistService,
+    LocalJWTBlacklist
+)
+
+
+TOKEN_VERSION = int(time.time())
+
+
+@pytest.fixture
+def pipe() -> Mock:
+    return Mock(
+        Pipeline,
+        execute=AsyncMock()
+    )
 
 
 @pytest.fixture
-def redis() -> Mock:
+def redis(pipe: Mock) -> Mock:
     return Mock(
         aioredis.Redis,
-        set=AsyncMock(),
-        exists=AsyncMock()
+        pipeline=Mock(
+            return_value=MagicMock(
+                __aenter__=AsyncMock(return_value=pipe)
+            )
+        ),
+        exists=AsyncMock(),
+        get=AsyncMock()
     )
 
 
@@ -24,18 +52,40 @@ def redis() -> Mock:
 def settings() -> AppSettings:
     return Mock(
         AppSettings,
-        access_token_expire_in_seconds=100
+        access_token_expire_in_seconds=100,
+        refresh_token_expire_in_seconds=1000
+    )
+
+
+@pytest.fixture
+def local() -> LocalJWTBlacklist:
+    return LocalJWTBlacklist(100)
+
+
+@pytest.fixture
+def claims() -> JWTClaims:
+    return JWTClaims(
+        meta=JWTMetaClaims(exp=int(time.time()) + 50, sub='1', jti='jti'),
+        user=JWTUserClaims(
+            id=1,
+            email='user@gmail.com',
+            username='username',
+            is_superuser=False,
+            token_version=TOKEN_VERSION
+        )
     )
 
 
 @pytest.fixture
 def service(
     redis: Mock,
-    settings: Mock
+    settings: Mock,
+    local: LocalJWTBlacklist
 ) -> JWTBlacklistService:
     return JWTBlacklistService(
         redis=redis,
-        settings=settings
+        settings=settings,
+        local=local
     )
 
 
@@ -45,11 +95,11 @@ async def test_blacklist__pass_if_expired(
 ):
     await service.blacklist('jti', int(time.time()) - 5)
 
-    redis.set.assert_not_called()
+    redis.pipeline.assert_not_called()
 
 
-async def test_blacklist__create_redis_record(
-    redis: Mock,
+async def test_blacklist__create_redis_record_and_publish_it(
+    pipe: Mock,
     settings: Mock,
     service: JWTBlacklistService
 ):
@@ -57,14 +107,28 @@ async def test_blacklist__create_redis_record(
 
     await service.blacklist(jti, exp)
 
-    redis.set.assert_called_once_with(
+    pipe.set.assert_called_once_with(
         service.format_key(jti),
-        0,
+        exp,
         settings.access_token_expire_in_seconds
     )
+    pipe.publish.assert_called_once_with(
+        service.channel,
+        service.format_message(jti, exp)
+    )
+    pipe.execute.assert_called_once()
+
+
+async def test_blacklist__add_jti_to_local_blacklist(
+    local: LocalJWTBlacklist,
+    service: JWTBlacklistService
+):
+    await service.blacklist('jti', int(time.time()) + 50)
 
+    assert 'jti' in local
 
-async def test_check_is_blacklisted__check_redis_record(
+
+async def test_check_is_blacklisted__check_redis_record_if_not_synced(
     redis: Mock,
     service: JWTBlacklistService
 ):
@@ -73,3 +137,100 @@ async def test_check_is_blacklisted__check_redis_record(
     await service.check_is_blacklisted(jti)
 
     redis.exists.assert_called_once_with(service.format_key(jti))
+
+
+async def test_check_is_blacklisted__check_local_blacklist_if_synced(
+    redis: Mock,
+    local: LocalJWTBlacklist,
+    service: JWTBlacklistService
+):
+    local.is_synced = True
+    local.add('blacklistedJTI', int(time.time()) + 50)
+
+    assert await service.check_is_blacklisted('blacklistedJTI')
+    assert not await service.check_is_blacklisted('jti')
+    redis.exists.assert_not_called()
+
+
+async def test_check_is_revoked__check_redis_in_one_round_trip_if_not_synced(
+    pipe: Mock,
+    service: JWTBlacklistService,
+    claims: JWTClaims
+):
+    pipe.execute.return_value = [0, str(TOKEN_VERSION + 1).encode()]
+
+    assert await service.check_is_revoked(claims)
+    pipe.exists.assert_called_once_with(service.format_key(claims.meta.jti))
+    pipe.get.assert_called_once_with(
+        service.format_token_version_key(claims.user.id)
+    )
+    pipe.execute.assert_called_once()
+
+
+async def test_check_is_revoked__pass_current_token_version_if_not_synced(
+    pipe: Mock,
+    service: JWTBlacklistService,
+    claims: JWTClaims
+):
+    pipe.execute.return_value = [0, str(TOKEN_VERSION).encode()]
+
+    assert not await service.check_is_revoked(claims)
+
+
+async def test_check_is_revoked__ignore_outlived_token_version_if_not_synced(
+    pipe: Mock,
+    service: JWTBlacklistService,
+    claims: JWTClaims
+):
+    claims = replace(claims, user=replace(claims.user, token_version=0))
+    pipe.execute.return_value = [0, str(TOKEN_VERSION - 101).encode()]
+
+    assert not await service.check_is_revoked(claims)
+
+
+async def test_check_is_revoked__check_local_blacklist_if_synced(
+    redis: Mock,
+    local: LocalJWTBlacklist,
+    service: JWTBlacklistService,
+    claims: JWTClaims
+):
+    local.is_synced = True
+
+    assert not await service.check_is_revoked(claims)
+    local.set_token_version(claims.user.id, TOKEN_VERSION + 1)
+    assert await service.check_is_revoked(claims)
+    redis.pipeline.assert_not_called()
+
+
+async def test_get_token_version__default_to_zero(
+    redis: Mock,
+    service: JWTBlacklistService
+):
+    redis.get.return_value = None
+
+    assert await service.get_token_version(1) == 0
+    redis.get.assert_called_once_with(service.format_token_version_key(1))
+
+
+async def test_revoke_all__bump_token_version(
+    redis: Mock,
+    local: LocalJWTBlacklist,
+    service: JWTBlacklistService
+):
+    script = redis.register_script.return_value = AsyncMock(
+        return_value=TOKEN_VERSION + 1
+    )
+
+    await service.revoke_all(1)
+
+    script.assert_called_once_with(
+        keys=[service.format_token_version_key(1)],
+        args=[service.token_versions_channel, 1, ANY, 1000]
+    )
+    assert local.get_token_version(1) == TOKEN_VERSION + 1
+
+
+def test_parse_message__reverse_format_message():
+    message = JWTBlacklistService.format_message('jti', 12345)
+
+    assert JWTBlacklistService.parse_message(message.encode()) == ('jti', 12345)
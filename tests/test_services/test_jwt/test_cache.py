@@ -0,0 +1,69 @@
+import time
+
+import pytest
+
+from app.dtos.jwt_ import (
+    JWTClaims,
+    JWTMetaClaims,
+    JWTUserClaims
+)
+from app.services.jwt_ import JWTClaimsCache
+
+
+def make_claims(exp: int) -> JWTClaims:
+    return JWTClaims(
+        meta=JWTMetaClaims(exp=exp, sub='1', jti='jti'),
+        user=JWTUserClaims(
+            id=1,
+            email='user@gmail.com',
+            username='userUsername',
+            is_superuser=False,
+            token_version=0
+        )
+    )
+
+
+@pytest.fixture
+def claims() -> JWTClaims:
+    return make_claims(int(time.time()) + 100)
+
+
+@pytest.fixture
+def cache() -> JWTClaimsCache:
+    return JWTClaimsCache(max_size=2)
+
+
+def test_get__return_stored_claims(
+    claims: JWTClaims,
+    cache: JWTClaimsCache
+):
+    cache.set('token', claims)
+
+    assert cache.get('token') is claims
+    assert cache.get('otherToken') is None
+    info = cache.info()
+    assert (info.hits, info.misses, info.size) == (1, 1, 1)
+
+
+def test_get__evict_expired_claims(
+    cache: JWTClaimsCache
+):
+    cache.set('token', make_claims(int(time.time()) - 1))
+
+    assert cache.get('token') is None
+    assert cache.info().size == 0
+
+
+def test_set__evict_least_recently_used_claims(
+    claims: JWTClaims,
+    cache: JWTClaimsCache
+):
+    cache.set('token1', claims)
+    cache.set('token2', claims)
+    cache.get('token1')
+
+    cache.set('token3', claims)
+
+    assert cache.get('token1') is claims
+    assert cache.get('token2') is None
+    assert cache.get('token3') is claims
@@ -0,0 +1,52 @@
+import time
+
+from app.services.jwt_ import LocalJWTBlacklist
+
+
+TOKEN_VERSION_TTL = 100
+
+
+def test_contains__ignore_expired_jti():
+    local = LocalJWTBlacklist(TOKEN_VERSION_TTL)
+
+    local.add('jti', int(time.time()) + 50)
+    local.add('expiredJTI', int(time.time()) - 1)
+
+    assert 'jti' in local
+    assert 'expiredJTI' not in local
+    assert 'unknownJTI' not in local
+
+
+def test_add__prune_expired_jtis():
+    local = LocalJWTBlacklist(TOKEN_VERSION_TTL)
+    local.add('expiredJTI', int(time.time()) - 1)
+    local._next_prune_at = 0
+
+    local.add('jti', int(time.time()) + 50)
+
+    assert len(local) == 1
+
+
+def test_set_token_version__never_decrease():
+    local = LocalJWTBlacklist(TOKEN_VERSION_TTL)
+
+    now = int(time.time())
+
+    local.set_token_version(1, now + 1)
+    local.set_token_version(1, now)
+
+    assert local.get_token_version(1) == now + 1
+    assert local.get_token_version(2) == 0
+
+
+def test_set_token_version__prune_outlived_versions():
+    local = LocalJWTBlacklist(TOKEN_VERSION_TTL)
+    now = int(time.time())
+    local.set_token_version(1, now - TOKEN_VERSION_TTL - 1)
+    local._next_prune_at = 0
+
+    local.set_token_version(2, now)
+
+    assert local.get_token_version(1) == 0
+    assert local.get_token_version(2) == now
+    assert local._token_versions == {2: now}
@@ -1,5 +1,7 @@
+import time
 from unittest.mock import Mock
 
+import jwt
 import pytest
 
 from app.core.settings import AppSettings
@@ -42,3 +44,35 @@ def test_generate_and_verify_work_correctly(
     assert claims.user.id == user.id
     assert claims.user.email == user.email
     assert claims.user.is_superuser == user.is_superuser
+
+
+def test_generate__use_given_meta_claims(
+    service: JWTService
+):
+    user = Mock(
+        User,
+        id=12345,
+        email='user@gmail.com',
+        username='userUsername',
+        is_superuser=False
+    )
+    exp = int(time.time()) + 100
+
+    token = service.generate(user, jti='tokenJti', exp=exp)
+    claims = service.verify(token)
+
+    assert claims.meta.jti == 'tokenJti'
+    assert claims.meta.exp == exp
+
+
+def test_verify__raise_error_if_claim_is_missing(
+    service: JWTService
+):
+    token = jwt.encode(
+        {'sub': '1', 'exp': int(time.time()) + 100, 'jti': 'tokenJti'},
+        'jwtSecret',
+        'HS256'
+    )
+
+    with pytest.raises(jwt.InvalidTokenError):
+        service.verify(token)
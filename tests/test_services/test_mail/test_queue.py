@@ -0,0 +1,56 @@
+from unittest.mock import (
+    AsyncMock,
+    Mock
+)
+
+import pytest
+from fastapi_mail import MessageSchema
+from redis import asyncio as aioredis
+
+from app.services.mail import MailQueue
+
+
+@pytest.fixture
+def redis() -> Mock:
+    return Mock(aioredis.Redis, xadd=AsyncMock())
+
+
+@pytest.fixture
+def queue(redis: Mock) -> MailQueue:
+    return MailQueue(redis=redis)
+
+
+async def test_push__add_entry_to_stream(
+    redis: Mock,
+    queue: MailQueue
+):
+    message = MessageSchema(
+        recipients=['user@gmail.com'],
+        template_body={'code': '000001'}
+    )
+
+    await queue.push(message, 'verification.html')
+
+    redis.xadd.assert_called_once()
+    stream, fields = redis.xadd.call_args.args
+    assert stream == MailQueue.stream
+    queued_message = MessageSchema.parse_raw(fields['message'])
+    assert queued_message.recipients == message.recipients
+    assert queued_message.template_body == message.template_body
+    assert fields['template_name'] == 'verification.html'
+    assert fields['attempts'] == 0
+
+
+async def test_push__raise_error_on_attachments(
+    redis: Mock,
+    queue: MailQueue
+):
+    message = MessageSchema(
+        recipients=['user@gmail.com'],
+        attachments=[{'file': __file__}]
+    )
+
+    with pytest.raises(ValueError):
+        await queue.push(message)
+
+    redis.xadd.assert_not_called()
@@ -0,0 +1,79 @@
+import pytest
+from fastapi_mail import (
+    ConnectionConfig as MailConnectionSettings,
+    MessageSchema
+)
+from jinja2 import TemplateNotFound
+
+from app.core.settings.paths import EMAIL_TEMPLATES_DIR
+from app.services.mail import MailRenderer
+from tests.utils.mail import check_mail_body_contains
+
+
+@pytest.fixture(scope='module')
+def renderer() -> MailRenderer:
+    return MailRenderer(
+        MailConnectionSettings(
+            MAIL_USERNAME='test@myvocab.com',
+            MAIL_PASSWORD='fakeMailPassword',
+            MAIL_SERVER='smtp.myvocab.com',
+            MAIL_PORT=587,
+            MAIL_FROM='test@myvocab.com',
+            MAIL_FROM_NAME='My Vocab App In Test',
+            TEMPLATE_FOLDER=EMAIL_TEMPLATES_DIR
+        )
+    )
+
+
+def test_init__compile_all_templates(renderer: MailRenderer):
+    assert set(renderer.templates) == {'thank.html', 'verification.html'}
+
+
+async def test_render__build_mail_from_template(renderer: MailRenderer):
+    message = MessageSchema(
+        recipients=['user@gmail.com'],
+        subject='Subject',
+        template_body={'code': '000001', 'message': 'Message'}
+    )
+
+    mail = await renderer.render(message, 'verification.html')
+
+    assert mail['To'] == 'user@gmail.com'
+    assert mail['From'] == 'My Vocab App In Test <test@myvocab.com>'
+    assert check_mail_body_contains(mail, '000001')
+
+
+async def test_render__skip_template_without_data(renderer: MailRenderer):
+    message = MessageSchema(
+        recipients=['user@gmail.com'],
+        template_body={}
+    )
+
+    mail = await renderer.render(message, 'verification.html')
+
+    assert message.subtype is None
+    assert mail.get_payload() == []
+
+
+async def test_render__keep_html_body(renderer: MailRenderer):
+    message = MessageSchema(
+        recipients=['user@gmail.com'],
+        html='<p>Hello</p>',
+        template_body={}
+    )
+
+    mail = await renderer.render(message, 'verification.html')
+
+    assert check_mail_body_contains(mail, 'Hello')
+
+
+async def test_render__raise_error_on_unknown_template(
+    renderer: MailRenderer
+):
+    message = MessageSchema(
+        recipients=['user@gmail.com'],
+        template_body={'code': '000001'}
+    )
+
+    with pytest.raises(TemplateNotFound):
+        await renderer.render(message, 'unknown.html')
@@ -0,0 +1,116 @@
+import inspect
+from collections.abc import (
+    Awaitable,
+    Callable
+)
+from unittest.mock import (
+    AsyncMock,
+    Mock
+)
+
+import pytest
+from fastapi import BackgroundTasks
+from fastapi_mail import FastMail
+from pytest_mock import MockerFixture
+
+from app.core.settings import AppSettings
+from app.services.mail import (
+    MailQueue,
+    MailService
+)
+from app.services.metrics import run_tracked
+
+
+@pytest.fixture
+def background_tasks() -> Mock:
+    return Mock(BackgroundTasks)
+
+
+@pytest.fixture
+def mail_sender() -> Mock:
+    return Mock(FastMail)
+
+
+@pytest.fixture
+def mail_queue() -> Mock:
+    return Mock(MailQueue, push=AsyncMock())
+
+
+@pytest.fixture
+def settings() -> Mock:
+    return Mock(AppSettings, mail_use_queue=False)
+
+
+@pytest.fixture
+def service(
+    background_tasks: Mock,
+    mail_sender: Mock,
+    mail_queue: Mock,
+    settings: Mock
+) -> MailService:
+    return MailService(
+        background_tasks=background_tasks,
+        mail_sender=mail_sender,
+        mail_queue=mail_queue,
+        settings=settings
+    )
+
+
+def get_send_methods(
+    service: MailService
+) -> list[Callable[..., Awaitable[None]]]:
+    return [
+        getattr(service, method_name) for method_name in dir(service)
+        if method_name.startswith('send_') and method_name != 'send_message'
+    ]
+
+
+async def call_send_methods(service: MailService) -> None:
+    for send_method in get_send_methods(service):
+        call_kwargs = {
+            param: Mock()
+            for param in inspect.signature(send_method).parameters
+        }
+        await send_method(**call_kwargs)
+
+
+async def test_send__add_target_to_background_tasks(
+    mocker: MockerFixture,
+    background_tasks: Mock,
+    mail_sender: Mock,
+    mail_queue: Mock,
+    service: MailService
+):
+    message_schema = mocker.patch(
+        'app.services.mail.service.MessageSchema'
+    )
+
+    await call_send_methods(service)
+
+    assert background_tasks.add_task.call_count == len(
+        get_send_methods(service)
+    )
+    for call in background_tasks.add_task.call_args_list:
+        assert call.args == (run_tracked, 'mail', mail_sender.send_message)
+        assert call.kwargs['message'] == message_schema.return_value
+    mail_queue.push.assert_not_called()
+
+
+async def test_send__push_to_queue_if_enabled(
+    mocker: MockerFixture,
+    background_tasks: Mock,
+    mail_queue: Mock,
+    settings: Mock,
+    service: MailService
+):
+    settings.mail_use_queue = True
+    message_schema = mocker.patch(
+        'app.services.mail.service.MessageSchema'
+    )
+
+    await call_send_methods(service)
+
+    assert mail_queue.push.call_count == len(get_send_methods(service))
+    for call in mail_queue.push.call_args_list:
+        assert call.args[0] == message_schema.return_value
+    background_tasks.add_task.assert_not_called()
@@ -0,0 +1,246 @@
+import json
+import socket
+from collections.abc import Iterator
+from email import message_from_bytes
+from unittest.mock import (
+    AsyncMock,
+    MagicMock,
+    Mock
+)
+
+import pytest
+from aiosmtpd.controller import Controller
+from aiosmtpd.smtp import (
+    SMTP,
+    Envelope,
+    Session
+)
+from fastapi_mail import (
+    ConnectionConfig as MailConnectionSettings,
+    MessageSchema
+)
+from redis import asyncio as aioredis
+
+from app.core.settings.dataclasses_ import MailQueueSettings
+from app.core.settings.paths import EMAIL_TEMPLATES_DIR
+from app.services.mail import (
+    MailQueue,
+    MailWorker
+)
+from tests.utils.mail import check_mail_body_contains
+
+
+class RecordingHandler:
+    def __init__(self) -> None:
+        self.envelopes: list[Envelope] = []
+        self.sessions: set[int] = set()
+
+    async def handle_DATA(
+        self,
+        server: SMTP,
+        session: Session,
+        envelope: Envelope
+    ) -> str:
+        self.envelopes.append(envelope)
+        self.sessions.add(id(session))
+        return '250 OK'
+
+
+@pytest.fixture
+def smtp_handler() -> RecordingHandler:
+    return RecordingHandler()
+
+
+@pytest.fixture
+def smtp_port(smtp_handler: RecordingHandler) -> Iterator[int]:
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        port = sock.getsockname()[1]
+    controller = Controller(smtp_handler, hostname='127.0.0.1', port=port)
+    controller.start()
+    yield port
+    controller.stop()
+
+
+@pytest.fixture
+def mail_settings(smtp_port: int) -> MailConnectionSettings:
+    return MailConnectionSettings(
+        MAIL_USERNAME='test@myvocab.com',
+        MAIL_PASSWORD='fakeMailPassword',
+        MAIL_SERVER='127.0.0.1',
+        MAIL_PORT=smtp_port,
+        MAIL_TLS=False,
+        MAIL_SSL=False,
+        MAIL_FROM='test@myvocab.com',
+        MAIL_FROM_NAME='My Vocab App In Test',
+        USE_CREDENTIALS=False,
+        TEMPLATE_FOLDER=EMAIL_TEMPLATES_DIR
+    )
+
+
+@pytest.fixture
+def settings() -> MailQueueSettings:
+    return MailQueueSettings(
+        batch_size=10,
+        max_attempts=3,
+        retry_delay_in_seconds=10,
+        claim_idle_in_seconds=60
+    )
+
+
+@pytest.fixture
+def pipe() -> Mock:
+    return Mock(aioredis.client.Pipeline, execute=AsyncMock())
+
+
+@pytest.fixture
+def redis(pipe: Mock) -> Mock:
+    pipeline = MagicMock()
+    pipeline.__aenter__.return_value = pipe
+    return Mock(aioredis.Redis, pipeline=Mock(return_value=pipeline))
+
+
+@pytest.fixture
+async def worker(
+    redis: Mock,
+    mail_settings: MailConnectionSettings,
+    settings: MailQueueSettings
+) -> MailWorker:
+    worker = MailWorker(redis, mail_settings, settings)
+    yield worker
+    await worker.disconnect()
+
+
+def make_entry(
+    entry_id: bytes,
+    template_name: str = 'verification.html',
+    attempts: int = 0
+) -> tuple[bytes, dict[bytes, bytes]]:
+    message = MessageSchema(
+        recipients=['user@gmail.com'],
+        subject='Subject',
+        template_body={'code': '000001', 'message': 'Message'}
+    )
+    return entry_id, {
+        b'message': message.json(exclude={'attachments'}).encode(),
+        b'template_name': template_name.encode(),
+        b'attempts': str(attempts).encode()
+    }
+
+
+async def test_process__send_batch_over_one_connection(
+    smtp_handler: RecordingHandler,
+    pipe: Mock,
+    worker: MailWorker
+):
+    entries = [make_entry(f'{i}-0'.encode()) for i in range(3)]
+
+    await worker.process(entries)
+
+    assert len(smtp_handler.envelopes) == 3
+    assert len(smtp_handler.sessions) == 1
+    content = smtp_handler.envelopes[0].content
+    assert isinstance(content, bytes)
+    mail = message_from_bytes(content)
+    assert check_mail_body_contains(mail, '000001')
+    entry_ids = [entry_id for entry_id, _ in entries]
+    pipe.xack.assert_called_once_with(
+        MailQueue.stream,
+        MailQueue.group,
+        *entry_ids
+    )
+    pipe.xdel.assert_called_once_with(MailQueue.stream, *entry_ids)
+    pipe.zadd.assert_not_called()
+
+
+async def test_process__schedule_retry_on_failure(
+    smtp_handler: RecordingHandler,
+    pipe: Mock,
+    worker: MailWorker
+):
+    entries = [
+        make_entry(b'1-0', template_name='unknown.html'),
+        make_entry(b'2-0')
+    ]
+
+    await worker.process(entries)
+
+    assert len(smtp_handler.envelopes) == 1
+    pipe.zadd.assert_called_once()
+    key, mapping = pipe.zadd.call_args.args
+    payload = json.loads(next(iter(mapping)))
+    assert key == MailQueue.retries
+    assert payload['id'] == '1-0'
+    assert payload['attempts'] == 1
+    pipe.xack.assert_called_once_with(
+        MailQueue.stream,
+        MailQueue.group,
+        b'1-0',
+        b'2-0'
+    )
+
+
+async def test_process__dead_letter_after_last_attempt(
+    settings: MailQueueSettings,
+    pipe: Mock,
+    worker: MailWorker
+):
+    entry_id, fields = make_entry(
+        b'1-0',
+        template_name='unknown.html',
+        attempts=settings.max_attempts - 1
+    )
+
+    await worker.process([(entry_id, fields)])
+
+    pipe.zadd.assert_not_called()
+    pipe.xadd.assert_called_once()
+    key, dead_fields = pipe.xadd.call_args.args
+    assert key == MailQueue.dead_letters
+    assert dead_fields[b'message'] == fields[b'message']
+    assert dead_fields[b'attempts'] == settings.max_attempts
+
+
+async def test_process__acknowledge_deleted_entries(
+    smtp_handler: RecordingHandler,
+    pipe: Mock,
+    worker: MailWorker
+):
+    await worker.process([(b'1-0', None)])
+
+    assert not smtp_handler.envelopes
+    pipe.xack.assert_called_once_with(
+        MailQueue.stream,
+        MailQueue.group,
+        b'1-0'
+    )
+
+
+async def test_deliver__reconnect_if_connection_is_dropped(
+    smtp_handler: RecordingHandler,
+    worker: MailWorker
+):
+    _, fields = make_entry(b'1-0')
+    await worker.deliver(fields)
+    smtp = await worker.connect()
+    # Simulate the server closing the idle connection.
+    assert smtp.transport is not None
+    smtp.transport.close()
+
+    await worker.deliver(fields)
+
+    assert len(smtp_handler.envelopes) == 2
+    assert len(smtp_handler.sessions) == 2
+
+
+async def test_run__return_once_stopped(
+    redis: Mock,
+    worker: MailWorker
+):
+    redis.xgroup_create = AsyncMock()
+    worker.stop()
+
+    await worker.run()
+
+    redis.xgroup_create.assert_called_once()
+    redis.xreadgroup.assert_not_called()
@@ -0,0 +1,147 @@
+import asyncio
+from dataclasses import replace
+from unittest.mock import (
+    AsyncMock,
+    Mock
+)
+
+import pytest
+from prometheus_client import REGISTRY
+from pytest_mock import MockerFixture
+
+from app.services.metrics import (
+    MetricsState,
+    run_tracked
+)
+from app.services.redis_.pool import RedisPoolStats
+
+
+REDIS_POOL_STATS = RedisPoolStats(
+    max_connections=64,
+    in_use=3,
+    acquired=100,
+    exhausted=4,
+    timed_out=1,
+    wait_time_in_seconds=0.1,
+    hold_time_in_seconds=0.2,
+    max_hold_time_in_seconds=0.01
+)
+
+
+def _value(name: str, **labels: str) -> float:
+    return REGISTRY.get_sample_value(name, labels) or 0
+
+
+@pytest.fixture
+def db_pool() -> Mock:
+    return Mock(
+        size=Mock(return_value=5),
+        checkedout=Mock(return_value=2),
+        checkedin=Mock(return_value=3),
+        overflow=Mock(return_value=-3)
+    )
+
+
+@pytest.fixture
+def redis_pool() -> Mock:
+    return Mock(stats=Mock(return_value=REDIS_POOL_STATS))
+
+
+@pytest.fixture
+def state(db_pool: Mock, redis_pool: Mock) -> MetricsState:
+    return MetricsState(db_pool, redis_pool, sample_interval_in_seconds=5)
+
+
+def test_sample__set_pool_gauges(state: MetricsState):
+    state.sample()
+
+    assert _value('db_pool_size') == 5
+    assert _value('db_pool_connections', state='checked_out') == 2
+    assert _value('db_pool_connections', state='idle') == 3
+    assert _value('db_pool_connections', state='overflow') == 0
+    assert _value('redis_pool_size') == 64
+    assert _value('redis_pool_connections_in_use') == 3
+
+
+def test_sample__count_redis_pool_waits_once(
+    redis_pool: Mock,
+    state: MetricsState
+):
+    exhausted = _value('redis_pool_exhausted_total')
+    timeouts = _value('redis_pool_timeouts_total')
+
+    state.sample()
+    state.sample()
+    redis_pool.stats.return_value = replace(
+        REDIS_POOL_STATS,
+        exhausted=REDIS_POOL_STATS.exhausted + 2
+    )
+    state.sample()
+
+    assert _value('redis_pool_exhausted_total') == exhausted + 6
+    assert _value('redis_pool_timeouts_total') == timeouts + 1
+
+
+def test_sample__skip_redis_pool_counters_reset(
+    redis_pool: Mock,
+    state: MetricsState
+):
+    state.sample()
+    exhausted = _value('redis_pool_exhausted_total')
+    redis_pool.stats.return_value = replace(REDIS_POOL_STATS, exhausted=0)
+    state.sample()
+    redis_pool.stats.return_value = replace(REDIS_POOL_STATS, exhausted=1)
+    state.sample()
+
+    assert _value('redis_pool_exhausted_total') == exhausted + 1
+
+
+async def test_start__sample_until_shutdown(
+    mocker: MockerFixture,
+    state: MetricsState
+):
+    sample = mocker.patch.object(state, 'sample')
+
+    state.start()
+    await state.shutdown()
+
+    sample.assert_called_once_with()
+
+
+async def test_start__keep_sampling_after_error(
+    mocker: MockerFixture,
+    state: MetricsState
+):
+    sample = mocker.patch.object(
+        state,
+        'sample',
+        side_effect=[None, RuntimeError('Pool is closed.'), None]
+    )
+    state.sample_interval_in_seconds = 0
+
+    state.start()
+    for _ in range(3):
+        await asyncio.sleep(0)
+    await state.shutdown()
+
+    assert sample.call_count == 3
+
+
+async def test_run_tracked__count_task_by_result():
+    ok = _value('background_tasks_total', task='test', result='ok')
+    failed = _value('background_tasks_total', task='test', result='failed')
+    func = AsyncMock()
+
+    await run_tracked('test', func, 1, key='value')
+    func.side_effect = RuntimeError
+    with pytest.raises(RuntimeError):
+        await run_tracked('test', func)
+
+    func.assert_any_await(1, key='value')
+    assert _value('background_tasks_total', task='test', result='ok') == ok + 1
+    assert _value(
+        'background_tasks_total',
+        task='test',
+        result='failed'
+    ) == failed + 1
+    assert _value('background_tasks_in_progress', task='test') == 0
@@ -1,13 +1,11 @@
 from unittest.mock import Mock
 
 import pytest
-from authlib.integrations.starlette_client import (
-    OAuth,
-    StarletteOAuth2App
-)
+from authlib.integrations.starlette_client import StarletteOAuth2App
 from fastapi import Request
 from pytest_mock import MockerFixture
 
+from app.db.enums import OAuthBackend
 from app.services.oauth import OAuthAuthorizer
 
 
@@ -17,19 +15,19 @@ def request_() -> Mock:
 
 
 @pytest.fixture
-def oauth() -> Mock:
-    return Mock(OAuth)
+def clients() -> dict[OAuthBackend, Mock]:
+    return {backend: Mock(StarletteOAuth2App) for backend in OAuthBackend}
 
 
 @pytest.fixture
 def authorizer(
     set_ctx_backend: None,
     request_: Mock,
-    oauth: Mock
+    clients: dict[OAuthBackend, Mock]
 ) -> OAuthAuthorizer:
     return OAuthAuthorizer(
         request=request_,
-        oauth=oauth
+        clients=clients
     )
 
 
@@ -43,6 +41,14 @@ def client(
     )
 
 
+def test_client__return_client_of_ctx_backend(
+    backend: OAuthBackend,
+    authorizer: OAuthAuthorizer,
+    clients: dict[OAuthBackend, Mock]
+):
+    assert authorizer.client is clients[backend]
+
+
 async def test_get_oauth_user__cast_userinfo_to_specific_backend(
     mocker: MockerFixture,
     authorizer: OAuthAuthorizer
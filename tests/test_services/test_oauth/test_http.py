@@ -0,0 +1,110 @@
+import asyncio
+import json
+from collections.abc import AsyncGenerator
+from typing import Any
+
+import pytest
+from pytest_mock import MockerFixture
+
+from app.core.settings.dataclasses_ import OAuthHTTPSettings
+from app.db.enums import OAuthBackend
+from app.services.oauth import OAuthState
+from app.services.oauth.config import GOOGLE_CONFIG
+
+
+class MockProvider:
+    """ OpenID provider serving its metadata and key set over keep-alive. """
+
+    def __init__(self) -> None:
+        self.connections = 0
+        self.requests = 0
+        self.url = ''
+
+    async def handle(
+        self,
+        reader: asyncio.StreamReader,
+        writer: asyncio.StreamWriter
+    ) -> None:
+        self.connections += 1
+        try:
+            while True:
+                head = await reader.readuntil(b'\r\n\r\n')
+                self.requests += 1
+                path = head.split(b' ', 2)[1]
+                body = json.dumps(
+                    {'keys': []} if path == b'/jwks'
+                    else {'issuer': self.url, 'jwks_uri': f'{self.url}/jwks'}
+                ).encode()
+                writer.write(
+                    b'HTTP/1.1 200 OK\r\n'
+                    b'Content-Type: application/json\r\n'
+                    b'Content-Length: %d\r\n\r\n%s' % (len(body), body)
+                )
+                await writer.drain()
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+
+
+@pytest.fixture
+async def provider(
+    mocker: MockerFixture
+) -> AsyncGenerator[MockProvider, None]:
+    provider = MockProvider()
+    server = await asyncio.start_server(provider.handle, '127.0.0.1', 0)
+    port = server.sockets[0].getsockname()[1]
+    provider.url = f'http://127.0.0.1:{port}'
+    config: dict[str, Any] = {
+        **GOOGLE_CONFIG,
+        'server_metadata_url': f'{provider.url}/metadata'
+    }
+    mocker.patch(
+        'app.services.oauth.state.BACKENDS_CONFIG',
+        {OAuthBackend.GOOGLE: config}
+    )
+    async with server:
+        yield provider
+
+
+@pytest.fixture
+def http_settings() -> OAuthHTTPSettings:
+    return OAuthHTTPSettings(
+        http2=True,
+        timeout_in_seconds=5,
+        connect_timeout_in_seconds=1,
+        max_connections=4,
+        keepalive_expiry_in_seconds=60
+    )
+
+
+async def _request_provider(state: OAuthState) -> None:
+    client = state.clients[OAuthBackend.GOOGLE]
+    await client.load_server_metadata()
+    for _ in range(3):
+        await client.request_jwk_set()
+
+
+async def test_clients__reuse_connection_to_provider(
+    provider: MockProvider,
+    http_settings: OAuthHTTPSettings
+):
+    state = OAuthState({}, http_settings=http_settings)
+
+    await _request_provider(state)
+    await state.shutdown()
+
+    assert provider.requests == 4
+    assert provider.connections == 1
+
+
+async def test_clients__connect_per_request_without_http_settings(
+    provider: MockProvider
+):
+    state = OAuthState({})
+
+    await _request_provider(state)
+    await state.shutdown()
+
+    assert provider.requests == 4
+    assert provider.connections == 4
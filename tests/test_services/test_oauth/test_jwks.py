@@ -0,0 +1,155 @@
+import asyncio
+from collections.abc import AsyncGenerator
+from unittest.mock import (
+    AsyncMock,
+    Mock
+)
+
+import pytest
+from httpx import ConnectError
+from pytest_mock import MockerFixture
+
+from app.db.enums import OAuthBackend
+from app.services.oauth import OAuthState
+from app.services.oauth.jwks import (
+    FORCED_REFRESH_INTERVAL_IN_SECONDS,
+    JWKSCache,
+    JWKSet
+)
+
+
+NAME = 'google'
+TTL_IN_SECONDS = 60
+
+
+@pytest.fixture
+def fetch() -> AsyncMock:
+    return AsyncMock(return_value={'keys': [{'kid': '1'}]})
+
+
+@pytest.fixture
+async def cache(fetch: AsyncMock) -> AsyncGenerator[JWKSCache, None]:
+    cache = JWKSCache(TTL_IN_SECONDS)
+    cache.add(NAME, fetch)
+    yield cache
+    await cache.shutdown()
+
+
+@pytest.fixture
+async def state() -> AsyncGenerator[OAuthState, None]:
+    state = OAuthState({})
+    yield state
+    await state.shutdown()
+
+
+@pytest.fixture
+def monotonic(mocker: MockerFixture) -> Mock:
+    return mocker.patch(
+        'app.services.oauth.jwks.time.monotonic',
+        return_value=1000.0
+    )
+
+
+async def test_get__fetch_key_set_once(cache: JWKSCache, fetch: AsyncMock):
+    first = await cache.get(NAME)
+    second = await cache.get(NAME)
+
+    fetch.assert_awaited_once_with()
+    assert first is second is fetch.return_value
+
+
+async def test_get__fetch_key_set_once_for_concurrent_callers(
+    cache: JWKSCache,
+    fetch: AsyncMock
+):
+    await asyncio.gather(*(cache.get(NAME) for _ in range(5)))
+
+    fetch.assert_awaited_once_with()
+
+
+async def test_get__serve_expired_key_set_from_memory(
+    cache: JWKSCache,
+    fetch: AsyncMock,
+    monotonic: Mock
+):
+    await cache.get(NAME)
+    monotonic.return_value += TTL_IN_SECONDS * 10
+
+    await cache.get(NAME)
+
+    fetch.assert_awaited_once_with()
+
+
+async def test_get__force_refresh_of_old_enough_key_set(
+    cache: JWKSCache,
+    fetch: AsyncMock,
+    monotonic: Mock
+):
+    await cache.get(NAME)
+    monotonic.return_value += FORCED_REFRESH_INTERVAL_IN_SECONDS
+
+    await cache.get(NAME, force=True)
+
+    assert fetch.await_count == 2
+
+
+async def test_get__not_force_refresh_of_fresh_key_set(
+    cache: JWKSCache,
+    fetch: AsyncMock,
+    monotonic: Mock
+):
+    await cache.get(NAME)
+    monotonic.return_value += FORCED_REFRESH_INTERVAL_IN_SECONDS / 2
+
+    await cache.get(NAME, force=True)
+
+    fetch.assert_awaited_once_with()
+
+
+async def test_start__refresh_key_sets_in_background(
+    cache: JWKSCache,
+    fetch: AsyncMock
+):
+    cache.start()
+    await asyncio.sleep(0)
+    await cache.shutdown()
+
+    fetch.assert_awaited_once_with()
+    assert await cache.get(NAME) is fetch.return_value
+
+
+async def test_start__keep_key_set_if_refresh_fails(
+    cache: JWKSCache,
+    fetch: AsyncMock,
+    monotonic: Mock
+):
+    key_set = await cache.get(NAME)
+    monotonic.return_value += TTL_IN_SECONDS
+    fetch.side_effect = ConnectError('Unreachable')
+
+    cache.start()
+    await asyncio.sleep(0)
+    await cache.shutdown()
+
+    assert fetch.await_count == 2
+    assert await cache.get(NAME) is key_set
+
+
+async def test_oauth_client__take_key_set_from_cache(
+    mocker: MockerFixture,
+    state: OAuthState
+):
+    google = state.clients[OAuthBackend.GOOGLE]
+    key_set: JWKSet = {'keys': []}
+    request_jwk_set = mocker.patch.object(
+        google,
+        'request_jwk_set',
+        return_value=key_set
+    )
+    # The fetcher is bound at startup.
+    state.jwks_cache.add(OAuthBackend.GOOGLE.value, request_jwk_set)
+
+    assert await google.fetch_jwk_set() is key_set
+    assert await google.fetch_jwk_set() is key_set
+    request_jwk_set.assert_awaited_once_with()
+    assert state.clients[OAuthBackend.DISCORD].jwks_cache is None
@@ -4,7 +4,6 @@ import pytest
 from pytest_mock import MockerFixture
 
 from app.db.enums import OAuthBackend
-from app.db.errors import EntityDoesNotExistError
 from app.db.repos import OAuthConnectionsRepo
 from app.dtos.oauth import OAuthUser
 from app.schemas.user import (
@@ -107,22 +106,28 @@ async def test_login__raise_error_if_connection_does_not_exist(
     service: OAuthService,
     oauth_user: OAuthUser
 ):
-    repo.get_one_by_pk.side_effect = EntityDoesNotExistError
+    repo.get_connected_user.return_value = (None, True)
 
     with pytest.raises(OAuthConnectionDoesNotExistError):
         await service.login(oauth_user)
 
+    assert oauth_user.is_email_taken is True
+
 
 async def test_login__authenticate_user_from_db(
+    backend: OAuthBackend,
     repo: Mock,
     authenticator: Mock,
     service: OAuthService,
     oauth_user: OAuthUser
 ):
+    user = Mock()
+    repo.get_connected_user.return_value = (user, True)
+
     result = await service.login(oauth_user)
 
-    connection = repo.get_one_by_pk.return_value
-    authenticator.authenticate.assert_called_once_with(connection.user)
+    repo.get_connected_user.assert_called_once_with(oauth_user, backend)
+    authenticator.authenticate.assert_called_once_with(user)
     assert result is authenticator.authenticate.return_value
 
 
@@ -0,0 +1,125 @@
+import json
+import time
+from collections.abc import AsyncGenerator
+from pathlib import Path
+from unittest.mock import AsyncMock
+
+import pytest
+from httpx import ConnectError
+from pytest_mock import MockerFixture
+
+from app.db.enums import OAuthBackend
+from app.services.oauth import OAuthState
+from app.services.oauth.metadata import OAuthMetadataCache
+
+
+TTL_IN_SECONDS = 60
+
+
+@pytest.fixture
+def metadata_cache(tmp_path: Path) -> OAuthMetadataCache:
+    return OAuthMetadataCache(tmp_path / 'oauth.json', TTL_IN_SECONDS)
+
+
+@pytest.fixture
+async def state(
+    metadata_cache: OAuthMetadataCache
+) -> AsyncGenerator[OAuthState, None]:
+    state = OAuthState({}, metadata_cache)
+    yield state
+    await state.shutdown()
+
+
+@pytest.fixture
+def fetch(mocker: MockerFixture, state: OAuthState) -> AsyncMock:
+    metadata = {'issuer': 'https://accounts.google.com', '_loaded_at': time.time()}
+    return mocker.patch.object(
+        state.clients[OAuthBackend.GOOGLE],
+        'load_server_metadata',
+        return_value=metadata
+    )
+
+
+def test_call__return_client_per_backend(state: OAuthState):
+    clients = state()
+
+    assert set(clients) == set(OAuthBackend)
+    assert state() is clients
+
+
+async def test_load_metadata__fetch_and_store_metadata(
+    state: OAuthState,
+    metadata_cache: OAuthMetadataCache,
+    fetch: AsyncMock
+):
+    await state.load_metadata()
+
+    fetch.assert_awaited_once_with()
+    assert metadata_cache.load() == {
+        OAuthBackend.GOOGLE.value: fetch.return_value
+    }
+
+
+async def test_load_metadata__use_cached_metadata(
+    state: OAuthState,
+    metadata_cache: OAuthMetadataCache,
+    fetch: AsyncMock
+):
+    metadata = {'issuer': 'cached', '_loaded_at': time.time()}
+    metadata_cache.store({OAuthBackend.GOOGLE.value: metadata})
+
+    await state.load_metadata()
+
+    fetch.assert_not_called()
+    google = state.clients[OAuthBackend.GOOGLE]
+    assert google.server_metadata['issuer'] == 'cached'
+
+
+async def test_load_metadata__refetch_expired_metadata(
+    state: OAuthState,
+    metadata_cache: OAuthMetadataCache,
+    fetch: AsyncMock
+):
+    loaded_at = time.time() - TTL_IN_SECONDS - 1
+    metadata_cache.store({
+        OAuthBackend.GOOGLE.value: {'issuer': 'old', '_loaded_at': loaded_at}
+    })
+
+    await state.load_metadata()
+
+    fetch.assert_awaited_once_with()
+
+
+async def test_load_metadata__leave_fetch_to_first_request_on_error(
+    state: OAuthState,
+    metadata_cache: OAuthMetadataCache,
+    fetch: AsyncMock
+):
+    fetch.side_effect = ConnectError('Unreachable')
+
+    await state.load_metadata()
+
+    assert metadata_cache.load() == {}
+
+
+def test_metadata_cache_load__ignore_unreadable_file(
+    metadata_cache: OAuthMetadataCache
+):
+    metadata_cache.path.write_text('{')
+
+    assert metadata_cache.load() == {}
+
+
+def test_metadata_cache_load__return_empty_if_file_does_not_exist(
+    metadata_cache: OAuthMetadataCache
+):
+    assert not metadata_cache.path.exists()
+    assert metadata_cache.load() == {}
+
+
+def test_metadata_cache_store__write_json(metadata_cache: OAuthMetadataCache):
+    metadata = {'google': {'issuer': 'issuer', '_loaded_at': 1.0}}
+
+    metadata_cache.store(metadata)
+
+    assert json.loads(metadata_cache.path.read_text()) == metadata
@@ -0,0 +1,58 @@
+from passlib.hash import bcrypt
+from prometheus_client import REGISTRY
+
+from app.core.settings.dataclasses_ import PasswordSettings
+from app.services.password import (
+    PasswordState,
+    calibrate_bcrypt_rounds
+)
+
+
+def test_calibrate_bcrypt_rounds__return_rounds_in_bcrypt_bounds():
+    assert calibrate_bcrypt_rounds(1) == bcrypt.min_rounds
+    assert (
+        bcrypt.min_rounds
+        <= calibrate_bcrypt_rounds(250)
+        <= bcrypt.max_rounds
+    )
+
+
+def test_password_state__use_rounds_from_settings():
+    pwd_context = PasswordState(
+        PasswordSettings(hash_rounds=5, hash_target_time_in_ms=250)
+    )()
+
+    hashed_password = pwd_context.hash('password')
+
+    assert bcrypt.from_string(hashed_password).rounds == 5
+    assert not pwd_context.needs_update(hashed_password)
+
+
+def test_password_state__mark_hash_with_other_rounds_as_needing_update():
+    pwd_context = PasswordState(
+        PasswordSettings(hash_rounds=5, hash_target_time_in_ms=250)
+    )()
+
+    assert pwd_context.needs_update(bcrypt.using(rounds=4).hash('password'))
+    assert pwd_context.needs_update(bcrypt.using(rounds=6).hash('password'))
+
+
+def test_password_state__time_hashing_and_verification():
+    pwd_context = PasswordState(
+        PasswordSettings(hash_rounds=4, hash_target_time_in_ms=250)
+    )()
+    counts = {
+        operation: REGISTRY.get_sample_value(
+            'password_hash_duration_seconds_count',
+            {'operation': operation}
+        ) or 0
+        for operation in ('hash', 'verify')
+    }
+
+    assert pwd_context.verify('password', pwd_context.hash('password'))
+
+    for operation, count in counts.items():
+        assert REGISTRY.get_sample_value(
+            'password_hash_duration_seconds_count',
+            {'operation': operation}
+        ) == count + 1
@@ -0,0 +1,107 @@
+from unittest.mock import (
+    AsyncMock,
+    Mock
+)
+
+import pytest
+from redis import asyncio as aioredis
+from redis.exceptions import ConnectionError as RedisConnectionError
+
+from app.services.redis_ import RedisClientCache
+
+
+@pytest.fixture
+def redis() -> Mock:
+    return Mock(
+        aioredis.Redis,
+        mget=AsyncMock(side_effect=lambda keys: [b'value' for _ in keys])
+    )
+
+
+@pytest.fixture
+def cache(redis: Mock) -> RedisClientCache:
+    cache = RedisClientCache(
+        redis,
+        ['cached:'],
+        max_size=2,
+        ttl_in_seconds=60
+    )
+    cache.is_synced = True
+    return cache
+
+
+async def test_mget__read_redis_if_not_synced(
+    redis: Mock,
+    cache: RedisClientCache
+):
+    cache.is_synced = False
+
+    await cache.mget(['cached:key'])
+    await cache.mget(['cached:key'])
+
+    assert redis.mget.call_count == 2
+
+
+async def test_mget__serve_cached_keys_locally(
+    redis: Mock,
+    cache: RedisClientCache
+):
+    await cache.mget(['cached:key', 'other:key'])
+
+    values = await cache.mget(['cached:key', 'other:key'])
+
+    assert values == [b'value', b'value']
+    redis.mget.assert_called_with(['other:key'])
+    assert cache.info().hits == 1
+
+
+async def test_mget__skip_storing_if_invalidated_during_read(
+    redis: Mock,
+    cache: RedisClientCache
+):
+    async def mget(keys: list[str]) -> list[bytes]:
+        cache.invalidate(keys)
+        return [b'stale' for _ in keys]
+
+    redis.mget.side_effect = mget
+
+    await cache.mget(['cached:key'])
+
+    assert cache.info().size == 0
+
+
+async def test_mget__evict_least_recently_used_keys(
+    cache: RedisClientCache
+):
+    await cache.mget(['cached:1', 'cached:2'])
+    await cache.mget(['cached:1'])
+    await cache.mget(['cached:3'])
+
+    assert list(cache._entries) == ['cached:1', 'cached:3']
+
+
+async def test_invalidate__drop_everything_if_no_keys_given(
+    cache: RedisClientCache
+):
+    await cache.mget(['cached:1', 'cached:2'])
+
+    cache.invalidate()
+
+    assert cache.info().size == 0
+
+
+def test_handle__raise_error_on_resubscription(
+    cache: RedisClientCache
+):
+    with pytest.raises(RedisConnectionError):
+        cache._handle({'type': 'subscribe', 'data': 1})
+
+
+async def test_handle__invalidate_keys_from_message(
+    cache: RedisClientCache
+):
+    await cache.mget(['cached:1', 'cached:2'])
+
+    cache._handle({'type': 'message', 'data': [b'cached:1']})
+
+    assert list(cache._entries) == ['cached:2']
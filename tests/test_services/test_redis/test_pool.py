@@ -0,0 +1,86 @@
+import asyncio
+from typing import Any
+
+import pytest
+from redis.asyncio.connection import Connection
+from redis.exceptions import ConnectionError as RedisConnectionError
+
+from app.services.redis_ import InstrumentedConnectionPool
+
+
+class StubConnection(Connection):
+    async def connect(self) -> None:
+        pass
+
+    async def disconnect(self, *args: Any, **kwargs: Any) -> None:
+        pass
+
+    async def can_read_destructive(self, *args: Any, **kwargs: Any) -> bool:
+        return False
+
+    def is_connected(self) -> bool:
+        return True
+
+
+@pytest.fixture
+def pool() -> InstrumentedConnectionPool:
+    return InstrumentedConnectionPool(
+        connection_class=StubConnection,
+        max_connections=1,
+        timeout=0.05
+    )
+
+
+async def test_get_connection__count_acquisitions_and_hold_time(
+    pool: InstrumentedConnectionPool
+):
+    connection = await pool.get_connection('GET')
+    await pool.release(connection)
+
+    stats = pool.stats()
+
+    assert stats.acquired == 1
+    assert stats.exhausted == 0
+    assert stats.in_use == 0
+    assert stats.hold_time_in_seconds > 0
+
+
+async def test_get_connection__count_waits_on_exhausted_pool(
+    pool: InstrumentedConnectionPool
+):
+    connection = await pool.get_connection('GET')
+    asyncio.get_running_loop().call_later(
+        0.01,
+        asyncio.create_task,
+        pool.release(connection)
+    )
+
+    await pool.get_connection('GET')
+
+    stats = pool.stats()
+    assert stats.exhausted == 1
+    assert stats.timed_out == 0
+    assert stats.wait_time_in_seconds > 0
+
+
+async def test_get_connection__count_timeouts(
+    pool: InstrumentedConnectionPool
+):
+    await pool.get_connection('GET')
+
+    with pytest.raises(RedisConnectionError):
+        await pool.get_connection('GET')
+
+    stats = pool.stats()
+    assert stats.exhausted == 1
+    assert stats.timed_out == 1
+    assert stats.in_use == 1
+
+
+async def test_get_connection__leave_pubsub_out_of_latency(
+    pool: InstrumentedConnectionPool
+):
+    connection = await pool.get_connection('pubsub')
+    await pool.release(connection)
+
+    assert pool.stats().acquired == 0
@@ -7,16 +7,23 @@ import pytest
 from redis import asyncio as aioredis
 
 from app.core.settings import AppSettings
-from app.services.verification import VerificationService
+from app.services.verification import (
+    CONSUME_SCRIPT,
+    ISSUE_SCRIPT,
+    VerificationService
+)
 
 
 @pytest.fixture
-def redis() -> Mock:
+def script() -> AsyncMock:
+    return AsyncMock()
+
+
+@pytest.fixture
+def redis(script: AsyncMock) -> Mock:
     return Mock(
         aioredis.Redis,
-        get=AsyncMock(),
-        set=AsyncMock(),
-        delete=AsyncMock()
+        register_script=Mock(return_value=script)
     )
 
 
@@ -24,7 +31,9 @@ def redis() -> Mock:
 def settings() -> Mock:
     return Mock(
         AppSettings,
-        verification_code_expire_in_seconds=100
+        verification_code_expire_in_seconds=100,
+        verification_code_max_attempts=3,
+        verification_send_cooldown_in_seconds=60
     )
 
 
@@ -39,86 +48,112 @@ def service(
     )
 
 
-async def test_get__return_code_if_do_exist(
+async def test_get__return_issued_code(
     redis: Mock,
+    script: AsyncMock,
     service: VerificationService
 ):
-    email = 'user@gmail.com'
-    redis.get.return_value = code = service.generate_code()
+    script.return_value = str(code := service.generate_code()).encode()
 
-    result = await service.get(email)
+    result = await service.get('user@gmail.com')
 
-    redis.get.assert_called_once_with(service.format_key(email))
+    redis.register_script.assert_called_once_with(ISSUE_SCRIPT)
     assert result == service.format_code(code)
 
 
-async def test_get__create_code_if_does_not_exist(
-    redis: Mock,
+async def test_get__propose_new_code(
+    settings: Mock,
+    script: AsyncMock,
+    service: VerificationService
+):
+    email = 'user@gmail.com'
+    script.return_value = b'1'
+
+    await service.get(email)
+
+    script.assert_called_once()
+    keys = script.call_args.kwargs['keys']
+    code, ex = script.call_args.kwargs['args']
+    assert keys == [service.format_key(email)]
+    assert code in range(1, 10 ** 6)
+    assert ex == settings.verification_code_expire_in_seconds
+
+
+async def test_get_to_send__hold_cooldown(
     settings: Mock,
+    script: AsyncMock,
     service: VerificationService
 ):
-    redis.get.return_value = None
     email = 'user@gmail.com'
+    script.return_value = str(code := service.generate_code()).encode()
 
-    result = await service.get(email)
+    result = await service.get_to_send(email)
 
-    redis.set.assert_called_once_with(
+    keys = script.call_args.kwargs['keys']
+    args = script.call_args.kwargs['args']
+    assert keys == [
         service.format_key(email),
-        int(result),
-        settings.verification_code_expire_in_seconds
-    )
+        service.format_cooldown_key(email)
+    ]
+    assert args[2] == settings.verification_send_cooldown_in_seconds
+    assert result == service.format_code(code)
 
 
-async def test_verify__return_false_if_code_does_not_exist(
-    redis: Mock,
+async def test_get_to_send__return_none_during_cooldown(
+    script: AsyncMock,
     service: VerificationService
 ):
-    redis.get.return_value = None
+    script.return_value = None
 
-    result = await service.verify(
-        'user@gmail.com',
-        service.generate_code()
-    )
+    result = await service.get_to_send('user@gmail.com')
 
-    assert not result
+    assert result is None
 
 
-async def test_verify__return_false_if_code_is_incorrect(
-    redis: Mock,
+async def test_get_to_send__skip_cooldown_if_disabled(
+    settings: Mock,
+    script: AsyncMock,
     service: VerificationService
 ):
-    redis.get.return_value = code = service.generate_code()
-    incorrect_code = code + 1
-    assert incorrect_code != code
+    settings.verification_send_cooldown_in_seconds = 0
+    email = 'user@gmail.com'
+    script.return_value = b'1'
 
-    result = await service.verify(
-        'user@gmail.com',
-        incorrect_code
-    )
+    result = await service.get_to_send(email)
 
-    assert not result
+    assert script.call_args.kwargs['keys'] == [service.format_key(email)]
+    assert result == service.format_code(1)
 
 
-async def test_verify__return_true_on_success(
-    redis: Mock,
+async def test_verify__return_false_if_code_is_not_consumed(
+    script: AsyncMock,
     service: VerificationService
 ):
-    redis.get.return_value = code = service.generate_code()
+    script.return_value = 0
 
     result = await service.verify(
         'user@gmail.com',
-        code
+        service.generate_code()
     )
 
-    assert result
+    assert not result
 
 
-async def test_delete__delete_code(
+async def test_verify__return_true_if_code_is_consumed(
     redis: Mock,
+    settings: Mock,
+    script: AsyncMock,
     service: VerificationService
 ):
     email = 'user@gmail.com'
+    code = service.generate_code()
+    script.return_value = 1
 
-    await service.delete(email)
+    result = await service.verify(email, code)
 
-    redis.delete.assert_called_once_with(service.format_key(email))
+    redis.register_script.assert_called_once_with(CONSUME_SCRIPT)
+    script.assert_called_once_with(
+        keys=[service.format_key(email)],
+        args=[code, settings.verification_code_max_attempts]
+    )
+    assert result
@@ -0,0 +1,44 @@
+from typing import Any
+
+import pytest
+
+from app.utils.etag import (
+    is_etag_matched,
+    make_etag
+)
+
+
+ETAG = make_etag(1, '2022-01-02T03:04:05', 3)
+
+
+def test_make_etag__is_strong_and_stable():
+    assert ETAG.startswith('"') and ETAG.endswith('"')
+    assert ETAG == make_etag(1, '2022-01-02T03:04:05', 3)
+
+
+@pytest.mark.parametrize(
+    'parts',
+    [
+        (1, '2022-01-02T03:04:05', 4),
+        (1, '2022-01-02T03:04:06', 3),
+        (13, '2022-01-02T03:04:05', ''),
+    ]
+)
+def test_make_etag__differs_for_other_parts(parts: tuple[Any, ...]):
+    assert make_etag(*parts) != ETAG
+
+
+@pytest.mark.parametrize(
+    'if_none_match, is_matched',
+    [
+        (ETAG, True),
+        (f'"other", {ETAG}', True),
+        (f'W/{ETAG}', True),
+        ('*', True),
+        ('"other"', False),
+        ('', False),
+        (None, False)
+    ]
+)
+def test_is_etag_matched(if_none_match: str | None, is_matched: bool):
+    assert is_etag_matched(if_none_match, ETAG) is is_matched
@@ -0,0 +1,61 @@
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from app.utils.prometheus_ import (
+    MULTIPROCESS_DIR_ENV,
+    prepare_multiprocess_dir
+)
+
+
+ROOT_DIR = Path(__file__).parents[2]
+
+IMPORT_APP_SCRIPT = """
+from app.utils.prometheus_ import prepare_multiprocess_dir
+
+prepare_multiprocess_dir()
+
+import app.builder
+"""
+
+
+@pytest.fixture
+def multiprocess_dir(
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: Path
+) -> Path:
+    path = tmp_path / 'prometheus'
+    monkeypatch.setenv(MULTIPROCESS_DIR_ENV, str(path))
+    return path
+
+
+def test_prepare_multiprocess_dir__create_dir(multiprocess_dir: Path):
+    prepare_multiprocess_dir()
+
+    assert multiprocess_dir.is_dir()
+
+
+def test_prepare_multiprocess_dir__wipe_values_of_previous_run(
+    multiprocess_dir: Path
+):
+    multiprocess_dir.mkdir()
+    (multiprocess_dir / 'counter_1.db').touch()
+
+    prepare_multiprocess_dir()
+
+    assert not any(multiprocess_dir.iterdir())
+
+
+def test_prepare_multiprocess_dir__let_app_be_imported(multiprocess_dir: Path):
+    # prometheus_client reads the directory on import, so a new process.
+    result = subprocess.run(
+        [sys.executable, '-c', IMPORT_APP_SCRIPT],
+        cwd=ROOT_DIR,
+        capture_output=True,
+        text=True
+    )
+
+    assert result.returncode == 0, result.stderr
+    assert any(multiprocess_dir.glob('*.db'))
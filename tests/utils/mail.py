@@ -1,11 +1,11 @@
-from email.mime.multipart import MIMEMultipart
+from email.message import Message
 
 
 __all__ = ['check_mail_body_contains']
 
 
 def check_mail_body_contains(
-    mail: MIMEMultipart,
+    mail: Message,
     needle: str
 ) -> bool:
     if mail.is_multipart():
@@ -17,7 +17,7 @@ def check_mail_body_contains(
 
 
 def _check_payload_contains(
-    payload: MIMEMultipart,
+    payload: Message,
     needle: str
 ) -> bool:
     normalized_needle = needle.casefold()